@@ -1,9 +1,32 @@
 """Configuration loading for cc_director."""
 
+import functools
 import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional
+
+
+_TRUTHY = frozenset({"true", "1", "yes", "on"})
+
+
+def _to_bool(value: Any) -> bool:
+    """Convert a config value to bool, accepting "true"/"1"/"yes"/"on" strings."""
+    return value.lower() in _TRUTHY if isinstance(value, str) else bool(value)
+
+
+# (attribute, environment variable, default, caster) for each setting
+_SETTINGS: tuple[tuple[str, str, Any, Callable[[Any], Any]], ...] = (
+    ("db_path", "CC_DIRECTOR_DB", "./cc_director.db", str),
+    ("log_dir", "CC_DIRECTOR_LOG_DIR", "./logs", str),
+    ("log_level", "CC_DIRECTOR_LOG_LEVEL", "INFO", str),
+    ("check_interval", "CC_DIRECTOR_CHECK_INTERVAL", 60, int),
+    ("shutdown_timeout", "CC_DIRECTOR_SHUTDOWN_TIMEOUT", 30, int),
+    ("gateway_enabled", "CC_DIRECTOR_GATEWAY_ENABLED", False, _to_bool),
+    ("gateway_host", "CC_DIRECTOR_GATEWAY_HOST", "0.0.0.0", str),
+    ("gateway_port", "CC_DIRECTOR_GATEWAY_PORT", 6060, int),
+    ("max_concurrent_jobs", "CC_DIRECTOR_MAX_CONCURRENT_JOBS", 0, int),
+)
 
 
 @dataclass
@@ -18,6 +41,8 @@ class Config:
     gateway_enabled: bool
     gateway_host: str
     gateway_port: int
+    # Most jobs running at once; 0 scales with the available CPUs
+    max_concurrent_jobs: int = 0
 
     @classmethod
     def load(cls, config_file: Optional[str] = None) -> "Config":
@@ -32,70 +57,25 @@ class Config:
         Returns:
             Config instance with loaded values
         """
-        # Defaults
-        defaults = {
-            "db_path": "./cc_director.db",
-            "log_dir": "./logs",
-            "log_level": "INFO",
-            "check_interval": 60,
-            "shutdown_timeout": 30,
-            "gateway_enabled": False,
-            "gateway_host": "0.0.0.0",
-            "gateway_port": 6060,
-        }
-
-        # Load from config file if provided
+        # Load from config file if provided; unchanged files are parsed once
         file_config = {}
-        if config_file and Path(config_file).exists():
-            file_config = cls._parse_config_file(config_file)
-
-        # Environment variables override file config
-        db_path = os.environ.get(
-            "CC_DIRECTOR_DB",
-            file_config.get("db_path", defaults["db_path"])
-        )
-        log_dir = os.environ.get(
-            "CC_DIRECTOR_LOG_DIR",
-            file_config.get("log_dir", defaults["log_dir"])
-        )
-        log_level = os.environ.get(
-            "CC_DIRECTOR_LOG_LEVEL",
-            file_config.get("log_level", defaults["log_level"])
-        )
-        check_interval = int(os.environ.get(
-            "CC_DIRECTOR_CHECK_INTERVAL",
-            file_config.get("check_interval", defaults["check_interval"])
-        ))
-        shutdown_timeout = int(os.environ.get(
-            "CC_DIRECTOR_SHUTDOWN_TIMEOUT",
-            file_config.get("shutdown_timeout", defaults["shutdown_timeout"])
-        ))
-        gateway_enabled = os.environ.get(
-            "CC_DIRECTOR_GATEWAY_ENABLED",
-            file_config.get("gateway_enabled", defaults["gateway_enabled"])
-        )
-        # Handle string "true"/"false" from env vars
-        if isinstance(gateway_enabled, str):
-            gateway_enabled = gateway_enabled.lower() in ("true", "1", "yes")
-        gateway_host = os.environ.get(
-            "CC_DIRECTOR_GATEWAY_HOST",
-            file_config.get("gateway_host", defaults["gateway_host"])
-        )
-        gateway_port = int(os.environ.get(
-            "CC_DIRECTOR_GATEWAY_PORT",
-            file_config.get("gateway_port", defaults["gateway_port"])
-        ))
-
-        return cls(
-            db_path=db_path,
-            log_dir=log_dir,
-            log_level=log_level,
-            check_interval=check_interval,
-            shutdown_timeout=shutdown_timeout,
-            gateway_enabled=gateway_enabled,
-            gateway_host=gateway_host,
-            gateway_port=gateway_port,
-        )
+        if config_file:
+            try:
+                stat = os.stat(config_file)
+            except OSError:
+                stat = None
+            if stat is not None:
+                file_config = _parse_config_file_cached(
+                    os.path.realpath(config_file), stat.st_mtime_ns, stat.st_size
+                )
+
+        # Environment variables override file config, which overrides defaults
+        getenv = os.environ.get
+        values = {
+            attr: caster(getenv(env_key, file_config.get(attr, default)))
+            for attr, env_key, default, caster in _SETTINGS
+        }
+        return cls(**values)
 
     @staticmethod
     def _parse_config_file(path: str) -> dict:
@@ -109,22 +89,42 @@ class Config:
             Dictionary of config values
         """
         config = {}
-        with open(path, "r") as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                if "=" in line:
-                    key, value = line.split("=", 1)
-                    config[key.strip().lower()] = value.strip()
+        for line in Path(path).read_bytes().splitlines():
+            line = line.strip()
+            if not line or line[:1] == b"#":
+                continue
+            key, sep, value = line.partition(b"=")
+            if sep:
+                config[key.strip().lower().decode("utf-8")] = value.strip().decode("utf-8")
         return config
 
     def get_db_path(self) -> Path:
         """Get absolute path to database file."""
         return Path(self.db_path).resolve()
 
+    def get_max_concurrent_jobs(self) -> int:
+        """Get the job concurrency limit, defaulting to twice the usable CPUs (at most 32)."""
+        if self.max_concurrent_jobs > 0:
+            return self.max_concurrent_jobs
+        if hasattr(os, "sched_getaffinity"):
+            cpus = len(os.sched_getaffinity(0))
+        else:
+            cpus = os.cpu_count() or 1
+        return min(32, cpus * 2)
+
     def get_log_dir(self) -> Path:
         """Get absolute path to log directory."""
         path = Path(self.log_dir).resolve()
         path.mkdir(parents=True, exist_ok=True)
         return path
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_config_file_cached(path: str, mtime_ns: int, size: int) -> dict:
+    """
+    Parse a config file once per (path, mtime, size).
+
+    The modification time and size are only part of the cache key, so an
+    edited file is parsed again. Callers must not modify the returned dict.
+    """
+    return Config._parse_config_file(path)
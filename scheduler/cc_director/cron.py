@@ -1,11 +1,188 @@
 """Cron expression parsing and next run calculation."""
 
-from datetime import datetime
-from typing import Optional
+import copy
+from calendar import monthrange
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Iterator, Optional
 
 from croniter import croniter
 
 
+@lru_cache(maxsize=1024)
+def _parse_cron(expression: str) -> croniter:
+    """
+    Parse and expand a cron expression once.
+
+    The returned object is a shared template and must not be advanced
+    directly; use _cron_from() to get a positioned copy.
+
+    Raises:
+        ValueError, KeyError: If the expression is invalid
+    """
+    return croniter(expression)
+
+
+def _cron_from(expression: str, from_time: datetime) -> croniter:
+    """Get a croniter positioned at from_time, reusing the cached expansion."""
+    cron = copy.copy(_parse_cron(expression))
+    cron.set_current(from_time)
+    return cron
+
+
+# A schedule that only fires on Feb 29 of a given weekday recurs within 28
+# years; give up on expressions that never match (e.g. "0 0 31 2 *")
+_MAX_SEARCH_MONTHS = 12 * 28
+
+# Bit masks with every value of a field set
+_ALL_MINUTES = (1 << 60) - 1
+_ALL_HOURS = (1 << 24) - 1
+_ALL_DAYS = ((1 << 32) - 1) & ~1  # 1-31
+_ALL_MONTHS = ((1 << 13) - 1) & ~1  # 1-12
+_ALL_WEEKDAYS = (1 << 7) - 1  # 0-6, Sunday = 0
+
+
+def _next_bit(mask: int, start: int) -> Optional[int]:
+    """Index of the lowest set bit of mask at or above start, or None."""
+    rest = mask >> start
+    if not rest:
+        return None
+    # rest & -rest isolates the lowest set bit
+    return start + (rest & -rest).bit_length() - 1
+
+
+def _field_mask(values: list, all_mask: int) -> int:
+    """Bit mask of an expanded croniter field ('*' sets every bit)."""
+    if values == ["*"]:
+        return all_mask
+    mask = 0
+    for value in values:
+        mask |= 1 << value
+    return mask & all_mask
+
+
+def _weekday_day_masks(weekdays: int) -> tuple[int, ...]:
+    """
+    Days of the month (bits 1-31) falling on the given weekdays.
+
+    Indexed by the weekday of the 1st (Sunday = 0).
+    """
+    masks = []
+    for first_weekday in range(7):
+        mask = 0
+        for day in range(1, 32):
+            if weekdays >> ((first_weekday + day - 1) % 7) & 1:
+                mask |= 1 << day
+        masks.append(mask)
+    return tuple(masks)
+
+
+@dataclass(frozen=True)
+class CompiledCron:
+    """A five-field cron expression reduced to one bit mask per field."""
+    minutes: int
+    hours: int
+    days: int
+    months: int
+    # Day-of-week field as day-of-month masks, by weekday of the 1st
+    weekday_days: tuple[int, ...]
+    # Both day fields restricted: a day matches if either does (cron rule)
+    day_or_weekday: bool
+
+    def day_mask(self, year: int, month: int) -> int:
+        """Matching days of a month (bits 1-31), ignoring the month field."""
+        first_weekday = date(year, month, 1).isoweekday() % 7
+        weekday_days = self.weekday_days[first_weekday]
+        if self.day_or_weekday:
+            mask = self.days | weekday_days
+        else:
+            mask = self.days & weekday_days
+        # Drop days past the end of the month
+        return mask & ((1 << (monthrange(year, month)[1] + 1)) - 1)
+
+    def next_after(self, from_time: datetime) -> datetime:
+        """
+        Get the first matching minute strictly after from_time.
+
+        Each field jumps straight to its next set bit; running past the end
+        of a field moves the next larger field on and resets the smaller ones.
+
+        Raises:
+            ValueError: If the expression never matches
+        """
+        start = from_time.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        year, month = start.year, start.month
+        day, hour, minute = start.day, start.hour, start.minute
+        first_hour = _next_bit(self.hours, 0)
+        first_minute = _next_bit(self.minutes, 0)
+
+        for _ in range(_MAX_SEARCH_MONTHS):
+            run_month = _next_bit(self.months, month)
+            if run_month is None:
+                year, month, day, hour, minute = year + 1, 1, 1, 0, 0
+                continue
+            if run_month != month:
+                month, day, hour, minute = run_month, 1, 0, 0
+
+            run_day = _next_bit(self.day_mask(year, month), day)
+            if run_day is not None:
+                if run_day != day:
+                    hour, minute = 0, 0
+                run_hour = _next_bit(self.hours, hour)
+                run_minute = first_minute
+                if run_hour == hour:
+                    run_minute = _next_bit(self.minutes, minute)
+                    if run_minute is None:
+                        run_hour = _next_bit(self.hours, hour + 1)
+                        run_minute = first_minute
+                if run_hour is None:
+                    # Past the day's last run; take the next matching day
+                    run_day = _next_bit(self.day_mask(year, month), run_day + 1)
+                    run_hour = first_hour
+                if run_day is not None:
+                    return datetime(
+                        year, month, run_day, run_hour, run_minute,
+                        tzinfo=from_time.tzinfo,
+                    )
+
+            # No run left this month
+            if month == 12:
+                year, month = year + 1, 1
+            else:
+                month += 1
+            day, hour, minute = 1, 0, 0
+
+        raise ValueError("expression does not match any date")
+
+
+@lru_cache(maxsize=1024)
+def compile_cron(expression: str) -> Optional[CompiledCron]:
+    """
+    Compile a five-field cron expression into bit masks once.
+
+    Returns:
+        The compiled expression, or None if it uses features the masks
+        cannot express (seconds/year fields, L, #); croniter handles those
+
+    Raises:
+        ValueError, KeyError: If the expression is invalid
+    """
+    cron = _parse_cron(expression)
+    expanded = cron.expanded
+    if len(expanded) != 5 or cron.nth_weekday_of_month or "l" in expanded[2]:
+        return None
+    minutes, hours, days, months, weekdays = expanded
+    return CompiledCron(
+        minutes=_field_mask(minutes, _ALL_MINUTES),
+        hours=_field_mask(hours, _ALL_HOURS),
+        days=_field_mask(days, _ALL_DAYS),
+        months=_field_mask(months, _ALL_MONTHS),
+        weekday_days=_weekday_day_masks(_field_mask(weekdays, _ALL_WEEKDAYS)),
+        day_or_weekday=days != ["*"] and weekdays != ["*"],
+    )
+
+
 def validate_cron(expression: str) -> bool:
     """
     Validate a cron expression.
@@ -17,7 +194,7 @@ def validate_cron(expression: str) -> bool:
         True if valid, False otherwise
     """
     try:
-        croniter(expression)
+        _parse_cron(expression)
         return True
     except (ValueError, KeyError):
         return False
@@ -41,7 +218,10 @@ def calculate_next_run(expression: str, from_time: Optional[datetime] = None) ->
         from_time = datetime.now()
 
     try:
-        cron = croniter(expression, from_time)
+        compiled = compile_cron(expression)
+        if compiled is not None:
+            return compiled.next_after(from_time)
+        cron = _cron_from(expression, from_time)
         return cron.get_next(datetime)
     except (ValueError, KeyError) as e:
         raise ValueError(f"Invalid cron expression '{expression}': {e}") from e
@@ -61,10 +241,53 @@ def get_previous_run(expression: str, from_time: Optional[datetime] = None) -> d
     if from_time is None:
         from_time = datetime.now()
 
-    cron = croniter(expression, from_time)
+    cron = _cron_from(expression, from_time)
     return cron.get_prev(datetime)
 
 
+def iter_runs(expression: str, from_time: Optional[datetime] = None) -> Iterator[datetime]:
+    """
+    Iterate over upcoming run times for a cron expression.
+
+    The schedule is compiled once for the whole series, so projecting
+    many runs does not rebuild it for each one.
+
+    Args:
+        expression: Cron expression (5 fields)
+        from_time: Base time to calculate from (defaults to now)
+
+    Yields:
+        Successive run datetimes after from_time
+
+    Raises:
+        ValueError: If the cron expression is invalid
+    """
+    if from_time is None:
+        from_time = datetime.now()
+
+    try:
+        compiled = compile_cron(expression)
+        cron = _cron_from(expression, from_time) if compiled is None else None
+    except (ValueError, KeyError) as e:
+        raise ValueError(f"Invalid cron expression '{expression}': {e}") from e
+
+    if compiled is not None:
+        run = from_time
+        while True:
+            run = compiled.next_after(run)
+            yield run
+
+    while True:
+        yield cron.get_next(datetime)
+
+
+# Expressions with a fixed description, checked before any parsing
+_EXACT_DESCRIPTIONS = {
+    "* * * * *": "Every minute",
+}
+
+
+@lru_cache(maxsize=1024)
 def describe_cron(expression: str) -> str:
     """
     Get a human-readable description of when a cron job runs.
@@ -75,6 +298,10 @@ def describe_cron(expression: str) -> str:
     Returns:
         Human-readable description
     """
+    exact = _EXACT_DESCRIPTIONS.get(expression)
+    if exact is not None:
+        return exact
+
     parts = expression.split()
     if len(parts) != 5:
         return "Invalid expression"
@@ -82,16 +309,17 @@ def describe_cron(expression: str) -> str:
     minute, hour, day, month, weekday = parts
 
     # Handle common patterns
-    if expression == "* * * * *":
-        return "Every minute"
     if minute.startswith("*/"):
-        interval = minute[2:]
-        return f"Every {interval} minutes"
-    if hour == "*" and minute != "*":
-        return f"Every hour at minute {minute}"
-    if weekday == "1-5" and hour != "*" and minute != "*":
-        return f"Weekdays at {hour}:{minute.zfill(2)}"
-    if weekday == "*" and day == "*" and month == "*":
+        return f"Every {minute[2:]} minutes"
+    if hour == "*":
+        if minute != "*":
+            return f"Every hour at minute {minute}"
+    elif minute != "*":
+        if weekday == "1-5":
+            return f"Weekdays at {hour}:{minute.zfill(2)}"
+        if weekday == "*" and day == "*" and month == "*":
+            return f"Daily at {hour}:{minute.zfill(2)}"
+    elif weekday == "*" and day == "*" and month == "*":
         return f"Daily at {hour}:{minute.zfill(2)}"
 
     return expression  # Fall back to raw expression
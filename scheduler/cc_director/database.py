@@ -1,10 +1,13 @@
 """SQLite database operations for cc_director."""
 
+import heapq
 import sqlite3
+import threading
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 
 def _parse_datetime(value: str | bytes | datetime | None) -> datetime | None:
@@ -16,6 +19,11 @@ def _parse_datetime(value: str | bytes | datetime | None) -> datetime | None:
     if isinstance(value, bytes):
         value = value.decode("utf-8")
     if isinstance(value, str):
+        # Fast path: fromisoformat handles both the space and "T" separators
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
         # Handle various SQLite datetime formats
         for fmt in [
             "%Y-%m-%d %H:%M:%S.%f",
@@ -31,7 +39,28 @@ def _parse_datetime(value: str | bytes | datetime | None) -> datetime | None:
     return None
 
 
-@dataclass
+def _to_timestamp(value: Optional[datetime]) -> Optional[int]:
+    """Convert a naive local datetime to integer epoch seconds for storage."""
+    if value is None:
+        return None
+    return int(value.timestamp())
+
+
+def _from_timestamp(value: Optional[int]) -> Optional[datetime]:
+    """Convert stored epoch seconds back to a naive local datetime."""
+    if value is None:
+        return None
+    return datetime.fromtimestamp(value)
+
+
+def _split_tags(tags: Optional[str]) -> list[str]:
+    """Split a comma-separated tags string into distinct, trimmed tags."""
+    if not tags:
+        return []
+    return list(dict.fromkeys(t.strip() for t in tags.split(",") if t.strip()))
+
+
+@dataclass(slots=True)
 class Job:
     """Represents a scheduled job."""
     id: Optional[int]
@@ -47,7 +76,7 @@ class Job:
     next_run: Optional[datetime]
 
 
-@dataclass
+@dataclass(slots=True)
 class Run:
     """Represents a job execution record."""
     id: Optional[int]
@@ -60,7 +89,14 @@ class Run:
     stderr: Optional[str]
     timed_out: bool
     duration_seconds: Optional[float]
+    # Files holding the full output; stdout/stderr keep only its tail
+    stdout_path: Optional[str] = None
+    stderr_path: Optional[str] = None
+
 
+# Stored in PRAGMA user_version once create_tables() has brought a database
+# up to date; bump it when SCHEMA or the migrations change
+SCHEMA_VERSION = 3
 
 SCHEMA = """
 CREATE TABLE IF NOT EXISTS jobs (
@@ -74,7 +110,8 @@ CREATE TABLE IF NOT EXISTS jobs (
     tags TEXT,
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
     updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-    next_run DATETIME
+    next_run DATETIME,
+    next_run_ts INTEGER
 );
 
 CREATE TABLE IF NOT EXISTS runs (
@@ -88,13 +125,116 @@ CREATE TABLE IF NOT EXISTS runs (
     stderr TEXT,
     timed_out INTEGER DEFAULT 0,
     duration_seconds REAL,
+    stdout_path TEXT,
+    stderr_path TEXT,
+    FOREIGN KEY (job_id) REFERENCES jobs(id)
+);
+
+CREATE TABLE IF NOT EXISTS job_tags (
+    job_id INTEGER NOT NULL,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (job_id, tag),
     FOREIGN KEY (job_id) REFERENCES jobs(id)
 );
 
 CREATE INDEX IF NOT EXISTS idx_runs_job_id ON runs(job_id);
 CREATE INDEX IF NOT EXISTS idx_runs_started_at ON runs(started_at);
-CREATE INDEX IF NOT EXISTS idx_jobs_next_run ON jobs(next_run);
-CREATE INDEX IF NOT EXISTS idx_jobs_enabled ON jobs(enabled);
+CREATE INDEX IF NOT EXISTS idx_runs_jobname_started ON runs(job_name, started_at DESC);
+CREATE INDEX IF NOT EXISTS idx_runs_failed ON runs(started_at DESC)
+    WHERE exit_code != 0 OR exit_code IS NULL OR timed_out = 1;
+CREATE INDEX IF NOT EXISTS idx_job_tags_tag ON job_tags(tag);
+"""
+
+
+# Hot-path statements, kept as module constants so every call passes the
+# identical SQL text and hits the connection's prepared-statement cache
+_INSERT_JOB_SQL = """
+INSERT INTO jobs (name, cron, command, working_dir, enabled,
+                  timeout_seconds, tags, next_run, next_run_ts)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_UPDATE_JOB_SQL = """
+UPDATE jobs SET
+    cron = ?,
+    command = ?,
+    working_dir = ?,
+    enabled = ?,
+    timeout_seconds = ?,
+    tags = ?,
+    updated_at = CURRENT_TIMESTAMP,
+    next_run = ?,
+    next_run_ts = ?
+WHERE id = ?
+"""
+
+# RETURNING (SQLite 3.35+) hands back the generated columns of a write
+# without a follow-up SELECT
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+_SELECT_DUE_JOBS_SQL = """
+SELECT * FROM jobs
+WHERE enabled = 1 AND next_run_ts IS NOT NULL AND next_run_ts <= ?
+ORDER BY next_run_ts
+LIMIT ?
+"""
+
+_INSERT_RUN_SQL = """
+INSERT INTO runs (job_id, job_name, started_at, ended_at, exit_code,
+                  stdout, stderr, timed_out, duration_seconds,
+                  stdout_path, stderr_path)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_UPDATE_RUN_SQL = """
+UPDATE runs SET
+    ended_at = ?,
+    exit_code = ?,
+    stdout = ?,
+    stderr = ?,
+    timed_out = ?,
+    duration_seconds = ?,
+    stdout_path = ?,
+    stderr_path = ?
+WHERE id = ?
+"""
+
+# Every runs column except the output text, for listings that do not show
+# it; large outputs live in overflow pages that are then never read
+_RUN_SUMMARY_COLUMNS = """
+id, job_id, job_name, started_at, ended_at, exit_code,
+NULL AS stdout, NULL AS stderr, timed_out, duration_seconds,
+stdout_path, stderr_path
+"""
+
+_SELECT_LAST_RUN_SQL = f"""
+SELECT {_RUN_SUMMARY_COLUMNS} FROM runs WHERE job_name = ?
+ORDER BY started_at DESC LIMIT 1
+"""
+
+# Counts for the dashboard in one pass over idx_runs_started_at
+_RUN_STATS_SQL = """
+SELECT
+    COUNT(*) AS total,
+    COALESCE(SUM(exit_code = 0 AND NOT timed_out), 0) AS successful,
+    COALESCE(SUM(exit_code IS NOT NULL AND exit_code != 0), 0) AS failed,
+    COALESCE(SUM(timed_out), 0) AS timed_out
+FROM runs
+WHERE started_at >= ?
+"""
+
+_SELECT_JOB_BY_NAME_SQL = "SELECT * FROM jobs WHERE name = ?"
+_SELECT_JOB_BY_ID_SQL = "SELECT * FROM jobs WHERE id = ?"
+_UPDATE_NEXT_RUN_SQL = "UPDATE jobs SET next_run = ?, next_run_ts = ? WHERE id = ?"
+
+# Connection tuning applied on open: WAL lets readers proceed during writes,
+# and NORMAL sync skips the per-commit fsync while staying corruption-safe in WAL
+PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=268435456;
+PRAGMA cache_size=-20000;
 """
 
 
@@ -103,60 +243,148 @@ class Database:
 
     def __init__(self, db_path: str):
         self.db_path = Path(db_path)
-        self._connection: Optional[sqlite3.Connection] = None
+        # One connection per thread (sqlite3 connections must not be shared
+        # across threads); WAL lets them read concurrently with a writer
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._generation = 0
+        # In-memory min-heap of (next_run, job_id) for enabled jobs, see pop_due_jobs()
+        self._due_heap: list[tuple[datetime, int]] = []
+        self._due_lock = threading.Lock()
 
     def connect(self) -> sqlite3.Connection:
-        """Get or create database connection."""
-        if self._connection is None:
+        """Get or create the database connection for the calling thread."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.generation != self._generation:
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
-            self._connection = sqlite3.connect(
+            # check_same_thread=False only so close() can run from another
+            # thread; each connection is otherwise used by its own thread
+            conn = sqlite3.connect(
                 str(self.db_path),
-                detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES
+                cached_statements=256,
+                check_same_thread=False,
             )
-            self._connection.row_factory = sqlite3.Row
-        return self._connection
+            conn.row_factory = sqlite3.Row
+            conn.executescript(PRAGMAS)
+            with self._connections_lock:
+                self._connections.append(conn)
+                self._local.conn = conn
+                self._local.generation = self._generation
+                # PRAGMA data_version is per connection; see _sync_due_heap()
+                self._local.due_data_version = None
+        return conn
 
     def close(self) -> None:
-        """Close database connection."""
-        if self._connection is not None:
-            self._connection.close()
-            self._connection = None
+        """Close the connections of all threads."""
+        with self._connections_lock:
+            connections = self._connections
+            self._connections = []
+            # Threads still holding a closed connection reconnect on next use
+            self._generation += 1
+        for conn in connections:
+            conn.close()
+
+    @property
+    def _transaction_depth(self) -> int:
+        """Nesting depth of transaction() blocks on the calling thread."""
+        return getattr(self._local, "transaction_depth", 0)
+
+    @_transaction_depth.setter
+    def _transaction_depth(self, value: int) -> None:
+        self._local.transaction_depth = value
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Group several writes into a single commit.
+
+        CRUD methods called inside the block skip their own commit; the
+        whole block commits once on exit, or rolls back on an exception.
+        Blocks may be nested; only the outermost one commits.
+        """
+        conn = self.connect()
+        self._transaction_depth += 1
+        try:
+            yield conn
+        except BaseException:
+            self._transaction_depth -= 1
+            if self._transaction_depth == 0:
+                conn.rollback()
+            raise
+        self._transaction_depth -= 1
+        if self._transaction_depth == 0:
+            conn.commit()
 
     def create_tables(self) -> None:
         """Initialize database schema."""
         conn = self.connect()
         conn.executescript(SCHEMA)
+        self._migrate_next_run_ts(conn)
+        self._migrate_run_output_paths(conn)
+        self._backfill_job_tags(conn)
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
         conn.commit()
 
+    def schema_is_current(self) -> bool:
+        """Check whether create_tables() has already run for SCHEMA_VERSION."""
+        conn = self.connect()
+        return conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION
+
     # Job CRUD operations
 
     def add_job(self, job: Job) -> int:
-        """Add a new job. Returns the job ID."""
+        """
+        Add a new job. Returns the job ID.
+
+        The job's id, created_at and updated_at are filled in from the
+        inserted row.
+        """
         conn = self.connect()
-        cursor = conn.execute(
-            """
-            INSERT INTO jobs (name, cron, command, working_dir, enabled,
-                            timeout_seconds, tags, next_run)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                job.name,
-                job.cron,
-                job.command,
-                job.working_dir,
-                1 if job.enabled else 0,
-                job.timeout_seconds,
-                job.tags,
-                job.next_run,
-            ),
+        params = (
+            job.name,
+            job.cron,
+            job.command,
+            job.working_dir,
+            1 if job.enabled else 0,
+            job.timeout_seconds,
+            job.tags,
+            job.next_run,
+            _to_timestamp(job.next_run),
         )
-        conn.commit()
-        return cursor.lastrowid
+        if _HAS_RETURNING:
+            row = conn.execute(
+                _INSERT_JOB_SQL + "RETURNING id, created_at, updated_at", params
+            ).fetchall()[0]
+            job_id = row["id"]
+        else:
+            job_id = conn.execute(_INSERT_JOB_SQL, params).lastrowid
+            row = conn.execute(
+                "SELECT created_at, updated_at FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        self._set_job_tags(conn, job_id, job.tags)
+        self._commit(conn)
+
+        job.id = job_id
+        job.created_at = _parse_datetime(row["created_at"])
+        job.updated_at = _parse_datetime(row["updated_at"])
+        if job.enabled:
+            self._push_due(job_id, job.next_run)
+        return job_id
+
+    def add_jobs(self, jobs: list[Job]) -> list[int]:
+        """
+        Add several jobs with one commit. Returns the job IDs in input order.
+
+        If any insert fails (e.g. a duplicate name), none of the jobs are added.
+        """
+        with self.transaction():
+            return [self.add_job(job) for job in jobs]
 
     def get_job(self, name: str) -> Optional[Job]:
         """Get a job by name."""
         conn = self.connect()
-        cursor = conn.execute("SELECT * FROM jobs WHERE name = ?", (name,))
+        cursor = conn.execute(_SELECT_JOB_BY_NAME_SQL, (name,))
         row = cursor.fetchone()
         if row is None:
             return None
@@ -165,7 +393,7 @@ class Database:
     def get_job_by_id(self, job_id: int) -> Optional[Job]:
         """Get a job by ID."""
         conn = self.connect()
-        cursor = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,))
+        cursor = conn.execute(_SELECT_JOB_BY_ID_SQL, (job_id,))
         row = cursor.fetchone()
         if row is None:
             return None
@@ -174,54 +402,78 @@ class Database:
     def list_jobs(self, include_disabled: bool = False, tag: Optional[str] = None) -> list[Job]:
         """List all jobs, optionally filtering by enabled status and tag."""
         conn = self.connect()
-        query = "SELECT * FROM jobs WHERE 1=1"
-        params: list = []
-
-        if not include_disabled:
-            query += " AND enabled = 1"
+        where, params = self._job_filter(include_disabled, tag)
+        cursor = conn.execute(f"SELECT * FROM jobs WHERE {where} ORDER BY name", params)
+        return [self._row_to_job(row) for row in cursor.fetchall()]
 
-        if tag:
-            query += " AND tags LIKE ?"
-            params.append(f"%{tag}%")
+    def list_jobs_summary(
+        self, include_disabled: bool = False, tag: Optional[str] = None
+    ) -> list[tuple]:
+        """
+        List jobs as (id, name, cron, enabled, next_run, tags) tuples.
+
+        Same filtering and order as list_jobs(), but only the listed columns
+        are read and no Job objects are built.
+        """
+        where, params = self._job_filter(include_disabled, tag)
+        cursor = self.connect().cursor()
+        cursor.row_factory = None  # Plain tuples instead of sqlite3.Row
+        cursor.execute(
+            "SELECT id, name, cron, enabled, next_run_ts, tags "
+            f"FROM jobs WHERE {where} ORDER BY name",
+            params,
+        )
+        return [
+            (job_id, name, cron, bool(enabled), _from_timestamp(next_run_ts), tags)
+            for job_id, name, cron, enabled, next_run_ts, tags in cursor.fetchall()
+        ]
 
-        query += " ORDER BY name"
-        cursor = conn.execute(query, params)
-        return [self._row_to_job(row) for row in cursor.fetchall()]
+    def count_jobs(self, enabled: Optional[bool] = None) -> int:
+        """Count jobs, optionally only enabled (True) or disabled (False) ones."""
+        conn = self.connect()
+        if enabled is None:
+            return conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+        return conn.execute(
+            "SELECT COUNT(*) FROM jobs WHERE enabled = ?", (1 if enabled else 0,)
+        ).fetchone()[0]
 
     def update_job(self, job: Job) -> None:
-        """Update an existing job."""
+        """Update an existing job, refreshing its updated_at from the row."""
         conn = self.connect()
-        conn.execute(
-            """
-            UPDATE jobs SET
-                cron = ?,
-                command = ?,
-                working_dir = ?,
-                enabled = ?,
-                timeout_seconds = ?,
-                tags = ?,
-                updated_at = CURRENT_TIMESTAMP,
-                next_run = ?
-            WHERE id = ?
-            """,
-            (
-                job.cron,
-                job.command,
-                job.working_dir,
-                1 if job.enabled else 0,
-                job.timeout_seconds,
-                job.tags,
-                job.next_run,
-                job.id,
-            ),
+        params = (
+            job.cron,
+            job.command,
+            job.working_dir,
+            1 if job.enabled else 0,
+            job.timeout_seconds,
+            job.tags,
+            job.next_run,
+            _to_timestamp(job.next_run),
+            job.id,
         )
-        conn.commit()
+        if _HAS_RETURNING:
+            rows = conn.execute(_UPDATE_JOB_SQL + "RETURNING updated_at", params).fetchall()
+        else:
+            conn.execute(_UPDATE_JOB_SQL, params)
+            rows = conn.execute(
+                "SELECT updated_at FROM jobs WHERE id = ?", (job.id,)
+            ).fetchall()
+        self._set_job_tags(conn, job.id, job.tags)
+        self._commit(conn)
+        if rows:
+            job.updated_at = _parse_datetime(rows[0]["updated_at"])
+        if job.enabled:
+            self._push_due(job.id, job.next_run)
 
     def delete_job(self, name: str) -> bool:
         """Delete a job by name. Returns True if deleted."""
         conn = self.connect()
+        conn.execute(
+            "DELETE FROM job_tags WHERE job_id IN (SELECT id FROM jobs WHERE name = ?)",
+            (name,),
+        )
         cursor = conn.execute("DELETE FROM jobs WHERE name = ?", (name,))
-        conn.commit()
+        self._commit(conn)
         return cursor.rowcount > 0
 
     def set_job_enabled(self, name: str, enabled: bool) -> bool:
@@ -231,83 +483,162 @@ class Database:
             "UPDATE jobs SET enabled = ?, updated_at = CURRENT_TIMESTAMP WHERE name = ?",
             (1 if enabled else 0, name),
         )
-        conn.commit()
+        self._commit(conn)
         return cursor.rowcount > 0
 
     def update_next_run(self, job_id: int, next_run: datetime) -> None:
         """Update the next_run time for a job."""
         conn = self.connect()
-        conn.execute(
-            "UPDATE jobs SET next_run = ? WHERE id = ?",
-            (next_run, job_id),
-        )
-        conn.commit()
+        conn.execute(_UPDATE_NEXT_RUN_SQL, (next_run, _to_timestamp(next_run), job_id))
+        self._commit(conn)
+        self._push_due(job_id, next_run)
+
+    def update_next_runs(self, next_runs: list[tuple[int, datetime]]) -> None:
+        """Update the next_run time of several jobs with one commit."""
+        if not next_runs:
+            return
+        with self.transaction() as conn:
+            conn.executemany(
+                _UPDATE_NEXT_RUN_SQL,
+                [(next_run, _to_timestamp(next_run), job_id) for job_id, next_run in next_runs],
+            )
+        for job_id, next_run in next_runs:
+            self._push_due(job_id, next_run)
+
+    def get_due_jobs(self, limit: Optional[int] = None) -> list[Job]:
+        """
+        Get enabled jobs that are due to run, the most overdue first.
 
-    def get_due_jobs(self) -> list[Job]:
-        """Get all enabled jobs that are due to run."""
+        Args:
+            limit: Return at most this many jobs (all due jobs if None)
+        """
         conn = self.connect()
-        now = datetime.now()
+        # LIMIT -1 is unlimited, so both cases share one cached statement
         cursor = conn.execute(
-            """
-            SELECT * FROM jobs
-            WHERE enabled = 1 AND next_run IS NOT NULL AND next_run <= ?
-            ORDER BY next_run
-            """,
-            (now,),
+            _SELECT_DUE_JOBS_SQL,
+            (_to_timestamp(datetime.now()), -1 if limit is None else limit),
         )
         return [self._row_to_job(row) for row in cursor.fetchall()]
 
+    # Due-job queue
+
+    def pop_due_jobs(self, now: Optional[datetime] = None) -> list[Job]:
+        """
+        Pop jobs whose next_run has passed from the in-memory due queue.
+
+        Unlike get_due_jobs(), this only touches the database for jobs that
+        are actually due. Queue entries are advisory: each popped job is
+        re-read and dropped if it was deleted, disabled or rescheduled since
+        it was queued. Writes from other connections (e.g. the CLI) are
+        detected through PRAGMA data_version and reload the queue.
+
+        Args:
+            now: Reference time (defaults to now)
+
+        Returns:
+            Due jobs, earliest first
+        """
+        if now is None:
+            now = datetime.now()
+        self._sync_due_heap()
+
+        popped: dict[int, datetime] = {}
+        with self._due_lock:
+            while self._due_heap and self._due_heap[0][0] <= now:
+                next_run, job_id = heapq.heappop(self._due_heap)
+                popped.setdefault(job_id, next_run)
+
+        jobs = []
+        for job_id, next_run in popped.items():
+            job = self.get_job_by_id(job_id)
+            if job is None or not job.enabled or job.next_run != next_run:
+                continue  # Stale entry
+            jobs.append(job)
+        return jobs
+
+    def get_next_due_time(self) -> Optional[datetime]:
+        """Get the earliest queued next_run, or None if no job is scheduled."""
+        self._sync_due_heap()
+        with self._due_lock:
+            return self._due_heap[0][0] if self._due_heap else None
+
+    def requeue_due_job(self, job: Job) -> None:
+        """
+        Put a job popped by pop_due_jobs() back on the due queue.
+
+        Used when running the job failed before its next_run was updated,
+        so it is not dropped from the schedule. If it was rescheduled after
+        all, the entry is stale and pop_due_jobs() skips it.
+
+        Args:
+            job: Job as returned by pop_due_jobs()
+        """
+        self._push_due(job.id, job.next_run)
+
+    def _push_due(self, job_id: int, next_run: Optional[datetime]) -> None:
+        """Queue a job's next run time."""
+        if next_run is None:
+            return
+        # Match the whole-second precision that next_run is read back with
+        next_run = next_run.replace(microsecond=0)
+        with self._due_lock:
+            heapq.heappush(self._due_heap, (next_run, job_id))
+
+    def _sync_due_heap(self) -> None:
+        """(Re)load the due queue on first use or after another connection wrote."""
+        conn = self.connect()
+        data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+        # Each thread compares against the last value seen on its own connection
+        if data_version == self._local.due_data_version:
+            return
+        rows = conn.execute(
+            "SELECT id, next_run_ts FROM jobs WHERE enabled = 1 AND next_run_ts IS NOT NULL"
+        ).fetchall()
+        heap = [(_from_timestamp(row["next_run_ts"]), row["id"]) for row in rows]
+        heapq.heapify(heap)
+        with self._due_lock:
+            self._due_heap = heap
+        self._local.due_data_version = data_version
+
     # Run operations
 
     def create_run(self, run: Run) -> int:
         """Create a new run record. Returns the run ID."""
         conn = self.connect()
-        cursor = conn.execute(
-            """
-            INSERT INTO runs (job_id, job_name, started_at, ended_at, exit_code,
-                            stdout, stderr, timed_out, duration_seconds)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                run.job_id,
-                run.job_name,
-                run.started_at,
-                run.ended_at,
-                run.exit_code,
-                run.stdout,
-                run.stderr,
-                1 if run.timed_out else 0,
-                run.duration_seconds,
-            ),
-        )
-        conn.commit()
+        cursor = conn.execute(_INSERT_RUN_SQL, self._run_insert_params(run))
+        self._commit(conn)
         return cursor.lastrowid
 
+    def create_runs(self, runs: list[Run]) -> list[int]:
+        """
+        Create several run records in one statement batch and commit.
+
+        Sets the id of each Run and returns the new IDs in input order.
+        """
+        if not runs:
+            return []
+        with self.transaction() as conn:
+            conn.executemany(_INSERT_RUN_SQL, [self._run_insert_params(r) for r in runs])
+            # The open transaction holds the write lock, so the AUTOINCREMENT
+            # ids assigned to this batch are consecutive
+            last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+        run_ids = list(range(last_id - len(runs) + 1, last_id + 1))
+        for run, run_id in zip(runs, run_ids):
+            run.id = run_id
+        return run_ids
+
     def update_run(self, run: Run) -> None:
         """Update an existing run record."""
         conn = self.connect()
-        conn.execute(
-            """
-            UPDATE runs SET
-                ended_at = ?,
-                exit_code = ?,
-                stdout = ?,
-                stderr = ?,
-                timed_out = ?,
-                duration_seconds = ?
-            WHERE id = ?
-            """,
-            (
-                run.ended_at,
-                run.exit_code,
-                run.stdout,
-                run.stderr,
-                1 if run.timed_out else 0,
-                run.duration_seconds,
-                run.id,
-            ),
-        )
-        conn.commit()
+        conn.execute(_UPDATE_RUN_SQL, self._run_update_params(run))
+        self._commit(conn)
+
+    def update_runs(self, runs: list[Run]) -> None:
+        """Update several run records in one statement batch and commit."""
+        if not runs:
+            return
+        with self.transaction() as conn:
+            conn.executemany(_UPDATE_RUN_SQL, [self._run_update_params(r) for r in runs])
 
     def get_run(self, run_id: int) -> Optional[Run]:
         """Get a run by ID."""
@@ -325,9 +656,9 @@ class Database:
         failed_only: bool = False,
         since: Optional[datetime] = None,
     ) -> list[Run]:
-        """List runs with optional filtering."""
+        """List runs with optional filtering (stdout and stderr are not loaded)."""
         conn = self.connect()
-        query = "SELECT * FROM runs WHERE 1=1"
+        query = f"SELECT {_RUN_SUMMARY_COLUMNS} FROM runs WHERE 1=1"
         params: list = []
 
         if job_name:
@@ -348,9 +679,26 @@ class Database:
         return [self._row_to_run(row) for row in cursor.fetchall()]
 
     def get_last_run(self, job_name: str) -> Optional[Run]:
-        """Get the most recent run for a job."""
-        runs = self.list_runs(job_name=job_name, limit=1)
-        return runs[0] if runs else None
+        """Get the most recent run for a job (stdout and stderr are not loaded)."""
+        conn = self.connect()
+        row = conn.execute(_SELECT_LAST_RUN_SQL, (job_name,)).fetchone()
+        if row is None:
+            return None
+        return self._row_to_run(row)
+
+    def get_run_stats(self, since: datetime) -> dict[str, int]:
+        """
+        Count runs started since a point in time, by outcome.
+
+        Args:
+            since: Earliest start time to include
+
+        Returns:
+            Dict with total, successful, failed and timed_out counts
+        """
+        conn = self.connect()
+        row = conn.execute(_RUN_STATS_SQL, (since,)).fetchone()
+        return dict(row)
 
     def cleanup_old_runs(self, days: int = 30) -> int:
         """Delete runs older than specified days. Returns count deleted."""
@@ -359,11 +707,107 @@ class Database:
             "DELETE FROM runs WHERE started_at < datetime('now', ?)",
             (f"-{days} days",),
         )
-        conn.commit()
+        self._commit(conn)
         return cursor.rowcount
 
     # Helper methods
 
+    def _commit(self, conn: sqlite3.Connection) -> None:
+        """Commit unless a transaction() block will commit for us."""
+        if self._transaction_depth == 0:
+            conn.commit()
+
+    @staticmethod
+    def _run_insert_params(run: Run) -> tuple:
+        """Bind parameters for _INSERT_RUN_SQL."""
+        return (
+            run.job_id,
+            run.job_name,
+            run.started_at,
+            run.ended_at,
+            run.exit_code,
+            run.stdout,
+            run.stderr,
+            1 if run.timed_out else 0,
+            run.duration_seconds,
+            run.stdout_path,
+            run.stderr_path,
+        )
+
+    @staticmethod
+    def _run_update_params(run: Run) -> tuple:
+        """Bind parameters for _UPDATE_RUN_SQL."""
+        return (
+            run.ended_at,
+            run.exit_code,
+            run.stdout,
+            run.stderr,
+            1 if run.timed_out else 0,
+            run.duration_seconds,
+            run.stdout_path,
+            run.stderr_path,
+            run.id,
+        )
+
+    def _set_job_tags(self, conn: sqlite3.Connection, job_id: int, tags: Optional[str]) -> None:
+        """Replace the job_tags rows for a job with the tags in its tags string."""
+        conn.execute("DELETE FROM job_tags WHERE job_id = ?", (job_id,))
+        conn.executemany(
+            "INSERT INTO job_tags (job_id, tag) VALUES (?, ?)",
+            [(job_id, tag) for tag in _split_tags(tags)],
+        )
+
+    def _migrate_next_run_ts(self, conn: sqlite3.Connection) -> None:
+        """Add and backfill next_run_ts for databases created before it existed."""
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(jobs)")}
+        if "next_run_ts" not in columns:
+            conn.execute("ALTER TABLE jobs ADD COLUMN next_run_ts INTEGER")
+            rows = conn.execute(
+                "SELECT id, next_run FROM jobs WHERE next_run IS NOT NULL"
+            ).fetchall()
+            conn.executemany(
+                "UPDATE jobs SET next_run_ts = ? WHERE id = ?",
+                [(_to_timestamp(_parse_datetime(row["next_run"])), row["id"]) for row in rows],
+            )
+        # (enabled, next_run_ts) serves the due-job queries and every
+        # enabled filter; the single-column indexes it replaces only cost writes
+        conn.executescript("""
+            CREATE INDEX IF NOT EXISTS idx_jobs_next_run_ts ON jobs(enabled, next_run_ts);
+            DROP INDEX IF EXISTS idx_jobs_next_run;
+            DROP INDEX IF EXISTS idx_jobs_enabled;
+        """)
+
+    def _migrate_run_output_paths(self, conn: sqlite3.Connection) -> None:
+        """Add stdout_path/stderr_path for databases created before they existed."""
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(runs)")}
+        for column in ("stdout_path", "stderr_path"):
+            if column not in columns:
+                conn.execute(f"ALTER TABLE runs ADD COLUMN {column} TEXT")
+
+    def _backfill_job_tags(self, conn: sqlite3.Connection) -> None:
+        """Populate job_tags for databases created before the table existed."""
+        if conn.execute("SELECT 1 FROM job_tags LIMIT 1").fetchone() is not None:
+            return
+        rows = conn.execute(
+            "SELECT id, tags FROM jobs WHERE tags IS NOT NULL AND tags != ''"
+        ).fetchall()
+        for row in rows:
+            self._set_job_tags(conn, row["id"], row["tags"])
+
+    def _job_filter(self, include_disabled: bool, tag: Optional[str]) -> tuple[str, list]:
+        """Build the WHERE clause and parameters shared by the job listings."""
+        where = "1=1"
+        params: list = []
+
+        if not include_disabled:
+            where += " AND enabled = 1"
+
+        if tag:
+            where += " AND id IN (SELECT job_id FROM job_tags WHERE tag = ?)"
+            params.append(tag.strip())
+
+        return where, params
+
     def _row_to_job(self, row: sqlite3.Row) -> Job:
         """Convert a database row to a Job object."""
         return Job(
@@ -377,7 +821,7 @@ class Database:
             tags=row["tags"],
             created_at=_parse_datetime(row["created_at"]),
             updated_at=_parse_datetime(row["updated_at"]),
-            next_run=_parse_datetime(row["next_run"]),
+            next_run=_from_timestamp(row["next_run_ts"]),
         )
 
     def _row_to_run(self, row: sqlite3.Row) -> Run:
@@ -393,4 +837,6 @@ class Database:
             stderr=row["stderr"],
             timed_out=bool(row["timed_out"]),
             duration_seconds=row["duration_seconds"],
+            stdout_path=row["stdout_path"],
+            stderr_path=row["stderr_path"],
         )
@@ -1,7 +1,7 @@
 """Communication dispatcher module for cc_director."""
 
 from .config import DispatcherConfig, SEND_FROM_ACCOUNTS, get_send_from_accounts
-from .dispatcher import CommunicationDispatcher
+from .dispatcher import CommunicationDispatcher, load_posted_item
 from .email_sender import EmailSender
 from .linkedin_sender import LinkedInSender
 from .reddit_sender import RedditSender
@@ -16,6 +16,7 @@ __all__ = [
     "SEND_FROM_ACCOUNTS",
     "get_send_from_accounts",
     "CommunicationDispatcher",
+    "load_posted_item",
     "EmailSender",
     "LinkedInSender",
     "RedditSender",
@@ -43,6 +43,9 @@ class DispatcherConfig:
     # Poll interval in seconds (for checking scheduled items)
     poll_interval: float = 30.0
 
+    # Maximum number of items dispatched concurrently
+    max_concurrency: int = 8
+
     # Whether dispatcher is enabled
     enabled: bool = True
 
@@ -1,18 +1,97 @@
 """Communication dispatcher - coordinates sending approved communications."""
 
 import asyncio
+import heapq
 import json
 import logging
+import os
 import shutil
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .config import DispatcherConfig
 from .email_sender import EmailSender
+from .watcher import ApprovedFolderWatcher
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger("cc_director.dispatcher")
 
+# How long get_stats() results are reused before rescanning the folders
+STATS_TTL_SECONDS = 2.0
+
+# An item whose dispatch failed is retried after a backoff that doubles per
+# attempt, from RETRY_BASE_SECONDS up to RETRY_MAX_SECONDS
+RETRY_BASE_SECONDS = 30.0
+RETRY_MAX_SECONDS = 30 * 60.0
+
+
+# Python 3.11+ fromisoformat accepts a trailing "Z" natively
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+
+def _parse_iso_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp, including the "Z" UTC suffix."""
+    if not _FROMISOFORMAT_ACCEPTS_Z and value.endswith("Z"):
+        return datetime.fromisoformat(value[:-1] + "+00:00")
+    return datetime.fromisoformat(value)
+
+
+def _load_item(path: Path) -> Dict[str, Any]:
+    """Read and decode a content item JSON file (orjson when available)."""
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dump_item(item: Dict[str, Any]) -> bytes:
+    """Encode a content item as indented JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(item, option=orjson.OPT_INDENT_2)
+    return json.dumps(item, indent=2).encode("utf-8")
+
+
+def _meta_path(item_path: Path) -> Path:
+    """Sidecar path holding posted metadata for an item (not matched by *.json)."""
+    return item_path.with_name(item_path.name + ".meta")
+
+
+def load_posted_item(path: Path) -> Dict[str, Any]:
+    """
+    Load an item from posted/ merged with its dispatch metadata sidecar.
+
+    Args:
+        path: Path to the item JSON file in posted/
+
+    Returns:
+        Content item dictionary including status and posted_* fields
+    """
+    item = _load_item(path)
+    meta_path = _meta_path(path)
+    if meta_path.exists():
+        item.update(_load_item(meta_path))
+    return item
+
+
+def _count_json(folder: Path) -> int:
+    """Count *.json files in a folder without building Path objects."""
+    try:
+        with os.scandir(folder) as entries:
+            return sum(
+                1 for e in entries
+                if e.name.endswith(".json") and e.is_file(follow_symlinks=False)
+            )
+    except FileNotFoundError:
+        return 0
+
 
 class CommunicationDispatcher:
     """Coordinates sending approved communications."""
@@ -27,6 +106,80 @@ class CommunicationDispatcher:
         self.config = config or DispatcherConfig()
         self.email_sender = EmailSender()
         self.config.ensure_folders_exist()
+        self._stats_cache: Optional[Tuple[float, Dict[str, int]]] = None
+
+        # Scheduled items that are not due yet, and failed items waiting for
+        # their retry: min-heap of (due timestamp, path)
+        self._scheduled: List[Tuple[float, str]] = []
+        self._scheduled_paths: set[str] = set()
+        # path -> failed dispatch attempts so far
+        self._attempts: Dict[str, int] = {}
+
+        # New files are pushed to us by the watcher
+        self._dispatch_tasks: set[asyncio.Task] = set()
+        # Paths being dispatched, so overlapping events and retries don't
+        # send the same item twice
+        self._in_flight: set[str] = set()
+        self._running = False
+        self.watcher = ApprovedFolderWatcher(
+            self.config.approved_path,
+            on_new_item=self._on_new_item,
+        )
+
+    async def start(self) -> None:
+        """
+        Dispatch existing approved items, then react to new ones.
+
+        The watcher delivers new files as they appear; the loop below wakes
+        up when the earliest scheduled item falls due. Items whose dispatch
+        failed (a send error, or a file read before it was fully written)
+        are scheduled again with a backoff, so only they are retried.
+        """
+        self._running = True
+        await self.process_approved_items()
+        self.watcher.start()
+
+        try:
+            while self._running:
+                await asyncio.sleep(self._seconds_until_next_scheduled())
+                await self.process_scheduled_items()
+        finally:
+            await self.watcher.stop()
+
+    def stop(self) -> None:
+        """Stop the dispatcher loop; start() then stops the folder watcher."""
+        self._running = False
+
+    def _on_new_item(self, item_path: Path) -> None:
+        """Watcher callback (runs on the event loop)."""
+        task = asyncio.create_task(self.dispatch_item(item_path))
+        # Hold a reference until done so the task is not garbage collected
+        self._dispatch_tasks.add(task)
+        task.add_done_callback(self._dispatch_tasks.discard)
+
+    def _schedule(self, item_path: Path, due: float) -> None:
+        """Remember a not-yet-due item so it is dispatched at timestamp due."""
+        key = str(item_path)
+        if key in self._scheduled_paths:
+            return
+        self._scheduled_paths.add(key)
+        heapq.heappush(self._scheduled, (due, key))
+
+    def _schedule_retry(self, item_path: Path) -> None:
+        """Schedule a failed item again after its backoff."""
+        key = str(item_path)
+        attempts = self._attempts.get(key, 0) + 1
+        self._attempts[key] = attempts
+        delay = min(RETRY_BASE_SECONDS * 2 ** (attempts - 1), RETRY_MAX_SECONDS)
+        self._schedule(item_path, time.time() + delay)
+        logger.info(f"{item_path.name} will be retried in {delay:.0f}s (attempt {attempts + 1})")
+
+    def _seconds_until_next_scheduled(self) -> float:
+        """Seconds until the earliest scheduled item, capped at poll_interval."""
+        if not self._scheduled:
+            return self.config.poll_interval
+        wait = self._scheduled[0][0] - time.time()
+        return min(max(wait, 0.0), self.config.poll_interval)
 
     async def dispatch_item(self, item_path: Path) -> bool:
         """
@@ -38,10 +191,23 @@ class CommunicationDispatcher:
         Returns:
             True if successfully dispatched
         """
+        key = str(item_path)
+        if key in self._in_flight:
+            return False
+        self._in_flight.add(key)
+        try:
+            dispatched = await self._dispatch(item_path)
+        finally:
+            self._in_flight.discard(key)
+        if dispatched:
+            self._attempts.pop(key, None)
+        return dispatched
+
+    async def _dispatch(self, item_path: Path) -> bool:
+        """Load, check timing and send one item; see dispatch_item()."""
         try:
             # Load the item
-            with open(item_path, "r", encoding="utf-8") as f:
-                item = json.load(f)
+            item = _load_item(item_path)
 
             item_id = item.get("id", "unknown")[:8]
             platform = item.get("platform", "unknown")
@@ -58,9 +224,10 @@ class CommunicationDispatcher:
                 scheduled_for = item.get("scheduled_for")
                 if scheduled_for:
                     try:
-                        scheduled_dt = datetime.fromisoformat(scheduled_for.replace("Z", "+00:00"))
+                        scheduled_dt = _parse_iso_datetime(scheduled_for)
                         if scheduled_dt > datetime.now(scheduled_dt.tzinfo):
                             logger.info(f"Item {item_id} scheduled for {scheduled_for}, not time yet")
+                            self._schedule(item_path, scheduled_dt.timestamp())
                             return False
                     except (ValueError, TypeError) as e:
                         logger.warning(f"Invalid scheduled_for format: {scheduled_for}, sending now")
@@ -73,16 +240,25 @@ class CommunicationDispatcher:
                     return True
                 else:
                     logger.error(f"Failed to send email {item_id}: {result.message}")
+                    self._schedule_retry(item_path)
                     return False
             else:
                 logger.warning(f"Platform {platform} not yet supported for dispatch")
                 return False
 
+        except FileNotFoundError:
+            # Already dispatched or moved by the time this event was handled
+            logger.debug(f"{item_path} no longer exists, skipping")
+            self._attempts.pop(str(item_path), None)
+            return False
         except json.JSONDecodeError as e:
+            # Possibly read before it was fully written
             logger.error(f"Invalid JSON in {item_path}: {e}")
+            self._schedule_retry(item_path)
             return False
         except Exception as e:
             logger.error(f"Error dispatching {item_path}: {e}")
+            self._schedule_retry(item_path)
             return False
 
     async def _mark_posted(
@@ -92,28 +268,33 @@ class CommunicationDispatcher:
         message: str
     ) -> None:
         """
-        Update item with posted metadata and move to posted/ folder.
+        Record posted metadata and move the item to posted/ folder.
+
+        The item file is renamed unchanged; the metadata goes to a small
+        sidecar next to it (see load_posted_item()) so large items are not
+        re-encoded just to record a few fields.
 
         Args:
             item_path: Original path in approved/
             item: Content item dictionary
             message: Success message to record
         """
-        # Update item metadata
-        item["status"] = "posted"
-        item["posted_at"] = datetime.utcnow().isoformat() + "Z"
-        item["posted_by"] = "cc_director_service"
-        item["posted_message"] = message
+        meta = {
+            "status": "posted",
+            "posted_at": datetime.utcnow().isoformat() + "Z",
+            "posted_by": "cc_director_service",
+            "posted_message": message,
+        }
+        item.update(meta)
 
         # Generate new filename in posted/
         posted_path = self.config.posted_path / item_path.name
 
-        # Write to posted/ folder
-        with open(posted_path, "w", encoding="utf-8") as f:
-            json.dump(item, f, indent=2)
-
-        # Delete from approved/
-        item_path.unlink()
+        # Write the sidecar first so a posted item always has its metadata,
+        # then move the item itself with a single atomic rename
+        _meta_path(posted_path).write_bytes(_dump_item(meta))
+        os.replace(item_path, posted_path)
+        self._stats_cache = None
 
         item_id = item.get("id", "unknown")[:8]
         logger.info(f"Item {item_id} moved to posted/")
@@ -126,49 +307,80 @@ class CommunicationDispatcher:
             Number of items successfully dispatched
         """
         approved_path = self.config.approved_path
-        if not approved_path.exists():
+        try:
+            with os.scandir(approved_path) as entries:
+                item_paths = [
+                    Path(e.path) for e in entries
+                    if e.name.endswith(".json") and e.is_file(follow_symlinks=False)
+                ]
+        except FileNotFoundError:
             return 0
 
-        dispatched = 0
-        for item_path in approved_path.glob("*.json"):
-            if await self.dispatch_item(item_path):
-                dispatched += 1
+        if not item_paths:
+            return 0
 
-        return dispatched
+        # Sends are I/O bound, so run up to max_concurrency of them at once
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+
+        async def dispatch_bounded(item_path: Path) -> bool:
+            async with semaphore:
+                return await self.dispatch_item(item_path)
+
+        results = await asyncio.gather(
+            *(dispatch_bounded(p) for p in item_paths),
+            return_exceptions=True,
+        )
+        return sum(1 for r in results if r is True)
 
     async def process_scheduled_items(self) -> int:
         """
-        Check approved items for any that are now due for sending.
+        Dispatch scheduled items whose time has come.
 
-        This is called periodically to handle scheduled items.
+        Only items previously seen with a future scheduled_for, and failed
+        items whose retry is due, are checked.
 
         Returns:
             Number of items dispatched
         """
-        return await self.process_approved_items()
+        now = time.time()
+        dispatched = 0
+        while self._scheduled and self._scheduled[0][0] <= now:
+            _, key = heapq.heappop(self._scheduled)
+            self._scheduled_paths.discard(key)
+            item_path = Path(key)
+            # The item may have been dispatched manually or moved meanwhile
+            if not item_path.exists():
+                self._attempts.pop(key, None)
+            elif await self.dispatch_item(item_path):
+                dispatched += 1
+        return dispatched
 
     def get_pending_count(self) -> int:
         """Get count of items pending dispatch in approved/ folder."""
-        if not self.config.approved_path.exists():
-            return 0
-        return len(list(self.config.approved_path.glob("*.json")))
+        return _count_json(self.config.approved_path)
 
     def get_stats(self) -> Dict[str, int]:
-        """Get dispatcher statistics."""
-        stats = {
-            "pending_review": 0,
-            "approved": 0,
-            "rejected": 0,
-            "posted": 0,
-        }
-
-        for folder, key in [
-            (self.config.pending_path, "pending_review"),
-            (self.config.approved_path, "approved"),
-            (self.config.rejected_path, "rejected"),
-            (self.config.posted_path, "posted"),
-        ]:
-            if folder.exists():
-                stats[key] = len(list(folder.glob("*.json")))
+        """
+        Get dispatcher statistics.
 
-        return stats
+        Results are cached for STATS_TTL_SECONDS so UI polling does not
+        rescan the folders on every call; dispatching an item clears the cache.
+        """
+        now = time.monotonic()
+        if self._stats_cache is not None and now - self._stats_cache[0] < STATS_TTL_SECONDS:
+            return dict(self._stats_cache[1])
+
+        folders = {
+            "pending_review": self.config.pending_path,
+            "approved": self.config.approved_path,
+            "rejected": self.config.rejected_path,
+            "posted": self.config.posted_path,
+        }
+        # Directory listings block on I/O (slow on network shares), so scan
+        # the folders in parallel and wait for the slowest one only
+        with ThreadPoolExecutor(max_workers=len(folders)) as pool:
+            counts = pool.map(_count_json, folders.values())
+            stats = dict(zip(folders, counts))
+
+        self._stats_cache = (now, stats)
+        return dict(stats)
@@ -1,21 +1,29 @@
 """Email sender using cc-outlook and cc-gmail CLI tools."""
 
-import asyncio
 import logging
 import os
 import re
+import subprocess
 from dataclasses import dataclass
+from itertools import chain
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from .config import get_send_from_accounts
+from .process import run_command
 
-# Regex to match URLs that are not already in an href
-URL_PATTERN = re.compile(
-    r'(?<!href=["\'])(?<!href=)'  # Not already in an href
-    r'(https?://[^\s<>"\']+)',     # Match http/https URLs
-    re.IGNORECASE
-)
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# Regex to match http/https URLs. RE2 (linear-time, no backtracking) is used
+# when installed; it has no lookbehind, so URLs already inside an href are
+# skipped in _linkify_urls rather than by the pattern.
+if re2 is not None:
+    URL_PATTERN = re2.compile(r'(?i)(https?://[^\s<>"\']+)')
+else:
+    URL_PATTERN = re.compile(r'(https?://[^\s<>"\']+)', re.IGNORECASE)
 
 logger = logging.getLogger("cc_director.dispatcher.email")
 
@@ -28,7 +36,35 @@ def _bin_dir() -> Path:
     return Path.home() / ".cc-director" / "bin"
 
 
-@dataclass
+def _in_href(content: str, start: int) -> bool:
+    """Check whether the text at start directly follows href=, href=" or href='."""
+    prefix = content[max(0, start - 6):start].lower()
+    if prefix[-1:] in ('"', "'"):
+        prefix = prefix[:-1]
+    return prefix.endswith("href=")
+
+
+def _has_bare_url(content: str) -> bool:
+    """Cheaply check for an http(s):// URL that is not directly after href=."""
+    i = content.find("://")
+    while i >= 0:
+        if content[max(0, i - 5):i].lower() == "https":
+            start = i - 5
+        elif content[max(0, i - 4):i].lower() == "http":
+            start = i - 4
+        else:
+            start = -1
+        if start >= 0 and not _in_href(content, start):
+            return True
+        i = content.find("://", i + 3)
+    return False
+
+
+# Persona names that send from a differently named account
+_ACCOUNT_ALIASES = {"center_consulting": "consulting"}
+
+
+@dataclass(slots=True, frozen=True)
 class SendResult:
     """Result of a send operation."""
 
@@ -44,6 +80,15 @@ class EmailSender:
     def __init__(self):
         """Initialize the email sender."""
         self.accounts = get_send_from_accounts()
+        # Account lookup with persona aliases resolved up front
+        self._resolved = dict(self.accounts)
+        for alias, name in _ACCOUNT_ALIASES.items():
+            if name in self.accounts:
+                self._resolved[alias] = self.accounts[name]
+        # Fixed leading arguments of each tool's command line
+        bin_dir = _bin_dir()
+        self._outlook_prefix = (str(bin_dir / "cc-outlook.exe"),)
+        self._gmail_prefix = (str(bin_dir / "cc-gmail.exe"),)
 
     def _plain_text_to_html(self, content: str) -> str:
         """Convert plain text email content to HTML with proper formatting.
@@ -80,11 +125,24 @@ class EmailSender:
         Returns:
             Content with URLs wrapped in <a> tags
         """
-        def replace_url(match):
+        # Skip the regex when every URL is already inside an href (or there are none)
+        if not _has_bare_url(content):
+            return content
+
+        parts = []
+        last = 0
+        for match in URL_PATTERN.finditer(content):
+            start = match.start(1)
+            if _in_href(content, start):
+                continue
             url = match.group(1)
-            return f'<a href="{url}">{url}</a>'
-
-        return URL_PATTERN.sub(replace_url, content)
+            parts.append(content[last:start])
+            parts.append(f'<a href="{url}">{url}</a>')
+            last = match.end(1)
+        if not parts:
+            return content
+        parts.append(content[last:])
+        return "".join(parts)
 
     async def send(self, item: Dict[str, Any]) -> SendResult:
         """
@@ -127,61 +185,47 @@ class EmailSender:
         content = self._linkify_urls(content)
 
         # Get account config - try send_from first, then persona
-        account_key = item.get("send_from") or item.get("persona", "mindzie")
-        # Map persona names to account names
-        if account_key == "center_consulting":
-            account_key = "consulting"
-        account = self.accounts.get(account_key)
+        account_key = item.get("send_from") or item.get("persona") or "mindzie"
+        account = self._resolved.get(account_key)
         if not account:
             return SendResult(
                 success=False,
                 message=f"Unknown account: {account_key}"
             )
 
-        # Build command based on tool
-        if account["tool"] == "cc-outlook":
-            cmd = self._build_outlook_command(to_email, subject, content, email_specific)
-        else:  # cc-gmail
-            cmd = self._build_gmail_command(
-                account["tool_account"],
-                to_email,
-                subject,
-                content,
-                email_specific
-            )
+        cmd = self._build_command(account, to_email, subject, content, email_specific)
 
         # Execute the command
         try:
             logger.info(f"Sending email from {account['email']} to {to_email}")
             logger.debug(f"Command: {' '.join(cmd)}")
 
-            result = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await result.communicate()
-
-            stdout_str = stdout.decode() if stdout else ""
-            stderr_str = stderr.decode() if stderr else ""
+            # Only stderr is reported on failure, so skip the stdout pipe
+            result = await run_command(cmd, capture_stdout=False)
 
             if result.returncode == 0:
                 logger.info(f"Email sent successfully from {account['email']} to {to_email}")
                 return SendResult(
                     success=True,
-                    message=f"Email sent from {account['email']} to {to_email}",
-                    stdout=stdout_str,
-                    stderr=stderr_str
+                    message=f"Email sent from {account['email']} to {to_email}"
                 )
             else:
+                # Output is only kept (and decoded) when the send failed
+                stderr_str = result.stderr.decode(errors="replace") if result.stderr else ""
                 logger.error(f"Email send failed: {stderr_str}")
                 return SendResult(
                     success=False,
                     message=f"Send failed with exit code {result.returncode}",
-                    stdout=stdout_str,
                     stderr=stderr_str
                 )
 
+        except subprocess.TimeoutExpired:
+            error_msg = f"Email tool timed out: {cmd[0]}"
+            logger.error(error_msg)
+            return SendResult(
+                success=False,
+                message=error_msg
+            )
         except FileNotFoundError as e:
             error_msg = f"Email tool not found: {cmd[0]}"
             logger.error(error_msg)
@@ -197,71 +241,32 @@ class EmailSender:
                 message=error_msg
             )
 
-    def _build_outlook_command(
+    def _build_command(
         self,
+        account: Dict[str, Optional[str]],
         to_email: str,
         subject: str,
         body: str,
         email_specific: Dict[str, Any]
     ) -> List[str]:
-        """Build cc-outlook send command."""
-        cmd = [
-            str(_bin_dir() / "cc-outlook.exe"), "send",
-            "-t", to_email,
-            "-s", subject,
-            "-b", body,
-            "--html",
-        ]
-
-        # Add CC if present
-        cc_list = email_specific.get("cc", [])
-        for cc in cc_list:
-            cmd.extend(["--cc", cc])
-
-        # Add BCC if present
-        bcc_list = email_specific.get("bcc", [])
-        for bcc in bcc_list:
-            cmd.extend(["--bcc", bcc])
-
-        # Add attachments if present
-        attachments = email_specific.get("attachments", [])
-        for attachment in attachments:
-            cmd.extend(["--attach", attachment])
-
-        return cmd
-
-    def _build_gmail_command(
-        self,
-        account: str,
-        to_email: str,
-        subject: str,
-        body: str,
-        email_specific: Dict[str, Any]
-    ) -> List[str]:
-        """Build cc-gmail send command."""
-        cmd = [
-            str(_bin_dir() / "cc-gmail.exe"),
-            "-a", account,
+        """Build the cc-outlook or cc-gmail send command for an account."""
+        tool = (account.get("tool") or "").replace("_", "-")
+        if tool == "cc-outlook":
+            prefix = self._outlook_prefix
+        else:  # cc-gmail selects the mailbox with -a
+            prefix = (*self._gmail_prefix, "-a", account["tool_account"])
+
+        return [
+            *prefix,
             "send",
             "-t", to_email,
             "-s", subject,
             "-b", body,
             "--html",
+            # CC, BCC and attachments if present
+            *chain.from_iterable(("--cc", cc) for cc in email_specific.get("cc", [])),
+            *chain.from_iterable(("--bcc", bcc) for bcc in email_specific.get("bcc", [])),
+            *chain.from_iterable(
+                ("--attach", attachment) for attachment in email_specific.get("attachments", [])
+            ),
         ]
-
-        # Add CC if present
-        cc_list = email_specific.get("cc", [])
-        for cc in cc_list:
-            cmd.extend(["--cc", cc])
-
-        # Add BCC if present
-        bcc_list = email_specific.get("bcc", [])
-        for bcc in bcc_list:
-            cmd.extend(["--bcc", bcc])
-
-        # Add attachments if present
-        attachments = email_specific.get("attachments", [])
-        for attachment in attachments:
-            cmd.extend(["--attach", attachment])
-
-        return cmd
@@ -3,11 +3,12 @@
 import asyncio
 import logging
 import os
-import sqlite3
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from .media import TEMP_MEDIA_DIR, extract_media
+
 logger = logging.getLogger("cc_director.dispatcher.linkedin")
 
 def _bin_dir() -> Path:
@@ -19,10 +20,9 @@ def _bin_dir() -> Path:
 
 
 CC_BROWSER_PATH = _bin_dir() / "cc-browser.exe"
-TEMP_MEDIA_DIR = Path(os.environ.get("TEMP", r"C:\temp")) / "cc_director_media"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SendResult:
     """Result of a send operation."""
 
@@ -184,22 +184,15 @@ class LinkedInSender:
             return None
 
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.execute(
-                "SELECT filename, data FROM media WHERE id = ?",
-                (media_id,)
+            # Streamed in chunks off the event loop; videos can be large
+            temp_path = await asyncio.to_thread(
+                extract_media, self.db_path, media_id, TEMP_MEDIA_DIR
             )
-            row = cursor.fetchone()
-            conn.close()
 
-            if not row:
+            if temp_path is None:
                 logger.warning(f"Media ID {media_id} not found in database")
                 return None
 
-            filename, data = row
-            temp_path = TEMP_MEDIA_DIR / f"{media_id}_{filename}"
-            temp_path.write_bytes(data)
-
             logger.info(f"Extracted media to {temp_path}")
             return temp_path
 
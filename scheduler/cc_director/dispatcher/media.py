@@ -0,0 +1,103 @@
+"""Extraction of media BLOBs from the communications database to temp files."""
+
+import logging
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger("cc_director.dispatcher.media")
+
+# Shared cache directory for media extracted by the senders
+TEMP_MEDIA_DIR = Path(os.environ.get("TEMP", r"C:\temp")) / "cc_director_media"
+
+# Bytes copied per read when streaming a BLOB to disk
+CHUNK_SIZE = 64 * 1024
+
+# Extracted files unused for this long are removed by prune_media_cache()
+MEDIA_CACHE_MAX_AGE_SECONDS = 7 * 24 * 3600
+
+
+def extract_media(db_path: Path, media_id: int, dest_dir: Path) -> Optional[Path]:
+    """Stream a media BLOB to a file in dest_dir without loading it whole.
+
+    The file name includes the BLOB size, so a retry of the same item
+    reuses the earlier extraction without reading the BLOB again.
+    Blocking; call through asyncio.to_thread() from async code.
+
+    Args:
+        db_path: Path to SQLite database
+        media_id: media.id of the row to extract
+        dest_dir: Directory for the extracted file
+
+    Returns:
+        Path to the extracted file, or None if the media row does not exist
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        row = conn.execute(
+            "SELECT filename, length(data) FROM media WHERE id = ?",
+            (media_id,)
+        ).fetchone()
+        if not row:
+            return None
+
+        filename, size = row
+        temp_path = dest_dir / f"{media_id}_{size}_{filename}"
+        if temp_path.exists():
+            os.utime(temp_path)  # Keep recently used files out of the pruner
+            logger.debug(f"Reusing extracted media {temp_path}")
+            return temp_path
+
+        part_path = temp_path.with_name(temp_path.name + ".part")
+
+        with open(part_path, "wb") as f:
+            if hasattr(conn, "blobopen"):  # Python 3.11+
+                with conn.blobopen("media", "data", media_id, readonly=True) as blob:
+                    while chunk := blob.read(CHUNK_SIZE):
+                        f.write(chunk)
+            else:
+                for offset in range(1, (size or 0) + 1, CHUNK_SIZE):
+                    chunk = conn.execute(
+                        "SELECT substr(data, ?, ?) FROM media WHERE id = ?",
+                        (offset, CHUNK_SIZE, media_id)
+                    ).fetchone()[0]
+                    f.write(chunk)
+
+        os.replace(part_path, temp_path)
+        return temp_path
+    finally:
+        conn.close()
+
+
+def prune_media_cache(
+    dest_dir: Path = TEMP_MEDIA_DIR,
+    max_age_seconds: float = MEDIA_CACHE_MAX_AGE_SECONDS
+) -> int:
+    """Delete extracted media files older than max_age_seconds.
+
+    Args:
+        dest_dir: Media cache directory
+        max_age_seconds: Age after which a file is removed
+
+    Returns:
+        Number of files removed
+    """
+    cutoff = time.time() - max_age_seconds
+    removed = 0
+    try:
+        with os.scandir(dest_dir) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file(follow_symlinks=False) and entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                        removed += 1
+                except OSError as e:
+                    logger.warning(f"Could not prune {entry.path}: {e}")
+    except FileNotFoundError:
+        return 0
+
+    if removed:
+        logger.info(f"Pruned {removed} cached media file(s) from {dest_dir}")
+    return removed
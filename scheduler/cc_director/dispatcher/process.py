@@ -0,0 +1,47 @@
+"""Thread-pooled subprocess execution for the dispatcher senders."""
+
+import asyncio
+import functools
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+# Default limit for a single cc-* tool invocation
+DEFAULT_TIMEOUT_SECONDS = 120.0
+
+# Shared by all senders; blocking subprocess.run calls here avoid asyncio's
+# per-child subprocess transport and watcher setup
+_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="cc-send")
+
+
+async def run_command(
+    cmd: List[str],
+    timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    capture_stdout: bool = True
+) -> subprocess.CompletedProcess:
+    """Run a command on the send thread pool and capture its output.
+
+    Args:
+        cmd: Command and arguments
+        timeout: Seconds before the child is killed
+        capture_stdout: If False, stdout goes to DEVNULL and only stderr
+            is piped (stdout is then None on the result)
+
+    Returns:
+        Completed process with returncode, stdout and stderr (bytes)
+
+    Raises:
+        FileNotFoundError: If the executable does not exist
+        subprocess.TimeoutExpired: If the command exceeds timeout
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _EXECUTOR,
+        functools.partial(
+            subprocess.run,
+            cmd,
+            stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            timeout=timeout
+        )
+    )
@@ -1,12 +1,14 @@
 """Reddit sender using cc-reddit CLI tool."""
 
-import asyncio
 import logging
 import os
+import subprocess
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from .process import run_command
+
 logger = logging.getLogger("cc_director.dispatcher.reddit")
 
 
@@ -21,7 +23,7 @@ def _bin_dir() -> Path:
 CC_REDDIT_PATH = _bin_dir() / "cc-reddit.exe"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SendResult:
     """Result of a send operation."""
 
@@ -152,25 +154,18 @@ class RedditSender:
             logger.info(f"Sending Reddit {action_type}")
             logger.debug(f"Command: {' '.join(cmd[:3])}...")
 
-            result = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await result.communicate()
-
-            stdout_str = stdout.decode() if stdout else ""
-            stderr_str = stderr.decode() if stderr else ""
+            result = await run_command(cmd)
 
             if result.returncode == 0:
                 logger.info(f"Reddit {action_type} sent successfully")
                 return SendResult(
                     success=True,
-                    message=f"Reddit {action_type} sent",
-                    stdout=stdout_str,
-                    stderr=stderr_str
+                    message=f"Reddit {action_type} sent"
                 )
             else:
+                # Output is only kept (and decoded) when the send failed
+                stdout_str = result.stdout.decode(errors="replace") if result.stdout else ""
+                stderr_str = result.stderr.decode(errors="replace") if result.stderr else ""
                 logger.error(f"Reddit {action_type} failed: {stderr_str}")
                 logger.error(f"stdout: {stdout_str}")
                 return SendResult(
@@ -180,6 +175,13 @@ class RedditSender:
                     stderr=stderr_str
                 )
 
+        except subprocess.TimeoutExpired:
+            error_msg = f"Reddit {action_type} timed out"
+            logger.error(error_msg)
+            return SendResult(
+                success=False,
+                message=error_msg
+            )
         except FileNotFoundError:
             error_msg = f"cc-reddit not found at {CC_REDDIT_PATH}"
             logger.error(error_msg)
@@ -4,60 +4,360 @@ import asyncio
 import json
 import logging
 import sqlite3
+import time
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Set
 
 logger = logging.getLogger("cc_director.dispatcher.sqlite_watcher")
 
+# Maximum number of items claimed per poll
+CLAIM_BATCH_SIZE = 50
+
+# Default number of items sent concurrently
+MAX_CONCURRENT_SENDS = 8
+
+# How often SQLiteDispatcher prunes old extracted media files
+MEDIA_PRUNE_INTERVAL_SECONDS = 6 * 3600.0
+
+# A failed send stays claimed and is retried after a backoff that doubles
+# per attempt, from RETRY_BASE_SECONDS up to RETRY_MAX_SECONDS...
+RETRY_BASE_SECONDS = 30.0
+RETRY_MAX_SECONDS = 30 * 60.0
+
+# ...until this many attempts have failed; the item is then set to 'error'
+MAX_DISPATCH_ATTEMPTS = 5
+
+# Longest wait between checks when database file changes are being watched;
+# covers scheduled items whose time arrives without any write
+IDLE_POLL_SECONDS = 60.0
+
+# scheduled_for (ISO 8601 text, UTC) as integer Unix epoch milliseconds.
+# Used verbatim in the queries and the index so SQLite can match them.
+_SCHEDULED_FOR_MS = "CAST((julianday(scheduled_for) - 2440587.5) * 86400000 AS INTEGER)"
+
+# Approved items ready to dispatch. Claimed items are still 'approved'
+# (claims are kept in memory, see SQLiteWatcher), so the caller skips them.
+_SELECT_READY_SQL = """
+SELECT * FROM communications
+WHERE status = 'approved'
+AND (
+    send_timing IN ('immediate', 'asap')
+    OR (send_timing = 'scheduled' AND {scheduled_for_ms} <= ?)
+)
+ORDER BY ticket_number
+LIMIT ?
+""".format(scheduled_for_ms=_SCHEDULED_FOR_MS)
+
+# Ready scheduled items are picked up by the next check, so only later
+# ones decide how long the watcher may sleep
+_NEXT_SCHEDULED_SQL = """
+SELECT MIN({scheduled_for_ms}) FROM communications
+WHERE status = 'approved' AND send_timing = 'scheduled'
+AND {scheduled_for_ms} > ?
+""".format(scheduled_for_ms=_SCHEDULED_FOR_MS)
+
+_SELECT_MEDIA_SQL = """
+SELECT communication_id, id, type, filename, alt_text, file_size, mime_type
+FROM media
+WHERE communication_id IN ({placeholders})
+"""
+
+_MARK_POSTED_SQL = """
+UPDATE communications
+SET status = 'posted',
+    posted_at = ?,
+    posted_by = 'cc_director'
+WHERE ticket_number = ?
+"""
+
+_MARK_ERROR_SQL = """
+UPDATE communications
+SET status = 'error'
+WHERE ticket_number = ? AND status = 'approved'
+"""
+
+# Applied once per long-lived connection: WAL so polling reads never block
+# the approval UI's writes, and mmap/page cache so reads skip syscalls
+_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=268435456;
+PRAGMA cache_size=-65536;
+PRAGMA wal_autocheckpoint=1000;
+"""
+
+# Expression index, so the shared table's columns are left unchanged
+_CREATE_DISPATCH_INDEX_SQL = """
+DROP INDEX IF EXISTS idx_comm_dispatch;
+CREATE INDEX IF NOT EXISTS idx_comm_dispatch_ms
+ON communications(status, send_timing, {scheduled_for_ms});
+""".format(scheduled_for_ms=_SCHEDULED_FOR_MS)
+
+
+# JSON text columns of the communications table
+_ALL_JSON_FIELDS = (
+    "tags",
+    "recipient",
+    "linkedin_specific",
+    "twitter_specific",
+    "reddit_specific",
+    "email_specific",
+    "article_specific",
+    "facebook_specific",
+    "youtube_specific",
+    "thread_content",
+)
+
+# JSON columns each platform's sender actually reads
+_PLATFORM_JSON_FIELDS = {
+    "email": ("email_specific",),
+    "linkedin": ("recipient", "linkedin_specific"),
+    "twitter": ("twitter_specific", "thread_content"),
+    "reddit": ("reddit_specific",),
+    "facebook": ("facebook_specific",),
+    "youtube": ("youtube_specific",),
+}
+
+
+def _now_ms() -> int:
+    """Current time as integer Unix epoch milliseconds."""
+    return time.time_ns() // 1_000_000
+
+
+def _open_connection(db_path: Path) -> sqlite3.Connection:
+    """Open a long-lived autocommit connection to the communications database.
+
+    check_same_thread=False lets the owner close it from another thread; it
+    is otherwise only used from the dispatcher's event loop.
+    """
+    conn = sqlite3.connect(str(db_path), check_same_thread=False, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(_PRAGMAS)
+    return conn
+
 
 class SQLiteWatcher:
-    """Polls SQLite database for approved items ready to dispatch.
+    """Watches SQLite database for approved items ready to dispatch.
 
     Watches the communications table for items with:
     - status = 'approved'
     - send_timing = 'immediate' or 'asap' (dispatch immediately)
     - send_timing = 'scheduled' AND scheduled_for <= now (dispatch when ready)
     - send_timing = 'hold' (ignored, requires manual dispatch)
+
+    Ready items are claimed in memory, by ticket_number, and stay
+    'approved' in the database; the callback moves sent items on to
+    'posted' and returns True. An item whose send fails stays claimed
+    until its backoff has passed; after MAX_DISPATCH_ATTEMPTS failures it
+    is set to 'error' instead. Claims end with the process, so nothing is
+    left to clean up after a crash, but only one dispatcher may run
+    against a database.
+
+    When watchdog is available the watcher sleeps until the database files
+    are written (writers are other processes, so an in-process update hook would
+    not see them), waking at the latest when the next scheduled item is due
+    or after IDLE_POLL_SECONDS. Without watchdog it polls every poll_interval.
     """
 
     def __init__(
         self,
         db_path: Path,
         callback: Callable[[Dict[str, Any]], None],
-        poll_interval: float = 5.0
+        poll_interval: float = 5.0,
+        max_concurrent_sends: int = MAX_CONCURRENT_SENDS
     ):
         """Initialize the SQLite watcher.
 
         Args:
             db_path: Path to SQLite database
-            callback: Async callback function to call for each item
+            callback: Async callback called with each item; returns True
+                if the item was sent
             poll_interval: Seconds between polls
+            max_concurrent_sends: Maximum callbacks running at once
         """
         self.db_path = db_path
         self.callback = callback
         self.poll_interval = poll_interval
+        self.max_concurrent_sends = max_concurrent_sends
         self._running = False
-        self._processing: Set[int] = set()  # Track items being processed
+        self._index_ready = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._changed: Optional[asyncio.Event] = None
+        self._conn: Optional[sqlite3.Connection] = None
+        self._data_version: Optional[int] = None
+        # ticket_numbers being sent or backing off; skipped by checks
+        self._claimed: Set[int] = set()
+        # ticket_number -> failed attempts, and when the claim is released
+        # for the next attempt (time.monotonic())
+        self._attempts: Dict[int, int] = {}
+        self._retry_at: Dict[int, float] = {}
+        # The last check left ready items unclaimed (more than one batch)
+        self._more_ready = False
 
     async def start(self) -> None:
         """Start the watcher loop."""
         logger.info(f"Starting SQLite watcher on {self.db_path}")
-        logger.info(f"Poll interval: {self.poll_interval}s")
         self._running = True
+        self._loop = asyncio.get_running_loop()
+        self._changed = asyncio.Event()
 
-        while self._running:
-            try:
-                await self._check_for_items()
-            except Exception as e:
-                logger.error(f"Error in watcher loop: {e}")
+        observer = self._start_file_observer()
+        if observer is None:
+            logger.info(f"Poll interval: {self.poll_interval}s")
 
-            await asyncio.sleep(self.poll_interval)
+        try:
+            check = True
+            while self._running:
+                self._changed.clear()
+                if check:
+                    try:
+                        await self._check_for_items()
+                    except Exception as e:
+                        logger.error(f"Error in watcher loop: {e}")
+
+                timeout = self.poll_interval if observer is None else self._seconds_until_next_check()
+                try:
+                    await asyncio.wait_for(self._changed.wait(), timeout)
+                    # File events also fire for readers and our own writes;
+                    # only another connection's commit can add ready items
+                    check = observer is None or self._data_changed()
+                except asyncio.TimeoutError:
+                    check = True
+        finally:
+            if observer is not None:
+                observer.stop()
+                observer.join()
+            self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get or open the watcher's database connection."""
+        if self._conn is None:
+            self._conn = _open_connection(self.db_path)
+        return self._conn
 
     def stop(self) -> None:
         """Stop the watcher loop."""
         logger.info("Stopping SQLite watcher")
         self._running = False
+        self._notify_changed()
+
+    def _notify_changed(self) -> None:
+        """Wake the watcher loop (safe to call from any thread)."""
+        if self._loop is not None and self._changed is not None:
+            self._loop.call_soon_threadsafe(self._changed.set)
+
+    def _start_file_observer(self) -> Optional[Any]:
+        """Watch the database and its WAL/journal files for writes.
+
+        Returns:
+            The running watchdog observer, or None if watchdog is not installed
+        """
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            logger.info("watchdog not installed, using polling fallback")
+            return None
+
+        # Commits land in one of these; -shm changes on every read, so it is
+        # left out
+        db_name = self.db_path.name
+        written_names = {db_name, db_name + "-wal", db_name + "-journal"}
+
+        class Handler(FileSystemEventHandler):
+            # Only writes can make items ready; opens and closes by readers
+            # (the Communication Manager UI, our own connections) are ignored
+            def on_modified(handler_self, event) -> None:
+                handler_self._wake_for(event.src_path, event)
+
+            def on_created(handler_self, event) -> None:
+                handler_self._wake_for(event.src_path, event)
+
+            def on_moved(handler_self, event) -> None:
+                handler_self._wake_for(event.dest_path, event)
+
+            def _wake_for(handler_self, path: str, event) -> None:
+                if not event.is_directory and Path(path).name in written_names:
+                    self._notify_changed()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        observer = Observer()
+        observer.schedule(Handler(), str(self.db_path.parent), recursive=False)
+        observer.start()
+        return observer
+
+    def _data_changed(self) -> bool:
+        """Check whether another connection has committed since the last call.
+
+        PRAGMA data_version is per connection and ignores the connection's
+        own writes, so items set to 'error' on the watcher's connection do
+        not count; writes from any other connection (including the
+        dispatcher's posted updates) do.
+        """
+        if not self.db_path.exists():
+            return True
+        try:
+            data_version = self._connect().execute("PRAGMA data_version").fetchone()[0]
+        except sqlite3.Error:
+            return True
+        changed = data_version != self._data_version
+        self._data_version = data_version
+        return changed
+
+    def _seconds_until_next_check(self) -> float:
+        """Seconds until the next scheduled item or retry is due, capped at IDLE_POLL_SECONDS."""
+        if self._more_ready:
+            return 0.0
+        wait = IDLE_POLL_SECONDS
+        if self._retry_at:
+            wait = min(wait, min(self._retry_at.values()) - time.monotonic())
+
+        if not self.db_path.exists():
+            return max(wait, 0.0)
+
+        try:
+            now_ms = _now_ms()
+            next_ms = self._connect().execute(_NEXT_SCHEDULED_SQL, (now_ms,)).fetchone()[0]
+            if next_ms is not None:
+                wait = min(wait, (next_ms - now_ms) / 1000.0)
+        except sqlite3.Error as e:
+            logger.debug(f"Could not determine next scheduled item: {e}")
+        return max(wait, 0.0)
+
+    def _schedule_retry(self, conn: sqlite3.Connection, ticket_number: int) -> None:
+        """Back off a failed item, or set it to 'error' after MAX_DISPATCH_ATTEMPTS."""
+        attempts = self._attempts.get(ticket_number, 0) + 1
+        if attempts >= MAX_DISPATCH_ATTEMPTS:
+            self._attempts.pop(ticket_number, None)
+            self._claimed.discard(ticket_number)
+            try:
+                conn.execute(_MARK_ERROR_SQL, (ticket_number,))
+                logger.error(f"#{ticket_number} failed {attempts} times, marked as error")
+            except sqlite3.Error as e:
+                logger.error(f"Could not mark #{ticket_number} as error: {e}")
+            return
+
+        delay = min(RETRY_BASE_SECONDS * 2 ** (attempts - 1), RETRY_MAX_SECONDS)
+        self._attempts[ticket_number] = attempts
+        self._retry_at[ticket_number] = time.monotonic() + delay
+        logger.info(f"#{ticket_number} will be retried in {delay:.0f}s (attempt {attempts + 1})")
+
+    def _release_retries(self) -> None:
+        """Release the claims of backed-off items whose retry is due."""
+        now = time.monotonic()
+        for ticket_number, retry_at in list(self._retry_at.items()):
+            if retry_at <= now:
+                del self._retry_at[ticket_number]
+                self._claimed.discard(ticket_number)
 
     async def _check_for_items(self) -> None:
         """Check for approved items ready to dispatch."""
@@ -65,67 +365,76 @@ class SQLiteWatcher:
             logger.warning(f"Database not found: {self.db_path}")
             return
 
-        now = datetime.utcnow().isoformat()
+        now_ms = _now_ms()
 
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
+            conn = self._connect()
+
+            if not self._index_ready:
+                conn.executescript(_CREATE_DISPATCH_INDEX_SQL)
+                self._index_ready = True
+
+            # Backed-off items whose retry is due become claimable again
+            self._release_retries()
 
-            # Find items ready to dispatch:
+            # Claim items ready to dispatch:
             # 1. status = 'approved'
             # 2. Either immediate/asap OR scheduled time has passed
-            cursor = conn.execute("""
-                SELECT * FROM communications
-                WHERE status = 'approved'
-                AND (
-                    send_timing IN ('immediate', 'asap')
-                    OR (send_timing = 'scheduled' AND scheduled_for <= ?)
-                )
-            """, (now,))
-
-            rows = cursor.fetchall()
-
-            # Load media for each item
+            # 3. Not already claimed; over-fetch so those don't use up the batch
+            limit = CLAIM_BATCH_SIZE + len(self._claimed)
+            ready = conn.execute(_SELECT_READY_SQL, (now_ms, limit)).fetchall()
+            rows = [row for row in ready if row["ticket_number"] not in self._claimed]
+            self._more_ready = len(ready) == limit and len(rows) >= CLAIM_BATCH_SIZE
+            rows = rows[:CLAIM_BATCH_SIZE]
+            self._claimed.update(row["ticket_number"] for row in rows)
+
+            # Load media for all claimed items in one query
+            media_by_id: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+            if rows:
+                ids = [row["id"] for row in rows]
+                media_rows = conn.execute(
+                    _SELECT_MEDIA_SQL.format(placeholders=",".join("?" * len(ids))),
+                    ids,
+                ).fetchall()
+                for m in media_rows:
+                    media = dict(m)
+                    media_by_id[media.pop("communication_id")].append(media)
+
             items = []
             for row in rows:
                 item = dict(row)
-                ticket_number = item.get("ticket_number")
-
-                # Skip if already being processed
-                if ticket_number in self._processing:
-                    continue
 
                 # Parse JSON fields
                 item = self._parse_json_fields(item)
 
-                # Load media
-                media_cursor = conn.execute("""
-                    SELECT id, type, filename, alt_text, file_size, mime_type
-                    FROM media
-                    WHERE communication_id = ?
-                """, (item.get("id"),))
-
-                item["media"] = [dict(m) for m in media_cursor.fetchall()]
+                item["media"] = media_by_id.get(item.get("id"), [])
 
                 items.append(item)
 
-            conn.close()
+            # Process items concurrently; sends are mostly waiting on subprocesses
+            semaphore = asyncio.Semaphore(self.max_concurrent_sends)
 
-            # Process each item
-            for item in items:
+            async def dispatch(item: Dict[str, Any]) -> None:
                 ticket_number = item.get("ticket_number")
-                self._processing.add(ticket_number)
-
-                try:
-                    logger.info(
-                        f"Dispatching #{ticket_number}: "
-                        f"{item.get('platform')} {item.get('type')}"
-                    )
-                    await self.callback(item)
-                except Exception as e:
-                    logger.error(f"Error dispatching #{ticket_number}: {e}")
-                finally:
-                    self._processing.discard(ticket_number)
+                async with semaphore:
+                    try:
+                        logger.info(
+                            f"Dispatching #{ticket_number}: "
+                            f"{item.get('platform')} {item.get('type')}"
+                        )
+                        sent = await self.callback(item)
+                    except Exception as e:
+                        logger.error(f"Error dispatching #{ticket_number}: {e}")
+                        sent = False
+                    if sent:
+                        self._attempts.pop(ticket_number, None)
+                        self._claimed.discard(ticket_number)
+                    else:
+                        # Keep the claim so the next check does not pick the
+                        # item up again before its backoff has passed
+                        self._schedule_retry(conn, ticket_number)
+
+            await asyncio.gather(*(dispatch(item) for item in items))
 
         except sqlite3.Error as e:
             logger.error(f"SQLite error: {e}")
@@ -133,24 +442,18 @@ class SQLiteWatcher:
     def _parse_json_fields(self, item: Dict[str, Any]) -> Dict[str, Any]:
         """Parse JSON string fields back to dicts/lists.
 
+        Only the fields read by the item's platform sender are decoded;
+        the rest stay raw JSON strings. Items for other platforms get
+        every JSON field decoded.
+
         Args:
             item: Raw database row as dict
 
         Returns:
             Item with parsed JSON fields
         """
-        json_fields = [
-            "tags",
-            "recipient",
-            "linkedin_specific",
-            "twitter_specific",
-            "reddit_specific",
-            "email_specific",
-            "article_specific",
-            "facebook_specific",
-            "youtube_specific",
-            "thread_content"
-        ]
+        platform = (item.get("platform") or "").lower()
+        json_fields = _PLATFORM_JSON_FIELDS.get(platform, _ALL_JSON_FIELDS)
 
         for field in json_fields:
             value = item.get(field)
@@ -169,17 +472,24 @@ class SQLiteDispatcher:
     def __init__(
         self,
         db_path: Path,
-        poll_interval: float = 5.0
+        poll_interval: float = 5.0,
+        max_concurrent_sends: int = MAX_CONCURRENT_SENDS
     ):
         """Initialize the dispatcher.
 
         Args:
             db_path: Path to SQLite database
             poll_interval: Seconds between polls
+            max_concurrent_sends: Maximum items sent at once
         """
         self.db_path = db_path
         self.poll_interval = poll_interval
+        self.max_concurrent_sends = max_concurrent_sends
         self.watcher: Optional[SQLiteWatcher] = None
+        self._conn: Optional[sqlite3.Connection] = None
+        # ticket_number -> posted_at of items that were sent but could not
+        # be marked posted yet; they are never sent again
+        self._unrecorded: Dict[int, str] = {}
 
         # Import senders
         from .email_sender import EmailSender
@@ -201,24 +511,62 @@ class SQLiteDispatcher:
         self.watcher = SQLiteWatcher(
             db_path=self.db_path,
             callback=self._dispatch_item,
-            poll_interval=self.poll_interval
+            poll_interval=self.poll_interval,
+            max_concurrent_sends=self.max_concurrent_sends
         )
-        await self.watcher.start()
+        prune_task = asyncio.create_task(self._prune_media_periodically())
+        try:
+            await self.watcher.start()
+        finally:
+            prune_task.cancel()
+            for ticket_number, posted_at in list(self._unrecorded.items()):
+                self._mark_as_posted(ticket_number, posted_at)
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    async def _prune_media_periodically(self) -> None:
+        """Remove stale extracted media files every MEDIA_PRUNE_INTERVAL_SECONDS."""
+        from .media import prune_media_cache
+
+        while True:
+            try:
+                await asyncio.to_thread(prune_media_cache)
+            except Exception as e:
+                logger.error(f"Error pruning media cache: {e}")
+            await asyncio.sleep(MEDIA_PRUNE_INTERVAL_SECONDS)
 
     def stop(self) -> None:
         """Stop the dispatcher."""
         if self.watcher:
             self.watcher.stop()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get or open the dispatcher's database connection."""
+        if self._conn is None:
+            self._conn = _open_connection(self.db_path)
+        return self._conn
 
-    async def _dispatch_item(self, item: Dict[str, Any]) -> None:
+    async def _dispatch_item(self, item: Dict[str, Any]) -> bool:
         """Dispatch a single item to the appropriate sender.
 
         Args:
             item: Content item to dispatch
+
+        Returns:
+            True if the item was sent; on False the watcher retries it later
         """
         platform = item.get("platform", "").lower()
         ticket_number = item.get("ticket_number")
 
+        if ticket_number in self._unrecorded:
+            # Already sent; only the posted update is missing
+            self._mark_as_posted(ticket_number, self._unrecorded[ticket_number])
+            return True
+
         logger.info(f"Dispatching #{ticket_number} to {platform}")
 
         try:
@@ -242,37 +590,33 @@ class SQLiteDispatcher:
                 })()
 
             if result.success:
-                await self._mark_as_posted(ticket_number)
+                # Recorded before the send is acknowledged, so the item can
+                # not be picked up and sent a second time
+                self._mark_as_posted(ticket_number, datetime.utcnow().isoformat())
                 logger.info(f"#{ticket_number} dispatched successfully")
-            else:
-                logger.error(f"#{ticket_number} dispatch failed: {result.message}")
-                # Optionally: mark as failed or retry
+                return True
+
+            logger.error(f"#{ticket_number} dispatch failed: {result.message}")
+            return False
 
         except Exception as e:
             logger.error(f"Error dispatching #{ticket_number}: {e}")
+            return False
+
+    def _mark_as_posted(self, ticket_number: int, posted_at: str) -> None:
+        """Update an item's status to 'posted'.
 
-    async def _mark_as_posted(self, ticket_number: int) -> None:
-        """Update item status to 'posted' in database.
+        If the update fails the item is remembered as sent, and the update
+        is retried when the item comes up again or the dispatcher stops.
 
         Args:
             ticket_number: Ticket number to update
+            posted_at: ISO 8601 time the item was sent (UTC)
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            now = datetime.utcnow().isoformat()
-
-            conn.execute("""
-                UPDATE communications
-                SET status = 'posted',
-                    posted_at = ?,
-                    posted_by = 'cc_director'
-                WHERE ticket_number = ?
-            """, (now, ticket_number))
-
-            conn.commit()
-            conn.close()
-
+            self._connect().execute(_MARK_POSTED_SQL, (posted_at, ticket_number))
+            self._unrecorded.pop(ticket_number, None)
             logger.info(f"#{ticket_number} marked as posted")
-
         except sqlite3.Error as e:
+            self._unrecorded[ticket_number] = posted_at
             logger.error(f"Error marking #{ticket_number} as posted: {e}")
@@ -2,7 +2,7 @@
 
 import asyncio
 import logging
-import threading
+import os
 from pathlib import Path
 from typing import Callable, Optional
 
@@ -13,8 +13,12 @@ class ApprovedFolderWatcher:
     """
     Watch approved/ folder for new JSON files.
 
-    Uses watchdog library for cross-platform file system events.
-    Falls back to polling if watchdog is not available.
+    Runs as a task on the caller's event loop and invokes on_new_item there.
+
+    Uses the watchdog library for kernel file system events (inotify,
+    FSEvents, ReadDirectoryChangesW). Only on platforms where watchdog has
+    no native observer does it fall back to listing the folder every
+    poll_interval seconds.
     """
 
     def __init__(
@@ -28,81 +32,96 @@ class ApprovedFolderWatcher:
 
         Args:
             approved_path: Path to approved/ folder
-            on_new_item: Callback when new JSON file appears
+            on_new_item: Callback when a JSON file appears or is written;
+                may be called several times per file (called on the event
+                loop that started the watcher)
             poll_interval: Seconds between polls if using fallback
+
+        Raises:
+            ImportError: If watchdog is not installed
         """
+        try:
+            from watchdog.observers import Observer
+            from watchdog.observers.polling import PollingObserver
+        except ImportError as e:
+            raise ImportError(
+                "ApprovedFolderWatcher requires watchdog; "
+                "install it with: pip install 'watchdog>=3.0.0'"
+            ) from e
+
         self.approved_path = approved_path
         self.on_new_item = on_new_item
         self.poll_interval = poll_interval
-        self._stop_event = threading.Event()
-        self._thread: Optional[threading.Thread] = None
-        self._use_watchdog = self._check_watchdog()
-        self._known_files: set[str] = set()
-
-    def _check_watchdog(self) -> bool:
-        """Check if watchdog is available."""
-        try:
-            import watchdog
-            return True
-        except ImportError:
-            logger.info("watchdog not installed, using polling fallback")
-            return False
+        self._task: Optional[asyncio.Task] = None
+        # watchdog picks the native observer for the platform, or its own
+        # stat-everything poller when there is none
+        self._use_watchdog = not issubclass(Observer, PollingObserver)
 
     def start(self) -> None:
-        """Start watching the approved/ folder."""
-        if self._thread and self._thread.is_alive():
+        """
+        Start watching the approved/ folder.
+
+        Must be called from the event loop; on_new_item is invoked on
+        that loop.
+        """
+        if self.is_running():
             logger.warning("Watcher already running")
             return
 
-        # Initialize known files
-        self._known_files = set()
-        if self.approved_path.exists():
-            self._known_files = {
-                f.name for f in self.approved_path.glob("*.json")
-            }
-
-        self._stop_event.clear()
-
-        if self._use_watchdog:
-            self._thread = threading.Thread(
-                target=self._run_watchdog,
-                daemon=True,
-                name="approved-watcher"
-            )
-        else:
-            self._thread = threading.Thread(
-                target=self._run_polling,
-                daemon=True,
-                name="approved-watcher-poll"
-            )
-
-        self._thread.start()
+        self._task = asyncio.get_running_loop().create_task(
+            self._run_async(),
+            name="approved-watcher"
+        )
         logger.info(f"Started watching {self.approved_path}")
 
-    def stop(self) -> None:
+    async def stop(self) -> None:
         """Stop the watcher."""
-        self._stop_event.set()
-        if self._thread:
-            self._thread.join(timeout=5.0)
-            self._thread = None
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
         logger.info("Watcher stopped")
 
-    def _run_watchdog(self) -> None:
+    async def _run_async(self) -> None:
+        """Run the watchdog-based or polling watcher until cancelled."""
+        if self._use_watchdog:
+            await self._run_watchdog()
+        else:
+            await self._run_polling()
+
+    async def _run_watchdog(self) -> None:
         """Run the watchdog-based watcher."""
-        from watchdog.events import FileSystemEventHandler, FileCreatedEvent
+        from watchdog.events import FileSystemEvent, FileSystemEventHandler
         from watchdog.observers import Observer
 
+        loop = asyncio.get_running_loop()
+
         class Handler(FileSystemEventHandler):
             def __init__(handler_self, watcher: "ApprovedFolderWatcher"):
                 handler_self.watcher = watcher
 
-            def on_created(handler_self, event: FileCreatedEvent) -> None:
+            def on_created(handler_self, event: FileSystemEvent) -> None:
                 if event.is_directory:
                     return
-                path = Path(event.src_path)
-                if path.suffix.lower() == ".json":
-                    logger.info(f"New file detected: {path.name}")
-                    handler_self.watcher.on_new_item(path)
+                handler_self._dispatch(Path(event.src_path))
+
+            # A file may still be empty or partly written when it is
+            # created; it is offered again once written and closed
+            on_modified = on_created
+            on_closed = on_created
+
+            def on_moved(handler_self, event: FileSystemEvent) -> None:
+                # Files renamed into place (atomic writes) arrive as moves
+                if event.is_directory:
+                    return
+                handler_self._dispatch(Path(event.dest_path))
+
+            def _dispatch(handler_self, path: Path) -> None:
+                # Runs on watchdog's thread; hand the path to the event loop
+                if path.parent == handler_self.watcher.approved_path and \
+                        path.suffix.lower() == ".json":
+                    logger.debug(f"File event: {path.name}")
+                    loop.call_soon_threadsafe(handler_self.watcher.on_new_item, path)
 
         observer = Observer()
         observer.schedule(
@@ -113,35 +132,42 @@ class ApprovedFolderWatcher:
         observer.start()
 
         try:
-            while not self._stop_event.is_set():
-                self._stop_event.wait(1.0)
+            await loop.create_future()  # Until cancelled
         finally:
             observer.stop()
-            observer.join()
+            await asyncio.to_thread(observer.join)
+
+    async def _run_polling(self) -> None:
+        """Run the polling-based watcher (platforms without native events)."""
+        known_files = self._list_json_names()
 
-    def _run_polling(self) -> None:
-        """Run the polling-based watcher (fallback)."""
-        while not self._stop_event.is_set():
+        while True:
+            await asyncio.sleep(self.poll_interval)
             try:
-                if self.approved_path.exists():
-                    current_files = {
-                        f.name for f in self.approved_path.glob("*.json")
-                    }
+                current_files = self._list_json_names()
 
-                    # Find new files
-                    new_files = current_files - self._known_files
-                    for filename in new_files:
-                        path = self.approved_path / filename
-                        logger.info(f"New file detected (poll): {filename}")
-                        self.on_new_item(path)
+                for filename in current_files - known_files:
+                    logger.info(f"New file detected (poll): {filename}")
+                    self.on_new_item(self.approved_path / filename)
 
-                    self._known_files = current_files
+                known_files = current_files
 
             except Exception as e:
                 logger.error(f"Error in polling loop: {e}")
 
-            self._stop_event.wait(self.poll_interval)
+    def _list_json_names(self) -> frozenset[str]:
+        """Names of the .json files in approved/, without stat calls."""
+        try:
+            with os.scandir(self.approved_path) as entries:
+                # is_file() is answered from the directory entry's d_type
+                return frozenset(
+                    entry.name for entry in entries
+                    if entry.name.lower().endswith(".json")
+                    and entry.is_file(follow_symlinks=False)
+                )
+        except FileNotFoundError:
+            return frozenset()
 
     def is_running(self) -> bool:
         """Check if watcher is running."""
-        return self._thread is not None and self._thread.is_alive()
+        return self._task is not None and not self._task.done()
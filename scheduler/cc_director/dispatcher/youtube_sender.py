@@ -3,11 +3,14 @@
 import asyncio
 import logging
 import os
-import sqlite3
+import subprocess
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from .media import TEMP_MEDIA_DIR, extract_media
+from .process import run_command
+
 logger = logging.getLogger("cc_director.dispatcher.youtube")
 
 
@@ -20,10 +23,12 @@ def _bin_dir() -> Path:
 
 
 CC_YOUTUBE_PATH = _bin_dir() / "cc-youtube.exe"
-TEMP_MEDIA_DIR = Path(os.environ.get("TEMP", r"C:\temp")) / "cc_director_media"
+
+# Video uploads can take far longer than the default command timeout
+UPLOAD_TIMEOUT_SECONDS = 1800.0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SendResult:
     """Result of a send operation."""
 
@@ -192,22 +197,15 @@ class YouTubeSender:
             return None
 
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.execute(
-                "SELECT filename, data FROM media WHERE id = ?",
-                (media_id,)
+            # Streamed in chunks off the event loop; videos can be large
+            temp_path = await asyncio.to_thread(
+                extract_media, self.db_path, media_id, TEMP_MEDIA_DIR
             )
-            row = cursor.fetchone()
-            conn.close()
 
-            if not row:
+            if temp_path is None:
                 logger.warning(f"Media ID {media_id} not found in database")
                 return None
 
-            filename, data = row
-            temp_path = TEMP_MEDIA_DIR / f"{media_id}_{filename}"
-            temp_path.write_bytes(data)
-
             logger.info(f"Extracted video to {temp_path}")
             return str(temp_path)
 
@@ -233,25 +231,18 @@ class YouTubeSender:
             logger.info(f"Sending YouTube {action_type}")
             logger.debug(f"Command: {' '.join(cmd[:3])}...")
 
-            result = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await result.communicate()
-
-            stdout_str = stdout.decode() if stdout else ""
-            stderr_str = stderr.decode() if stderr else ""
+            result = await run_command(cmd, timeout=UPLOAD_TIMEOUT_SECONDS)
 
             if result.returncode == 0:
                 logger.info(f"YouTube {action_type} sent successfully")
                 return SendResult(
                     success=True,
-                    message=f"YouTube {action_type} sent",
-                    stdout=stdout_str,
-                    stderr=stderr_str
+                    message=f"YouTube {action_type} sent"
                 )
             else:
+                # Output is only kept (and decoded) when the send failed
+                stdout_str = result.stdout.decode(errors="replace") if result.stdout else ""
+                stderr_str = result.stderr.decode(errors="replace") if result.stderr else ""
                 logger.error(f"YouTube {action_type} failed: {stderr_str}")
                 logger.error(f"stdout: {stdout_str}")
                 return SendResult(
@@ -261,6 +252,13 @@ class YouTubeSender:
                     stderr=stderr_str
                 )
 
+        except subprocess.TimeoutExpired:
+            error_msg = f"YouTube {action_type} timed out"
+            logger.error(error_msg)
+            return SendResult(
+                success=False,
+                message=error_msg
+            )
         except FileNotFoundError:
             error_msg = f"cc-youtube not found at {CC_YOUTUBE_PATH}"
             logger.error(error_msg)
@@ -1,12 +1,28 @@
 """Job execution via subprocess."""
 
+import asyncio
+import functools
+import os
+import shlex
+import signal
 import subprocess
 import sys
+import tempfile
 import time
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, List, Optional, Tuple, Union
+
+# Jobs run in their own process group so a timeout stops the whole tree,
+# not just the immediate child (e.g. the shell of "python x.py | tee log")
+if sys.platform == "win32":
+    _PROCESS_GROUP_KWARGS = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+else:
+    _PROCESS_GROUP_KWARGS = {"start_new_session": True}
+
+# Bytes of each output stream returned in RunResult; the rest stays on disk
+OUTPUT_TAIL_BYTES = 64 * 1024
 
 
 @dataclass
@@ -19,74 +35,265 @@ class RunResult:
     timed_out: bool
     started_at: datetime
     ended_at: datetime
+    # Full output files, when execute_job was given a log_stem
+    stdout_path: Optional[str] = None
+    stderr_path: Optional[str] = None
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_cwd(working_dir: str) -> Path:
+    """
+    Resolve a job's working directory once per distinct value.
+
+    Absolute paths are used as given; resolve() would only walk the
+    path to expand symlinks, which the OS does anyway.
+
+    Args:
+        working_dir: Working directory from the job definition
+
+    Returns:
+        Absolute path to run the job in
+    """
+    path = Path(working_dir)
+    return path if path.is_absolute() else path.resolve()
+
+
+def _open_output(log_stem: Optional[Path]) -> Tuple[BinaryIO, BinaryIO]:
+    """
+    Open the files a job's stdout and stderr are written to.
+
+    Args:
+        log_stem: Path prefix for <stem>.stdout.log / <stem>.stderr.log,
+            or None for anonymous temporary files
+
+    Returns:
+        (stdout file, stderr file), opened for binary read/write
+    """
+    if log_stem is None:
+        return tempfile.TemporaryFile(), tempfile.TemporaryFile()
+
+    log_stem.parent.mkdir(parents=True, exist_ok=True)
+    return (
+        open(f"{log_stem}.stdout.log", "w+b"),
+        open(f"{log_stem}.stderr.log", "w+b"),
+    )
+
+
+def _read_tail(f: BinaryIO) -> str:
+    """
+    Read the last OUTPUT_TAIL_BYTES of an output file as text.
+
+    Args:
+        f: Output file written by the job
+
+    Returns:
+        Decoded tail, prefixed with a marker if earlier output was skipped
+    """
+    size = f.seek(0, os.SEEK_END)
+    f.seek(max(0, size - OUTPUT_TAIL_BYTES))
+    text = f.read().decode(errors="replace")
+    if size > OUTPUT_TAIL_BYTES:
+        return f"[... {size - OUTPUT_TAIL_BYTES} bytes truncated ...]\n{text}"
+    return text
+
+
+def _build_command(command: str) -> Tuple[Union[str, List[str]], bool]:
+    """
+    Build the subprocess arguments for a job command.
+
+    On Windows the command runs through the shell (cmd.exe), so commands
+    like "python script.py" resolve as they would at a prompt. On POSIX
+    it is split with shlex.split() and executed directly, with no shell.
+
+    Args:
+        command: Command from the job definition
+
+    Returns:
+        Tuple of (args, use_shell)
+
+    Raises:
+        ValueError: If the command cannot be split (e.g. unbalanced quotes)
+    """
+    if sys.platform == "win32":
+        return command, True
+    return shlex.split(command), False
+
+
+def _output_path(f: BinaryIO, log_stem: Optional[Path]) -> Optional[str]:
+    """Path of a kept output file, or None for a temporary one."""
+    return f.name if log_stem is not None else None
 
 
 def execute_job(
     command: str,
     working_dir: Optional[str] = None,
     timeout_seconds: int = 300,
+    log_stem: Optional[Path] = None,
 ) -> RunResult:
     """
     Execute a job command in a subprocess.
 
+    Output goes straight to files rather than through pipes, so memory use
+    does not grow with the amount a job prints. Only the last
+    OUTPUT_TAIL_BYTES of each stream are returned. The command is run
+    as described in execute_job_async().
+
     Args:
         command: Command to execute
         working_dir: Working directory for the command
         timeout_seconds: Maximum runtime before killing the process
+        log_stem: Keep the full output in <log_stem>.stdout.log and
+            <log_stem>.stderr.log; temporary files are used if None
 
     Returns:
         RunResult with execution details
     """
     started_at = datetime.now()
+    start_clock = time.monotonic()
     timed_out = False
     exit_code = None
     stdout = ""
     stderr = ""
 
     # Resolve working directory
-    cwd = Path(working_dir).resolve() if working_dir else None
+    cwd = _resolve_cwd(working_dir) if working_dir else None
+
+    out_file, err_file = _open_output(log_stem)
+    with out_file, err_file:
+        try:
+            args, use_shell = _build_command(command)
+            process = subprocess.Popen(
+                args,
+                shell=use_shell,
+                cwd=cwd,
+                stdout=out_file,
+                stderr=err_file,
+                **_PROCESS_GROUP_KWARGS,
+            )
 
-    # Build command for subprocess
-    # On Windows, we need shell=True for commands like "python script.py"
-    # On Unix, we can use shell=False with shlex.split for security
-    use_shell = sys.platform == "win32"
+            try:
+                exit_code = process.wait(timeout=timeout_seconds)
+            except subprocess.TimeoutExpired:
+                timed_out = True
+                _kill_process(process)
+                exit_code = None
 
-    try:
-        process = subprocess.Popen(
-            command,
-            shell=use_shell,
-            cwd=cwd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-        )
+            stdout = _read_tail(out_file)
+            stderr = _read_tail(err_file)
+
+        except FileNotFoundError as e:
+            stderr = f"Command not found: {e}"
+            exit_code = 127
+        except PermissionError as e:
+            stderr = f"Permission denied: {e}"
+            exit_code = 126
+        except (OSError, ValueError) as e:
+            # ValueError: unbalanced quotes in the command (shlex.split)
+            stderr = f"OS error: {e}"
+            exit_code = 1
+
+    ended_at = datetime.now()
+    # Monotonic, so a wall-clock change during the run can't skew it
+    duration_seconds = time.monotonic() - start_clock
+
+    return RunResult(
+        exit_code=exit_code,
+        stdout=stdout,
+        stderr=stderr,
+        duration_seconds=duration_seconds,
+        timed_out=timed_out,
+        started_at=started_at,
+        ended_at=ended_at,
+        stdout_path=_output_path(out_file, log_stem),
+        stderr_path=_output_path(err_file, log_stem),
+    )
+
+
+async def execute_job_async(
+    command: str,
+    working_dir: Optional[str] = None,
+    timeout_seconds: int = 300,
+    log_stem: Optional[Path] = None,
+) -> RunResult:
+    """
+    Execute a job command without blocking the event loop.
+
+    Used by the service for every scheduled job; the loop keeps serving
+    other tasks while the job runs.
+
+    The command is run the same way as in execute_job():
+
+    - Windows: through the shell (cmd.exe).
+    - POSIX: split with shlex.split() and executed directly, with no
+      shell. Pipes, &&, redirects, globs and $VAR expansion are not
+      available; wrap the command as sh -c '...' to use them. A command
+      that cannot be split (e.g. unbalanced quotes) fails with
+      exit_code 1 and the error in stderr.
 
+    Args:
+        command: Command to execute
+        working_dir: Working directory for the command
+        timeout_seconds: Maximum runtime before killing the process
+        log_stem: Keep the full output in <log_stem>.stdout.log and
+            <log_stem>.stderr.log; temporary files are used if None
+
+    Returns:
+        RunResult with execution details
+    """
+    started_at = datetime.now()
+    start_clock = time.monotonic()
+    timed_out = False
+    exit_code = None
+    stdout = ""
+    stderr = ""
+
+    cwd = _resolve_cwd(working_dir) if working_dir else None
+
+    out_file, err_file = _open_output(log_stem)
+    with out_file, err_file:
         try:
-            stdout, stderr = process.communicate(timeout=timeout_seconds)
-            exit_code = process.returncode
-        except subprocess.TimeoutExpired:
-            timed_out = True
-            _kill_process(process)
-            # Try to capture any output that was written before timeout
+            args, use_shell = _build_command(command)
+            if use_shell:
+                process = await asyncio.create_subprocess_shell(
+                    args,
+                    cwd=cwd,
+                    stdout=out_file,
+                    stderr=err_file,
+                    **_PROCESS_GROUP_KWARGS,
+                )
+            else:
+                process = await asyncio.create_subprocess_exec(
+                    *args,
+                    cwd=cwd,
+                    stdout=out_file,
+                    stderr=err_file,
+                    **_PROCESS_GROUP_KWARGS,
+                )
+
             try:
-                stdout, stderr = process.communicate(timeout=5)
-            except subprocess.TimeoutExpired:
-                stdout = ""
-                stderr = "Process killed due to timeout"
-            exit_code = None
-
-    except FileNotFoundError as e:
-        stderr = f"Command not found: {e}"
-        exit_code = 127
-    except PermissionError as e:
-        stderr = f"Permission denied: {e}"
-        exit_code = 126
-    except OSError as e:
-        stderr = f"OS error: {e}"
-        exit_code = 1
+                exit_code = await asyncio.wait_for(process.wait(), timeout_seconds)
+            except asyncio.TimeoutError:
+                timed_out = True
+                await _kill_process_async(process)
+                exit_code = None
+
+            stdout = _read_tail(out_file)
+            stderr = _read_tail(err_file)
+
+        except FileNotFoundError as e:
+            stderr = f"Command not found: {e}"
+            exit_code = 127
+        except PermissionError as e:
+            stderr = f"Permission denied: {e}"
+            exit_code = 126
+        except (OSError, ValueError) as e:
+            # ValueError: unbalanced quotes in the command (shlex.split)
+            stderr = f"OS error: {e}"
+            exit_code = 1
 
     ended_at = datetime.now()
-    duration_seconds = (ended_at - started_at).total_seconds()
+    # Monotonic, so a wall-clock change during the run can't skew it
+    duration_seconds = time.monotonic() - start_clock
 
     return RunResult(
         exit_code=exit_code,
@@ -96,26 +303,104 @@ def execute_job(
         timed_out=timed_out,
         started_at=started_at,
         ended_at=ended_at,
+        stdout_path=_output_path(out_file, log_stem),
+        stderr_path=_output_path(err_file, log_stem),
     )
 
 
+def _terminate_group(pid: int) -> bool:
+    """
+    Ask every process in a job's process group to exit.
+
+    Args:
+        pid: PID of the group leader (the job's immediate child)
+
+    Returns:
+        False if the group no longer exists
+    """
+    try:
+        if sys.platform == "win32":
+            os.kill(pid, signal.CTRL_BREAK_EVENT)
+        else:
+            os.killpg(pid, signal.SIGTERM)
+    except (ProcessLookupError, PermissionError):
+        return False
+    return True
+
+
+def _kill_group(pid: int) -> None:
+    """
+    Forcefully kill every process in a job's process group.
+
+    Args:
+        pid: PID of the group leader (the job's immediate child)
+    """
+    try:
+        if sys.platform == "win32":
+            subprocess.run(
+                ["taskkill", "/F", "/T", "/PID", str(pid)],
+                capture_output=True,
+            )
+        else:
+            os.killpg(pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+async def _kill_group_async(pid: int) -> None:
+    """
+    Forcefully kill a job's process group from async code.
+
+    taskkill is a blocking child process on Windows, so it runs on a
+    worker thread; killpg returns at once and is called directly.
+
+    Args:
+        pid: PID of the group leader (the job's immediate child)
+    """
+    if sys.platform == "win32":
+        await asyncio.to_thread(_kill_group, pid)
+    else:
+        _kill_group(pid)
+
+
 def _kill_process(process: subprocess.Popen) -> None:
     """
-    Kill a process, trying graceful termination first.
+    Kill a process and its children, trying graceful termination first.
 
     Args:
         process: The subprocess to kill
     """
-    # Try SIGTERM first (graceful)
-    process.terminate()
+    # Try SIGTERM / CTRL_BREAK first (graceful)
+    if not _terminate_group(process.pid):
+        return
 
     # Give it a moment to terminate gracefully
     try:
         process.wait(timeout=5)
     except subprocess.TimeoutExpired:
         # Force kill if it didn't terminate
-        process.kill()
+        _kill_group(process.pid)
         try:
             process.wait(timeout=5)
         except subprocess.TimeoutExpired:
             pass  # Process is stuck, nothing more we can do
+
+
+async def _kill_process_async(process: asyncio.subprocess.Process) -> None:
+    """
+    Kill an asyncio subprocess and its children, trying graceful termination first.
+
+    Args:
+        process: The subprocess to kill
+    """
+    if not _terminate_group(process.pid):
+        return
+
+    try:
+        await asyncio.wait_for(process.wait(), 5)
+    except asyncio.TimeoutError:
+        await _kill_group_async(process.pid)
+        try:
+            await asyncio.wait_for(process.wait(), 5)
+        except asyncio.TimeoutError:
+            pass  # Process is stuck, nothing more we can do
@@ -1,8 +1,10 @@
 """FastAPI application for CC Director Gateway."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -11,10 +13,21 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
 from ..database import Database
+from .job_cache import JobCache
 from .routes import jobs, runs, system, websocket
 
 logger = logging.getLogger("cc_director.gateway")
 
+# Threads running database calls for route handlers (see routes.run_db)
+DB_EXECUTOR_WORKERS = 8
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Stop the database thread pool when the server shuts down."""
+    yield
+    app.state.db_executor.shutdown(wait=False, cancel_futures=True)
+
 
 def create_app(db: Database, running_jobs: Optional[set] = None) -> FastAPI:
     """
@@ -33,11 +46,17 @@ def create_app(db: Database, running_jobs: Optional[set] = None) -> FastAPI:
         version="0.1.0",
         docs_url="/api/docs",
         redoc_url="/api/redoc",
+        lifespan=_lifespan,
     )
 
     # Store database in app state
     app.state.db = db
+    app.state.job_cache = JobCache(db)
     app.state.running_jobs = running_jobs or set()
+    app.state.db_executor = ThreadPoolExecutor(
+        max_workers=DB_EXECUTOR_WORKERS,
+        thread_name_prefix="cc-db",
+    )
 
     # CORS middleware - allow localhost origins for development
     app.add_middleware(
@@ -51,17 +70,13 @@ def create_app(db: Database, running_jobs: Optional[set] = None) -> FastAPI:
         allow_headers=["*"],
     )
 
-    # Static files and templates
+    # Static files and templates ship with the package (setup.py package_data,
+    # the PyInstaller spec); StaticFiles raises if they are missing
     gateway_dir = Path(__file__).parent
     static_dir = gateway_dir / "static"
     templates_dir = gateway_dir / "templates"
 
-    # Create directories if they don't exist
-    static_dir.mkdir(exist_ok=True)
-    templates_dir.mkdir(exist_ok=True)
-
-    if static_dir.exists():
-        app.mount("/static", StaticFiles(directory=static_dir), name="static")
+    app.mount("/static", StaticFiles(directory=static_dir), name="static")
 
     templates = Jinja2Templates(directory=str(templates_dir))
     app.state.templates = templates
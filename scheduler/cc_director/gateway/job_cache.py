@@ -0,0 +1,66 @@
+"""In-memory job snapshot for the gateway's read endpoints."""
+
+import threading
+from typing import Optional
+
+from ..database import Database, Job, _split_tags
+
+
+class JobCache:
+    """
+    Jobs by name, loaded from the database and reused until it changes.
+
+    Writes made by other connections (the scheduler thread, the CLI) are
+    detected through PRAGMA data_version, which costs no table reads.
+    data_version is per connection and Database keeps one connection per
+    thread, so the last value seen is tracked per thread. A connection's
+    own writes do not change its data_version, so the write endpoints
+    call invalidate().
+
+    Returned Job objects are shared; callers must not modify them.
+    """
+
+    def __init__(self, db: Database):
+        """
+        Initialize the cache.
+
+        Args:
+            db: Database the jobs are read from
+        """
+        self._db = db
+        self._lock = threading.RLock()
+        self._jobs: Optional[dict[str, Job]] = None
+        self._tags: dict[str, frozenset[str]] = {}
+        self._local = threading.local()
+
+    def get(self, name: str) -> Optional[Job]:
+        """Get a job by name."""
+        return self._current().get(name)
+
+    def list(self, include_disabled: bool = False, tag: Optional[str] = None) -> list[Job]:
+        """List jobs ordered by name, optionally filtering by enabled status and tag."""
+        with self._lock:
+            jobs = self._current()
+            tag = tag.strip() if tag else None
+            return [
+                job for name, job in jobs.items()
+                if (include_disabled or job.enabled)
+                and (not tag or tag in self._tags[name])
+            ]
+
+    def invalidate(self) -> None:
+        """Drop the snapshot so the next read reloads it."""
+        with self._lock:
+            self._jobs = None
+
+    def _current(self) -> dict[str, Job]:
+        """Return the snapshot, reloading it if the database has changed."""
+        with self._lock:
+            conn = self._db.connect()
+            data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+            if self._jobs is None or data_version != getattr(self._local, "data_version", None):
+                jobs = self._db.list_jobs(include_disabled=True)
+                self._jobs = {job.name: job for job in jobs}
+                self._tags = {job.name: frozenset(_split_tags(job.tags)) for job in jobs}
+                self._local.data_version = data_version
+            return self._jobs
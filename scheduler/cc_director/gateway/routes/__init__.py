@@ -1 +1,26 @@
 """API route modules."""
+
+import asyncio
+import functools
+from typing import Any, Callable
+
+from fastapi import Request
+
+
+async def run_db(request: Request, call: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Run a blocking database call on the app's database thread pool.
+
+    Args:
+        request: Current request (for app.state.db_executor)
+        call: Database (or job cache) method to call
+        *args: Positional arguments for call
+        **kwargs: Keyword arguments for call
+
+    Returns:
+        Whatever call returns
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        request.app.state.db_executor,
+        functools.partial(call, *args, **kwargs),
+    )
@@ -3,11 +3,12 @@
 from datetime import datetime
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException, Request
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, HTTPException, Request, Response
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 from ...cron import calculate_next_run
 from ...database import Job
+from . import run_db
 
 router = APIRouter()
 
@@ -35,6 +36,8 @@ class JobUpdate(BaseModel):
 
 class JobResponse(BaseModel):
     """Response model for a job."""
+    model_config = ConfigDict(frozen=True)
+
     id: int
     name: str
     cron: str
@@ -49,9 +52,13 @@ class JobResponse(BaseModel):
     is_running: bool = False
 
 
+# Serialises job lists straight to JSON bytes
+_JOB_LIST_ADAPTER = TypeAdapter(list[JobResponse])
+
+
 def _job_to_response(job: Job, running_jobs: set) -> JobResponse:
-    """Convert a Job dataclass to a response model."""
-    return JobResponse(
+    """Convert a Job dataclass to a response model (no validation; DB data)."""
+    return JobResponse.model_construct(
         id=job.id,
         name=job.name,
         cron=job.cron,
@@ -74,18 +81,21 @@ async def list_jobs(
     tag: Optional[str] = None,
 ):
     """List all jobs."""
-    db = request.app.state.db
+    job_cache = request.app.state.job_cache
     running_jobs = request.app.state.running_jobs
-    jobs = db.list_jobs(include_disabled=include_disabled, tag=tag)
-    return [_job_to_response(job, running_jobs) for job in jobs]
+    jobs = await run_db(request, job_cache.list, include_disabled=include_disabled, tag=tag)
+    return Response(
+        _JOB_LIST_ADAPTER.dump_json([_job_to_response(job, running_jobs) for job in jobs]),
+        media_type="application/json",
+    )
 
 
 @router.get("/{name}", response_model=JobResponse)
 async def get_job(request: Request, name: str):
     """Get a job by name."""
-    db = request.app.state.db
+    job_cache = request.app.state.job_cache
     running_jobs = request.app.state.running_jobs
-    job = db.get_job(name)
+    job = await run_db(request, job_cache.get, name)
     if job is None:
         raise HTTPException(status_code=404, detail=f"Job '{name}' not found")
     return _job_to_response(job, running_jobs)
@@ -98,7 +108,7 @@ async def create_job(request: Request, job_data: JobCreate):
     running_jobs = request.app.state.running_jobs
 
     # Check if job with same name already exists
-    existing = db.get_job(job_data.name)
+    existing = await run_db(request, db.get_job, job_data.name)
     if existing is not None:
         raise HTTPException(
             status_code=409,
@@ -129,12 +139,11 @@ async def create_job(request: Request, job_data: JobCreate):
         next_run=next_run,
     )
 
-    job_id = db.add_job(job)
-    job.id = job_id
+    # Fills in id and timestamps
+    await run_db(request, db.add_job, job)
+    request.app.state.job_cache.invalidate()
 
-    # Re-fetch to get timestamps
-    created_job = db.get_job_by_id(job_id)
-    return _job_to_response(created_job, running_jobs)
+    return _job_to_response(job, running_jobs)
 
 
 @router.put("/{name}", response_model=JobResponse)
@@ -143,7 +152,7 @@ async def update_job(request: Request, name: str, job_data: JobUpdate):
     db = request.app.state.db
     running_jobs = request.app.state.running_jobs
 
-    job = db.get_job(name)
+    job = await run_db(request, db.get_job, name)
     if job is None:
         raise HTTPException(status_code=404, detail=f"Job '{name}' not found")
 
@@ -163,17 +172,20 @@ async def update_job(request: Request, name: str, job_data: JobUpdate):
     if job_data.working_dir is not None:
         job.working_dir = job_data.working_dir
     if job_data.enabled is not None:
+        if job_data.enabled and not job.enabled and job_data.cron is None:
+            # A disabled job's stored next_run is stale; schedule from now
+            job.next_run = calculate_next_run(job.cron)
         job.enabled = job_data.enabled
     if job_data.timeout_seconds is not None:
         job.timeout_seconds = job_data.timeout_seconds
     if job_data.tags is not None:
         job.tags = job_data.tags
 
-    db.update_job(job)
+    # Refreshes updated_at
+    await run_db(request, db.update_job, job)
+    request.app.state.job_cache.invalidate()
 
-    # Re-fetch to get updated timestamps
-    updated_job = db.get_job_by_id(job.id)
-    return _job_to_response(updated_job, running_jobs)
+    return _job_to_response(job, running_jobs)
 
 
 @router.delete("/{name}", status_code=204)
@@ -181,8 +193,9 @@ async def delete_job(request: Request, name: str):
     """Delete a job."""
     db = request.app.state.db
 
-    if not db.delete_job(name):
+    if not await run_db(request, db.delete_job, name):
         raise HTTPException(status_code=404, detail=f"Job '{name}' not found")
+    request.app.state.job_cache.invalidate()
 
 
 @router.post("/{name}/enable", response_model=JobResponse)
@@ -191,10 +204,17 @@ async def enable_job(request: Request, name: str):
     db = request.app.state.db
     running_jobs = request.app.state.running_jobs
 
-    if not db.set_job_enabled(name, True):
+    job = await run_db(request, db.get_job, name)
+    if job is None:
         raise HTTPException(status_code=404, detail=f"Job '{name}' not found")
 
-    job = db.get_job(name)
+    if not job.enabled:
+        # Schedule from now, as the stored next_run is stale (or unset)
+        job.enabled = True
+        job.next_run = calculate_next_run(job.cron)
+        await run_db(request, db.update_job, job)
+        request.app.state.job_cache.invalidate()
+
     return _job_to_response(job, running_jobs)
 
 
@@ -204,10 +224,11 @@ async def disable_job(request: Request, name: str):
     db = request.app.state.db
     running_jobs = request.app.state.running_jobs
 
-    if not db.set_job_enabled(name, False):
+    if not await run_db(request, db.set_job_enabled, name, False):
         raise HTTPException(status_code=404, detail=f"Job '{name}' not found")
+    request.app.state.job_cache.invalidate()
 
-    job = db.get_job(name)
+    job = await run_db(request, db.get_job, name)
     return _job_to_response(job, running_jobs)
 
 
@@ -220,8 +241,9 @@ async def trigger_job(request: Request, name: str):
     on the next scheduler check.
     """
     db = request.app.state.db
+    job_cache = request.app.state.job_cache
 
-    job = db.get_job(name)
+    job = await run_db(request, job_cache.get, name)
     if job is None:
         raise HTTPException(status_code=404, detail=f"Job '{name}' not found")
 
@@ -232,6 +254,7 @@ async def trigger_job(request: Request, name: str):
         )
 
     # Set next_run to now
-    db.update_next_run(job.id, datetime.now())
+    await run_db(request, db.update_next_run, job.id, datetime.now())
+    job_cache.invalidate()
 
     return {"message": f"Job '{name}' triggered for immediate execution"}
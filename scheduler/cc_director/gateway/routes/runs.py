@@ -3,16 +3,19 @@
 from datetime import datetime
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException, Request
-from pydantic import BaseModel
+from fastapi import APIRouter, HTTPException, Request, Response
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 from ...database import Run
+from . import run_db
 
 router = APIRouter()
 
 
 class RunResponse(BaseModel):
     """Response model for a run."""
+    model_config = ConfigDict(frozen=True)
+
     id: int
     job_id: int
     job_name: str
@@ -26,8 +29,12 @@ class RunResponse(BaseModel):
     status: str  # running, success, failed, timeout
 
 
+# Serialises run lists straight to JSON bytes
+_RUN_LIST_ADAPTER = TypeAdapter(list[RunResponse])
+
+
 def _run_to_response(run: Run) -> RunResponse:
-    """Convert a Run dataclass to a response model."""
+    """Convert a Run dataclass to a response model (no validation; DB data)."""
     if run.ended_at is None:
         status = "running"
     elif run.timed_out:
@@ -37,7 +44,7 @@ def _run_to_response(run: Run) -> RunResponse:
     else:
         status = "failed"
 
-    return RunResponse(
+    return RunResponse.model_construct(
         id=run.id,
         job_id=run.job_id,
         job_name=run.job_name,
@@ -52,6 +59,14 @@ def _run_to_response(run: Run) -> RunResponse:
     )
 
 
+def _run_list_response(runs: list[Run]) -> Response:
+    """Serialise runs to a JSON response without revalidating them."""
+    return Response(
+        _RUN_LIST_ADAPTER.dump_json([_run_to_response(run) for run in runs]),
+        media_type="application/json",
+    )
+
+
 @router.get("", response_model=list[RunResponse])
 async def list_runs(
     request: Request,
@@ -68,19 +83,21 @@ async def list_runs(
         failed_only: Only return failed/timed-out runs
     """
     db = request.app.state.db
-    runs = db.list_runs(
+    runs = await run_db(
+        request,
+        db.list_runs,
         job_name=job_name,
         limit=limit,
         failed_only=failed_only,
     )
-    return [_run_to_response(run) for run in runs]
+    return _run_list_response(runs)
 
 
 @router.get("/{run_id}", response_model=RunResponse)
 async def get_run(request: Request, run_id: int):
     """Get a run by ID."""
     db = request.app.state.db
-    run = db.get_run(run_id)
+    run = await run_db(request, db.get_run, run_id)
     if run is None:
         raise HTTPException(status_code=404, detail=f"Run {run_id} not found")
     return _run_to_response(run)
@@ -96,12 +113,12 @@ async def get_runs_for_job(
     db = request.app.state.db
 
     # Verify job exists
-    job = db.get_job(job_name)
+    job = await run_db(request, request.app.state.job_cache.get, job_name)
     if job is None:
         raise HTTPException(status_code=404, detail=f"Job '{job_name}' not found")
 
-    runs = db.list_runs(job_name=job_name, limit=limit)
-    return [_run_to_response(run) for run in runs]
+    runs = await run_db(request, db.list_runs, job_name=job_name, limit=limit)
+    return _run_list_response(runs)
 
 
 class RunStats(BaseModel):
@@ -122,18 +139,12 @@ async def get_run_stats(request: Request):
     # Get today's midnight
     today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
 
-    runs = db.list_runs(since=today, limit=1000)
-
-    total = len(runs)
-    successful = sum(1 for r in runs if r.exit_code == 0 and not r.timed_out)
-    failed = sum(1 for r in runs if r.exit_code is not None and r.exit_code != 0)
-    timeout = sum(1 for r in runs if r.timed_out)
-    running = len(running_jobs)
+    stats = await run_db(request, db.get_run_stats, since=today)
 
     return RunStats(
-        total_runs_today=total,
-        successful_runs_today=successful,
-        failed_runs_today=failed,
-        timeout_runs_today=timeout,
-        running_count=running,
+        total_runs_today=stats["total"],
+        successful_runs_today=stats["successful"],
+        failed_runs_today=stats["failed"],
+        timeout_runs_today=stats["timed_out"],
+        running_count=len(running_jobs),
     )
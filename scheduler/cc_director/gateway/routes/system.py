@@ -6,6 +6,8 @@ from typing import Optional
 from fastapi import APIRouter, Request
 from pydantic import BaseModel
 
+from . import run_db
+
 router = APIRouter()
 
 
@@ -69,7 +71,7 @@ async def get_status(request: Request):
     db = request.app.state.db
     running_jobs = request.app.state.running_jobs
 
-    all_jobs = db.list_jobs(include_disabled=True)
+    all_jobs = await run_db(request, request.app.state.job_cache.list, include_disabled=True)
     enabled_jobs = [j for j in all_jobs if j.enabled]
 
     uptime = None
@@ -3,32 +3,77 @@
 import asyncio
 import json
 import logging
+import time
 from datetime import datetime
 from typing import Optional
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger("cc_director.gateway.websocket")
 
 router = APIRouter()
 
+# Seconds between heartbeats sent to every connected client
+HEARTBEAT_INTERVAL_SECONDS = 30.0
+
+# Fixed frames only need the timestamp spliced in
+_HEARTBEAT_PREFIX = '{"type":"heartbeat","timestamp":"'
+_PONG_PREFIX = '{"type":"pong","timestamp":"'
+_TIMESTAMP_SUFFIX = '"}'
+
+
+# (epoch second, ISO 8601 local time) of the last formatted timestamp
+_now_iso_cache: tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    """Current local time as ISO 8601, formatted at most once per second."""
+    global _now_iso_cache
+    second = int(time.time())
+    if second != _now_iso_cache[0]:
+        _now_iso_cache = (second, datetime.fromtimestamp(second).isoformat())
+    return _now_iso_cache[1]
+
+
+def _encode(message: dict) -> str:
+    """Encode a message as JSON text (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(message, default=str).decode()
+    return json.dumps(message, default=str)
+
+
+def _decode(text: str) -> dict:
+    """Decode a client message (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
 
 class ConnectionManager:
     """Manages WebSocket connections."""
 
     def __init__(self):
-        self.active_connections: list[WebSocket] = []
+        self.active_connections: set[WebSocket] = set()
+        self._heartbeat_task: Optional[asyncio.Task] = None
 
     async def connect(self, websocket: WebSocket):
         """Accept a new WebSocket connection."""
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
+        # One heartbeat task serves all clients; it ends when the last leaves
+        if self._heartbeat_task is None or self._heartbeat_task.done():
+            self._heartbeat_task = asyncio.create_task(self._send_heartbeats())
         logger.info(f"WebSocket connected. Total connections: {len(self.active_connections)}")
 
     def disconnect(self, websocket: WebSocket):
         """Remove a WebSocket connection."""
         if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+            self.active_connections.discard(websocket)
             logger.info(f"WebSocket disconnected. Total connections: {len(self.active_connections)}")
 
     async def broadcast(self, message: dict):
@@ -36,19 +81,37 @@ class ConnectionManager:
         if not self.active_connections:
             return
 
-        message_text = json.dumps(message, default=str)
-        disconnected = []
-
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message_text)
-            except Exception as e:
-                logger.warning(f"Failed to send to WebSocket: {e}")
-                disconnected.append(connection)
-
-        # Remove disconnected clients
-        for conn in disconnected:
-            self.disconnect(conn)
+        await self._send_to_all(_encode(message))
+
+    async def _send_heartbeats(self):
+        """Send a heartbeat to all clients every HEARTBEAT_INTERVAL_SECONDS."""
+        while self.active_connections:
+            await asyncio.sleep(HEARTBEAT_INTERVAL_SECONDS)
+            await self._send_to_all(
+                _HEARTBEAT_PREFIX + _now_iso() + _TIMESTAMP_SUFFIX
+            )
+
+    async def _send_to_all(self, message_text: str):
+        """Send already-encoded text to all connected clients."""
+        # Send to all clients at once so one slow client doesn't delay the rest
+        # Snapshot: clients may connect or disconnect while sends are awaited
+        connections = tuple(self.active_connections)
+        results = await asyncio.gather(
+            *(connection.send_text(message_text) for connection in connections),
+            return_exceptions=True,
+        )
+
+        # Remove disconnected clients in one set difference
+        failed = {
+            conn for conn, result in zip(connections, results)
+            if isinstance(result, Exception)
+        }
+        if failed:
+            self.active_connections -= failed
+            logger.info(
+                f"Pruned {len(failed)} dead WebSocket connection(s). "
+                f"Total connections: {len(self.active_connections)}"
+            )
 
 
 # Global connection manager
@@ -84,7 +147,7 @@ async def broadcast_event(
     """
     message = {
         "type": event_type,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _now_iso(),
         "job_name": job_name,
         "run_id": run_id,
         "data": data or {},
@@ -106,28 +169,17 @@ async def websocket_endpoint(websocket: WebSocket):
 
     try:
         while True:
-            # Wait for messages from client (keepalive or commands)
-            try:
-                data = await asyncio.wait_for(
-                    websocket.receive_text(),
-                    timeout=30.0
+            # Wait for messages from client (keepalive or commands);
+            # heartbeats are sent by the manager's shared task
+            data = await websocket.receive_text()
+
+            # Handle ping/pong for keepalive
+            message = _decode(data)
+            if message.get("type") == "ping":
+                await websocket.send_text(
+                    _PONG_PREFIX + _now_iso() + _TIMESTAMP_SUFFIX
                 )
 
-                # Handle ping/pong for keepalive
-                message = json.loads(data)
-                if message.get("type") == "ping":
-                    await websocket.send_text(json.dumps({
-                        "type": "pong",
-                        "timestamp": datetime.now().isoformat(),
-                    }))
-
-            except asyncio.TimeoutError:
-                # Send heartbeat every 30 seconds
-                await websocket.send_text(json.dumps({
-                    "type": EventType.HEARTBEAT,
-                    "timestamp": datetime.now().isoformat(),
-                }))
-
     except WebSocketDisconnect:
         manager.disconnect(websocket)
     except Exception as e:
@@ -1,5 +1,7 @@
 """cc_scheduler CLI - job management for cc_director."""
 
+import functools
+import os
 import sys
 from datetime import datetime, timedelta
 from typing import Optional
@@ -13,10 +15,28 @@ from .executor import execute_job
 
 
 def get_db(config_file: Optional[str] = None) -> Database:
-    """Get database instance from config."""
+    """
+    Get database instance from config.
+
+    The schema DDL and migrations only run when the database is new or out
+    of date, or when CC_DIRECTOR_INIT=1 forces them.
+    """
     config = Config.load(config_file)
     db = Database(str(config.get_db_path()))
-    db.create_tables()
+    if os.environ.get("CC_DIRECTOR_INIT") == "1" or not db.schema_is_current():
+        db.create_tables()
+    return db
+
+
+def get_db_cached(ctx: click.Context) -> Database:
+    """Get the database shared by all commands of this CLI invocation."""
+    root = ctx.find_root()
+    db = root.obj.get("db")
+    if db is None:
+        db = get_db(root.obj.get("config_file"))
+        root.obj["db"] = db
+        # Runs when the CLI exits, including through sys.exit()
+        root.call_on_close(db.close)
     return db
 
 
@@ -24,7 +44,19 @@ def format_datetime(dt: Optional[datetime]) -> str:
     """Format datetime for display."""
     if dt is None:
         return "-"
-    return dt.strftime("%Y-%m-%d %H:%M:%S")
+    # Equal aware datetimes in different time zones hash alike but print
+    # different wall times, so the offset is part of the cache key
+    return _format_datetime(dt, dt.utcoffset())
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_datetime(dt: datetime, utcoffset: Optional[timedelta]) -> str:
+    """Format a datetime; cached by format_datetime()."""
+    if dt.tzinfo is not None:
+        return dt.strftime("%Y-%m-%d %H:%M:%S")
+    # Same text as the strftime pattern above for naive datetimes, without
+    # strftime's format-string parsing
+    return dt.isoformat(sep=" ", timespec="seconds")
 
 
 def format_duration(seconds: Optional[float]) -> str:
@@ -70,7 +102,7 @@ def add(ctx: click.Context, name: str, cron: str, cmd: str,
         click.echo(f"ERROR: Invalid cron expression: {cron}", err=True)
         sys.exit(1)
 
-    db = get_db(ctx.obj.get("config_file"))
+    db = get_db_cached(ctx)
 
     # Check if job already exists
     existing = db.get_job(name)
@@ -99,7 +131,6 @@ def add(ctx: click.Context, name: str, cron: str, cmd: str,
     click.echo(f"Job '{name}' created (ID: {job_id})")
     if next_run:
         click.echo(f"Next run: {format_datetime(next_run)}")
-    db.close()
 
 
 @cli.command("list")
@@ -108,23 +139,26 @@ def add(ctx: click.Context, name: str, cron: str, cmd: str,
 @click.pass_context
 def list_jobs(ctx: click.Context, include_all: bool, tag: Optional[str]) -> None:
     """List all scheduled jobs."""
-    db = get_db(ctx.obj.get("config_file"))
-    jobs = db.list_jobs(include_disabled=include_all, tag=tag)
-    db.close()
+    db = get_db_cached(ctx)
+    jobs = db.list_jobs_summary(include_disabled=include_all, tag=tag)
 
     if not jobs:
         click.echo("No jobs found")
         return
 
-    # Header
-    click.echo(f"{'ID':<4} {'NAME':<25} {'CRON':<15} {'ENABLED':<8} {'NEXT RUN':<20} {'TAGS'}")
-    click.echo("-" * 90)
+    # Header, then rows; written with one echo rather than one per row
+    lines = [
+        f"{'ID':<4} {'NAME':<25} {'CRON':<15} {'ENABLED':<8} {'NEXT RUN':<20} {'TAGS'}",
+        "-" * 90,
+    ]
 
-    for job in jobs:
-        enabled = "yes" if job.enabled else "no"
-        next_run = format_datetime(job.next_run)
-        tags = job.tags or ""
-        click.echo(f"{job.id:<4} {job.name:<25} {job.cron:<15} {enabled:<8} {next_run:<20} {tags}")
+    for job_id, name, cron, enabled, next_run, tags in jobs:
+        enabled = "yes" if enabled else "no"
+        next_run = format_datetime(next_run)
+        tags = tags or ""
+        lines.append(f"{job_id:<4} {name:<25} {cron:<15} {enabled:<8} {next_run:<20} {tags}")
+
+    click.echo("\n".join(lines))
 
 
 @cli.command()
@@ -132,7 +166,7 @@ def list_jobs(ctx: click.Context, include_all: bool, tag: Optional[str]) -> None
 @click.pass_context
 def show(ctx: click.Context, name: str) -> None:
     """Show detailed information about a job."""
-    db = get_db(ctx.obj.get("config_file"))
+    db = get_db_cached(ctx)
     job = db.get_job(name)
 
     if not job:
@@ -161,8 +195,6 @@ def show(ctx: click.Context, name: str) -> None:
         click.echo(f"\nLast Run:     {format_datetime(last_run.started_at)} - {status}")
         click.echo(f"Duration:     {format_duration(last_run.duration_seconds)}")
 
-    db.close()
-
 
 @cli.command()
 @click.argument("name")
@@ -176,7 +208,7 @@ def edit(ctx: click.Context, name: str, cron: Optional[str], cmd: Optional[str],
          working_dir: Optional[str], timeout: Optional[int],
          tags: Optional[str]) -> None:
     """Edit an existing job."""
-    db = get_db(ctx.obj.get("config_file"))
+    db = get_db_cached(ctx)
     job = db.get_job(name)
 
     if not job:
@@ -203,7 +235,6 @@ def edit(ctx: click.Context, name: str, cron: Optional[str], cmd: Optional[str],
 
     db.update_job(job)
     click.echo(f"Job '{name}' updated")
-    db.close()
 
 
 @cli.command()
@@ -211,7 +242,7 @@ def edit(ctx: click.Context, name: str, cron: Optional[str], cmd: Optional[str],
 @click.pass_context
 def enable(ctx: click.Context, name: str) -> None:
     """Enable a job."""
-    db = get_db(ctx.obj.get("config_file"))
+    db = get_db_cached(ctx)
     job = db.get_job(name)
 
     if not job:
@@ -221,21 +252,20 @@ def enable(ctx: click.Context, name: str) -> None:
     if job.enabled:
         click.echo(f"Job '{name}' is already enabled")
     else:
-        db.set_job_enabled(name, True)
         # Set next run time
         next_run = calculate_next_run(job.cron)
-        db.update_next_run(job.id, next_run)
+        with db.transaction():
+            db.set_job_enabled(name, True)
+            db.update_next_run(job.id, next_run)
         click.echo(f"Job '{name}' enabled. Next run: {format_datetime(next_run)}")
 
-    db.close()
-
 
 @cli.command()
 @click.argument("name")
 @click.pass_context
 def disable(ctx: click.Context, name: str) -> None:
     """Disable a job."""
-    db = get_db(ctx.obj.get("config_file"))
+    db = get_db_cached(ctx)
 
     if not db.get_job(name):
         click.echo(f"ERROR: Job '{name}' not found", err=True)
@@ -243,7 +273,6 @@ def disable(ctx: click.Context, name: str) -> None:
 
     db.set_job_enabled(name, False)
     click.echo(f"Job '{name}' disabled")
-    db.close()
 
 
 @cli.command()
@@ -252,7 +281,7 @@ def disable(ctx: click.Context, name: str) -> None:
 @click.pass_context
 def delete(ctx: click.Context, name: str, force: bool) -> None:
     """Delete a job."""
-    db = get_db(ctx.obj.get("config_file"))
+    db = get_db_cached(ctx)
 
     if not db.get_job(name):
         click.echo(f"ERROR: Job '{name}' not found", err=True)
@@ -265,7 +294,6 @@ def delete(ctx: click.Context, name: str, force: bool) -> None:
 
     db.delete_job(name)
     click.echo(f"Job '{name}' deleted")
-    db.close()
 
 
 # ============================================================================
@@ -282,7 +310,7 @@ def delete(ctx: click.Context, name: str, force: bool) -> None:
 def runs(ctx: click.Context, job_name: Optional[str], limit: int,
          failed: bool, today: bool, since: Optional[datetime]) -> None:
     """List recent job runs."""
-    db = get_db(ctx.obj.get("config_file"))
+    db = get_db_cached(ctx)
 
     if today:
         since = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
@@ -293,15 +321,16 @@ def runs(ctx: click.Context, job_name: Optional[str], limit: int,
         failed_only=failed,
         since=since,
     )
-    db.close()
 
     if not run_list:
         click.echo("No runs found")
         return
 
-    # Header
-    click.echo(f"{'ID':<6} {'JOB':<25} {'STARTED':<20} {'EXIT':<6} {'DURATION':<10} {'STATUS'}")
-    click.echo("-" * 85)
+    # Header, then rows; written with one echo rather than one per row
+    lines = [
+        f"{'ID':<6} {'JOB':<25} {'STARTED':<20} {'EXIT':<6} {'DURATION':<10} {'STATUS'}",
+        "-" * 85,
+    ]
 
     for run in run_list:
         if run.timed_out:
@@ -319,17 +348,50 @@ def runs(ctx: click.Context, job_name: Optional[str], limit: int,
 
         started = format_datetime(run.started_at)
         duration = format_duration(run.duration_seconds)
-        click.echo(f"{run.id:<6} {run.job_name:<25} {started:<20} {exit_str:<6} {duration:<10} {status}")
+        lines.append(f"{run.id:<6} {run.job_name:<25} {started:<20} {exit_str:<6} {duration:<10} {status}")
+
+    click.echo("\n".join(lines))
+
+
+def _read_last_lines(path: str, count: int) -> str:
+    """Read the last count lines of a file without reading all of it."""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        data = b""
+        # One extra newline: the file usually ends with one
+        while position > 0 and data.count(b"\n") <= count:
+            step = min(64 * 1024, position)
+            position -= step
+            f.seek(position)
+            data = f.read(step) + data
+    lines = data.decode("utf-8", errors="replace").splitlines()
+    return "\n".join(lines[-count:]) if count > 0 else ""
+
+
+def _echo_output(title: str, text: Optional[str], path: Optional[str],
+                 tail_lines: Optional[int]) -> None:
+    """Print a run's output, from its full output file when tail_lines is set."""
+    if tail_lines is not None:
+        if path and os.path.exists(path):
+            text = _read_last_lines(path, tail_lines)
+        elif text:
+            # Output file gone (or never kept): limit the stored tail instead
+            text = "\n".join(text.splitlines()[-tail_lines:]) if tail_lines > 0 else ""
+    if text:
+        click.echo(f"\n--- {title} ---")
+        click.echo(text)
 
 
 @cli.command("run")
 @click.argument("run_id", type=int)
+@click.option("--tail", "-n", "tail_lines", type=int,
+              help="Show the last N lines of the full output files")
 @click.pass_context
-def show_run(ctx: click.Context, run_id: int) -> None:
+def show_run(ctx: click.Context, run_id: int, tail_lines: Optional[int]) -> None:
     """Show details of a specific run."""
-    db = get_db(ctx.obj.get("config_file"))
+    db = get_db_cached(ctx)
     run = db.get_run(run_id)
-    db.close()
 
     if not run:
         click.echo(f"ERROR: Run {run_id} not found", err=True)
@@ -353,13 +415,8 @@ def show_run(ctx: click.Context, run_id: int) -> None:
     click.echo(f"Exit Code:    {run.exit_code if run.exit_code is not None else '-'}")
     click.echo(f"Timed Out:    {'yes' if run.timed_out else 'no'}")
 
-    if run.stdout:
-        click.echo("\n--- STDOUT ---")
-        click.echo(run.stdout)
-
-    if run.stderr:
-        click.echo("\n--- STDERR ---")
-        click.echo(run.stderr)
+    _echo_output("STDOUT", run.stdout, run.stdout_path, tail_lines)
+    _echo_output("STDERR", run.stderr, run.stderr_path, tail_lines)
 
 
 @cli.command()
@@ -367,7 +424,7 @@ def show_run(ctx: click.Context, run_id: int) -> None:
 @click.pass_context
 def last(ctx: click.Context, job_name: str) -> None:
     """Show the last run for a job."""
-    db = get_db(ctx.obj.get("config_file"))
+    db = get_db_cached(ctx)
     job = db.get_job(job_name)
 
     if not job:
@@ -375,7 +432,6 @@ def last(ctx: click.Context, job_name: str) -> None:
         sys.exit(1)
 
     run = db.get_last_run(job_name)
-    db.close()
 
     if not run:
         click.echo(f"No runs found for job '{job_name}'")
@@ -394,12 +450,11 @@ def last(ctx: click.Context, job_name: str) -> None:
 def status(ctx: click.Context) -> None:
     """Check if the scheduler service is running."""
     # Simple check - see if we can connect to DB and count jobs
-    db = get_db(ctx.obj.get("config_file"))
-    jobs = db.list_jobs(include_disabled=True)
-    enabled = [j for j in jobs if j.enabled]
-    db.close()
+    db = get_db_cached(ctx)
+    total = db.count_jobs()
+    enabled = db.count_jobs(enabled=True)
 
-    click.echo(f"Jobs: {len(jobs)} total, {len(enabled)} enabled")
+    click.echo(f"Jobs: {total} total, {enabled} enabled")
     click.echo("\nNote: Use system tools to check if cc_director_service is running:")
     click.echo("  Windows: sc query cc_director")
     click.echo("  macOS: launchctl list | grep cc.director")
@@ -410,7 +465,7 @@ def status(ctx: click.Context) -> None:
 @click.pass_context
 def trigger(ctx: click.Context, name: str) -> None:
     """Trigger a job to run immediately (outside normal schedule)."""
-    db = get_db(ctx.obj.get("config_file"))
+    db = get_db_cached(ctx)
     job = db.get_job(name)
 
     if not job:
@@ -443,7 +498,6 @@ def trigger(ctx: click.Context, name: str) -> None:
         duration_seconds=result.duration_seconds,
     )
     run_id = db.create_run(run)
-    db.close()
 
     # Show result
     if result.timed_out:
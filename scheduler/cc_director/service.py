@@ -1,36 +1,38 @@
 """cc_director service - main daemon that executes scheduled jobs."""
 
 import asyncio
+import concurrent.futures
 import logging
 import os
 import signal
 import sys
 import threading
-import time
-from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from logging.handlers import TimedRotatingFileHandler
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import click
 
 from .config import Config
 from .cron import calculate_next_run
 from .database import Database, Job, Run
-from .dispatcher import CommunicationDispatcher, ApprovedFolderWatcher, DispatcherConfig, SQLiteDispatcher
-from .executor import execute_job
+from .dispatcher import SQLiteDispatcher
+from .executor import execute_job_async
 
-# Global shutdown flag
-_shutdown_requested = False
+if TYPE_CHECKING:
+    import uvicorn
+
+# Set by signal_handler; waited on instead of sleeping
+_shutdown_event = threading.Event()
+# Loop running the jobs and the event that wakes it, while it runs
+_scheduler_loop: Optional[asyncio.AbstractEventLoop] = None
+_scheduler_wakeup: Optional[asyncio.Event] = None
+# Only changed on the scheduler loop; the gateway only reads it
 _running_jobs: set[int] = set()
-_running_jobs_lock = threading.Lock()
 
 # Communication dispatcher globals
-_comm_dispatcher: Optional[CommunicationDispatcher] = None
-_comm_watcher: Optional[ApprovedFolderWatcher] = None
 _sqlite_dispatcher: Optional[SQLiteDispatcher] = None
-_dispatcher_loop: Optional[asyncio.AbstractEventLoop] = None
 
 # SQLite database path for Communication Manager
 def _get_comm_manager_db_path() -> Path:
@@ -86,30 +88,35 @@ def setup_logging(log_dir: Path, log_level: str) -> logging.Logger:
 
 def signal_handler(signum: int, frame) -> None:
     """Handle shutdown signals."""
-    global _shutdown_requested
-    _shutdown_requested = True
-
+    _shutdown_event.set()
+    if _scheduler_loop is not None and _scheduler_wakeup is not None:
+        _scheduler_loop.call_soon_threadsafe(_scheduler_wakeup.set)
 
-def _on_new_approved_item(item_path) -> None:
-    """Callback when new item appears in approved/ folder."""
-    global _comm_dispatcher, _dispatcher_loop
 
-    if _comm_dispatcher is None or _dispatcher_loop is None:
-        return
-
-    # Schedule the dispatch on the async loop
-    async def dispatch():
-        await _comm_dispatcher.dispatch_item(item_path)
+def _start_service_loop() -> tuple[asyncio.AbstractEventLoop, threading.Thread]:
+    """
+    Start the event loop shared by the gateway and the dispatcher.
 
-    asyncio.run_coroutine_threadsafe(dispatch(), _dispatcher_loop)
+    Returns:
+        The loop and the thread running it
+    """
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(
+        target=loop.run_forever,
+        daemon=True,
+        name="service-loop"
+    )
+    thread.start()
+    return loop, thread
 
 
 def _start_communication_dispatcher(
     config: Config,
     logger: logging.Logger,
-) -> threading.Thread:
+    loop: asyncio.AbstractEventLoop,
+) -> concurrent.futures.Future:
     """
-    Start the communication dispatcher in a background thread.
+    Start the communication dispatcher on the service loop.
 
     Uses SQLite-based dispatcher that polls the Communication Manager database
     for approved items ready to send.
@@ -117,18 +124,14 @@ def _start_communication_dispatcher(
     Args:
         config: Configuration instance
         logger: Logger instance
+        loop: Service loop to run the dispatcher on
 
     Returns:
-        The dispatcher thread
+        Future of the dispatcher task; cancel it to stop the dispatcher
     """
-    global _sqlite_dispatcher, _dispatcher_loop
-
-    def run_dispatcher():
-        """Run the SQLite dispatcher event loop."""
-        global _sqlite_dispatcher, _dispatcher_loop
-
-        _dispatcher_loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(_dispatcher_loop)
+    async def run_dispatcher():
+        """Run the SQLite dispatcher until cancelled."""
+        global _sqlite_dispatcher
 
         # Create SQLite dispatcher
         _sqlite_dispatcher = SQLiteDispatcher(
@@ -138,42 +141,23 @@ def _start_communication_dispatcher(
 
         logger.info(f"SQLite dispatcher watching: {COMM_MANAGER_DB_PATH}")
 
-        async def run_until_shutdown():
-            """Run dispatcher until shutdown requested."""
-            try:
-                await _sqlite_dispatcher.start()
-            except asyncio.CancelledError:
-                pass
-            finally:
-                _sqlite_dispatcher.stop()
-
         try:
-            # Create task for the dispatcher
-            task = _dispatcher_loop.create_task(run_until_shutdown())
-
-            # Check for shutdown periodically
-            while not _shutdown_requested:
-                _dispatcher_loop.run_until_complete(asyncio.sleep(1))
-
-            # Cancel the task on shutdown
-            task.cancel()
-            _dispatcher_loop.run_until_complete(asyncio.sleep(0.5))
-
+            await _sqlite_dispatcher.start()
         finally:
-            _dispatcher_loop.close()
+            _sqlite_dispatcher.stop()
 
-    thread = threading.Thread(
-        target=run_dispatcher,
-        daemon=True,
-        name="sqlite-dispatcher"
-    )
-    thread.start()
+    future = asyncio.run_coroutine_threadsafe(run_dispatcher(), loop)
 
     logger.info(f"Communication dispatcher started (SQLite mode), watching {COMM_MANAGER_DB_PATH}")
-    return thread
+    return future
 
 
-def run_job(db: Database, job: Job, logger: logging.Logger) -> None:
+async def run_job(
+    db: Database,
+    job: Job,
+    logger: logging.Logger,
+    output_dir: Optional[Path] = None,
+) -> None:
     """
     Execute a single job and record the result.
 
@@ -181,12 +165,13 @@ def run_job(db: Database, job: Job, logger: logging.Logger) -> None:
         db: Database instance
         job: Job to execute
         logger: Logger instance
+        output_dir: Directory for full run output (<run id>.stdout.log and
+            <run id>.stderr.log); only the tail is stored in the database
     """
-    with _running_jobs_lock:
-        if job.id in _running_jobs:
-            logger.warning(f"Job '{job.name}' is already running, skipping")
-            return
-        _running_jobs.add(job.id)
+    if job.id in _running_jobs:
+        logger.warning(f"Job '{job.name}' is already running, skipping")
+        return
+    _running_jobs.add(job.id)
 
     try:
         logger.info(f"Starting job '{job.name}': {job.command}")
@@ -208,10 +193,11 @@ def run_job(db: Database, job: Job, logger: logging.Logger) -> None:
         run.id = run_id
 
         # Execute the job
-        result = execute_job(
+        result = await execute_job_async(
             command=job.command,
             working_dir=job.working_dir,
             timeout_seconds=job.timeout_seconds,
+            log_stem=output_dir / str(run_id) if output_dir else None,
         )
 
         # Update run record with results
@@ -221,7 +207,14 @@ def run_job(db: Database, job: Job, logger: logging.Logger) -> None:
         run.stderr = result.stderr
         run.timed_out = result.timed_out
         run.duration_seconds = result.duration_seconds
-        db.update_run(run)
+        run.stdout_path = result.stdout_path
+        run.stderr_path = result.stderr_path
+
+        # Record the result and the next run time with a single commit
+        next_run = calculate_next_run(job.cron)
+        with db.transaction():
+            db.update_run(run)
+            db.update_next_run(job.id, next_run)
 
         # Log result
         if result.timed_out:
@@ -240,14 +233,10 @@ def run_job(db: Database, job: Job, logger: logging.Logger) -> None:
             if result.stderr:
                 logger.error(f"  stderr: {result.stderr[:500]}")
 
-        # Calculate next run time
-        next_run = calculate_next_run(job.cron)
-        db.update_next_run(job.id, next_run)
         logger.info(f"Job '{job.name}' next run scheduled for {next_run}")
 
     finally:
-        with _running_jobs_lock:
-            _running_jobs.discard(job.id)
+        _running_jobs.discard(job.id)
 
 
 def _start_gateway_server(
@@ -255,18 +244,21 @@ def _start_gateway_server(
     config: Config,
     running_jobs: set,
     logger: logging.Logger,
-) -> threading.Thread:
+    loop: asyncio.AbstractEventLoop,
+) -> tuple["uvicorn.Server", concurrent.futures.Future]:
     """
-    Start the gateway web server in a background thread.
+    Start the gateway web server on the service loop.
 
     Args:
         db: Database instance
         config: Configuration instance
         running_jobs: Set of currently running job IDs
         logger: Logger instance
+        loop: Service loop to serve on
 
     Returns:
-        The gateway server thread
+        The uvicorn server (set should_exit to stop it) and the future of
+        its serve() task
     """
     import uvicorn
 
@@ -280,32 +272,55 @@ def _start_gateway_server(
     # Set service start time for uptime tracking
     set_start_time()
 
-    def run_server():
-        """Run uvicorn in a thread."""
-        uvicorn_config = uvicorn.Config(
-            app,
-            host=config.gateway_host,
-            port=config.gateway_port,
-            log_level="warning",  # Reduce uvicorn noise
-            access_log=False,
-        )
-        server = uvicorn.Server(uvicorn_config)
-
-        # Run the server
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            loop.run_until_complete(server.serve())
-        finally:
-            loop.close()
-
-    thread = threading.Thread(target=run_server, daemon=True)
-    thread.start()
+    uvicorn_config = uvicorn.Config(
+        app,
+        host=config.gateway_host,
+        port=config.gateway_port,
+        log_level="warning",  # Reduce uvicorn noise
+        access_log=False,
+    )
+    server = uvicorn.Server(uvicorn_config)
+    # Off the main thread, serve() leaves the process signal handlers alone
+    future = asyncio.run_coroutine_threadsafe(server.serve(), loop)
 
     logger.info(
         f"Gateway server started at http://{config.gateway_host}:{config.gateway_port}"
     )
-    return thread
+    return server, future
+
+
+def _stop_services(
+    loop: asyncio.AbstractEventLoop,
+    thread: threading.Thread,
+    gateway: Optional[tuple["uvicorn.Server", concurrent.futures.Future]],
+    dispatcher_future: Optional[concurrent.futures.Future],
+    timeout: float,
+) -> None:
+    """
+    Stop the gateway and the dispatcher, then the service loop.
+
+    Args:
+        loop: Service loop
+        thread: Thread running the service loop
+        gateway: Server and future from _start_gateway_server(), if started
+        dispatcher_future: Future from _start_communication_dispatcher(), if started
+        timeout: Seconds to wait for them to finish
+    """
+    futures = []
+    if gateway is not None:
+        server, future = gateway
+        server.should_exit = True  # Graceful: uvicorn checks it every tick
+        futures.append(future)
+    if dispatcher_future is not None:
+        # The dispatcher writes out posted items when cancelled
+        dispatcher_future.cancel()
+        futures.append(dispatcher_future)
+
+    concurrent.futures.wait(futures, timeout=timeout)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=timeout)
+    if not thread.is_alive():
+        loop.close()
 
 
 def initialize_job_schedules(db: Database, logger: logging.Logger) -> None:
@@ -317,11 +332,13 @@ def initialize_job_schedules(db: Database, logger: logging.Logger) -> None:
         logger: Logger instance
     """
     jobs = db.list_jobs(include_disabled=False)
-    for job in jobs:
-        if job.next_run is None:
-            next_run = calculate_next_run(job.cron)
-            db.update_next_run(job.id, next_run)
-            logger.info(f"Initialized schedule for '{job.name}': next run at {next_run}")
+    next_runs = [
+        (job.id, calculate_next_run(job.cron))
+        for job in jobs if job.next_run is None
+    ]
+    if next_runs:
+        db.update_next_runs(next_runs)
+        logger.info(f"Initialized schedules for {len(next_runs)} job(s)")
 
 
 def run_scheduler(
@@ -337,8 +354,6 @@ def run_scheduler(
         verbose: Enable verbose logging
         with_gateway: Start the web gateway server
     """
-    global _shutdown_requested
-
     # Set up signal handlers
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
@@ -353,25 +368,28 @@ def run_scheduler(
     db.create_tables()
     logger.info(f"Database initialized at {config.get_db_path()}")
 
+    # The gateway and the dispatcher share one event loop thread
+    service_loop, service_thread = _start_service_loop()
+
     # Start gateway server if requested
-    gateway_thread = None
+    gateway = None
     if with_gateway or config.gateway_enabled:
-        gateway_thread = _start_gateway_server(
-            db, config, _running_jobs, logger
+        gateway = _start_gateway_server(
+            db, config, _running_jobs, logger, service_loop
         )
 
     # Start communication dispatcher
-    dispatcher_thread = None
+    dispatcher_future = None
     try:
-        dispatcher_thread = _start_communication_dispatcher(config, logger)
+        dispatcher_future = _start_communication_dispatcher(config, logger, service_loop)
     except Exception as e:
         logger.error(f"Failed to start communication dispatcher: {e}")
 
     # Initialize job schedules
     initialize_job_schedules(db, logger)
 
-    # Thread pool for concurrent job execution
-    executor = ThreadPoolExecutor(max_workers=10, thread_name_prefix="job_")
+    # Full job output is written here; the database keeps the tail
+    run_output_dir = config.get_log_dir() / "runs"
 
     logger.info(
         f"Scheduler running. Check interval: {config.check_interval}s. "
@@ -379,37 +397,80 @@ def run_scheduler(
     )
 
     try:
-        while not _shutdown_requested:
-            # Get due jobs
-            due_jobs = db.get_due_jobs()
+        asyncio.run(_run_scheduler_loop(db, config, logger, run_output_dir))
+    except KeyboardInterrupt:
+        logger.info("Keyboard interrupt received")
+    finally:
+        _shutdown_event.set()
+        # Let the dispatcher write out posted items before the process exits
+        _stop_services(
+            service_loop, service_thread, gateway, dispatcher_future,
+            timeout=config.shutdown_timeout,
+        )
+        db.close()
+        logger.info("cc_director service stopped")
+
+
+async def _run_scheduler_loop(
+    db: Database,
+    config: Config,
+    logger: logging.Logger,
+    output_dir: Path,
+) -> None:
+    """
+    Start due jobs as tasks on this loop until shutdown, then wait for them.
+
+    Args:
+        db: Database instance
+        config: Configuration instance
+        logger: Logger instance
+        output_dir: Directory for full run output
+    """
+    global _scheduler_loop, _scheduler_wakeup
 
-            for job in due_jobs:
-                if _shutdown_requested:
-                    break
-                # Submit job to thread pool
-                executor.submit(run_job, db, job, logger)
+    _scheduler_loop = asyncio.get_running_loop()
+    _scheduler_wakeup = asyncio.Event()
+    # At most this many jobs run at once; further due jobs wait for a slot
+    job_slots = asyncio.Semaphore(config.get_max_concurrent_jobs())
+    job_tasks: set[asyncio.Task] = set()
 
-            # Sleep until next check (or shutdown)
+    async def run_in_slot(job: Job) -> None:
+        async with job_slots:
+            try:
+                await run_job(db, job, logger, output_dir)
+            except Exception as e:
+                logger.error(f"Job '{job.name}' raised: {e}")
+                # The job may not have been rescheduled; keep it on the queue
+                db.requeue_due_job(job)
+
+    try:
+        while not _shutdown_event.is_set():
+            # Get due jobs from the in-memory due queue; one clock read per tick
+            now = datetime.now()
+            for job in db.pop_due_jobs(now):
+                task = asyncio.create_task(run_in_slot(job))
+                job_tasks.add(task)
+                task.add_done_callback(job_tasks.discard)
+
+            # Sleep until the next job is due, or check_interval at most (or shutdown)
             sleep_time = config.check_interval
-            sleep_start = time.time()
-            while not _shutdown_requested and (time.time() - sleep_start) < sleep_time:
-                time.sleep(1)
+            next_due = db.get_next_due_time()
+            if next_due is not None:
+                sleep_time = min(sleep_time, max((next_due - now).total_seconds(), 0))
+            try:
+                await asyncio.wait_for(_scheduler_wakeup.wait(), sleep_time)
+            except asyncio.TimeoutError:
+                pass
 
-    except KeyboardInterrupt:
-        logger.info("Keyboard interrupt received")
-    finally:
         logger.info("Shutting down...")
 
         # Wait for running jobs to complete
-        with _running_jobs_lock:
-            running_count = len(_running_jobs)
-        if running_count > 0:
-            logger.info(f"Waiting for {running_count} running jobs to complete...")
-
-        executor.shutdown(wait=True, cancel_futures=False)
-
-        db.close()
-        logger.info("cc_director service stopped")
+        if job_tasks:
+            logger.info(f"Waiting for {len(job_tasks)} running jobs to complete...")
+            await asyncio.gather(*job_tasks, return_exceptions=True)
+    finally:
+        _scheduler_loop = None
+        _scheduler_wakeup = None
 
 
 def check_config(config: Config) -> bool:
@@ -427,6 +488,7 @@ def check_config(config: Config) -> bool:
     print(f"Log level: {config.log_level}")
     print(f"Check interval: {config.check_interval}s")
     print(f"Shutdown timeout: {config.shutdown_timeout}s")
+    print(f"Max concurrent jobs: {config.get_max_concurrent_jobs()}")
     print(f"Gateway enabled: {config.gateway_enabled}")
     print(f"Gateway host: {config.gateway_host}")
     print(f"Gateway port: {config.gateway_port}")
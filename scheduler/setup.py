@@ -6,6 +6,9 @@ setup(
     description="Cross-platform job scheduler with cron-style scheduling",
     author="CC Director Contributors",
     packages=find_packages(),
+    package_data={
+        "cc_director.gateway": ["static/css/*", "static/js/*", "templates/*.html"],
+    },
     python_requires=">=3.10",
     install_requires=[
         "croniter>=2.0.0",
@@ -15,9 +18,11 @@ setup(
         "jinja2>=3.1.0",
         "python-multipart>=0.0.6",
         "websockets>=12.0",
+        "watchdog>=3.0.0",
     ],
     extras_require={
         "windows": ["pywin32>=306"],
+        "fast": ["orjson>=3.9.0", "google-re2>=1.1"],
         "dev": ["pytest>=7.0.0", "pytest-cov>=4.0.0"],
     },
     entry_points={
@@ -5,7 +5,7 @@ import pytest
 import tempfile
 from pathlib import Path
 
-from cc_director.config import Config
+from cc_director.config import Config, _parse_config_file_cached
 
 
 class TestConfigLoad:
@@ -80,6 +80,42 @@ class TestConfigLoad:
         finally:
             os.unlink(config_path)
 
+    def test_config_file_comments_and_crlf(self):
+        """Should skip comments and blank lines and keep '=' inside values."""
+        with tempfile.NamedTemporaryFile(mode="wb", suffix=".conf", delete=False) as f:
+            f.write(b"# comment\r\n\r\n")
+            f.write(b"DB_PATH = /from/file.db\r\n")
+            f.write(b"gateway_host=a=b\r\n")
+            f.write(b"no separator\r\n")
+            config_path = f.name
+
+        try:
+            parsed = Config._parse_config_file(config_path)
+            assert parsed == {"db_path": "/from/file.db", "gateway_host": "a=b"}
+        finally:
+            os.unlink(config_path)
+
+    def test_config_file_reparsed_after_edit(self):
+        """An unchanged file should be parsed once; an edited one again."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".conf", delete=False) as f:
+            f.write("gateway_host = first\n")
+            config_path = f.name
+
+        os.environ.pop("CC_DIRECTOR_GATEWAY_HOST", None)
+        try:
+            assert Config.load(config_path).gateway_host == "first"
+            hits = _parse_config_file_cached.cache_info().hits
+            assert Config.load(config_path).gateway_host == "first"
+            assert _parse_config_file_cached.cache_info().hits == hits + 1
+
+            with open(config_path, "w") as f:
+                f.write("gateway_host = second\n")
+            stat = os.stat(config_path)
+            os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            assert Config.load(config_path).gateway_host == "second"
+        finally:
+            os.unlink(config_path)
+
     def test_env_overrides_file(self):
         """Environment variables should override config file."""
         with tempfile.NamedTemporaryFile(mode="w", suffix=".conf", delete=False) as f:
@@ -98,6 +134,40 @@ class TestConfigLoad:
             os.unlink(config_path)
             del os.environ["CC_DIRECTOR_LOG_LEVEL"]
 
+    def test_gateway_settings_from_env(self):
+        """Gateway settings should be cast from environment strings."""
+        os.environ["CC_DIRECTOR_GATEWAY_ENABLED"] = "yes"
+        os.environ["CC_DIRECTOR_GATEWAY_PORT"] = "7070"
+
+        try:
+            config = Config.load()
+
+            assert config.gateway_enabled is True
+            assert config.gateway_port == 7070
+        finally:
+            del os.environ["CC_DIRECTOR_GATEWAY_ENABLED"]
+            del os.environ["CC_DIRECTOR_GATEWAY_PORT"]
+
+    def test_max_concurrent_jobs(self):
+        """0 should scale with the CPUs; a positive value is used as is."""
+        os.environ["CC_DIRECTOR_MAX_CONCURRENT_JOBS"] = "3"
+        try:
+            assert Config.load().get_max_concurrent_jobs() == 3
+        finally:
+            del os.environ["CC_DIRECTOR_MAX_CONCURRENT_JOBS"]
+
+        default = Config.load().get_max_concurrent_jobs()
+        assert 2 <= default <= 32
+
+    def test_gateway_enabled_false_strings(self):
+        """Non-truthy strings should disable the gateway."""
+        for value in ("false", "0", "no", ""):
+            os.environ["CC_DIRECTOR_GATEWAY_ENABLED"] = value
+            try:
+                assert Config.load().gateway_enabled is False
+            finally:
+                del os.environ["CC_DIRECTOR_GATEWAY_ENABLED"]
+
 
 class TestConfigPaths:
     """Tests for path resolution."""
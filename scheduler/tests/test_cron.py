@@ -3,7 +3,16 @@
 import pytest
 from datetime import datetime
 
-from cc_director.cron import validate_cron, calculate_next_run, describe_cron
+from croniter import croniter
+
+from cc_director.cron import (
+    calculate_next_run,
+    compile_cron,
+    describe_cron,
+    get_previous_run,
+    iter_runs,
+    validate_cron,
+)
 
 
 class TestValidateCron:
@@ -60,6 +69,68 @@ class TestCalculateNextRun:
         with pytest.raises(ValueError):
             calculate_next_run("invalid", datetime.now())
 
+    def test_cached_expression_independent_base_times(self):
+        """Repeated calls for the same expression should not share state."""
+        later = calculate_next_run("0 7 * * *", datetime(2026, 3, 1, 8, 0, 0))
+        earlier = calculate_next_run("0 7 * * *", datetime(2026, 2, 20, 6, 0, 0))
+        assert later == datetime(2026, 3, 2, 7, 0, 0)
+        assert earlier == datetime(2026, 2, 20, 7, 0, 0)
+
+    def test_previous_run(self):
+        """Previous run should be the last occurrence before base time."""
+        base_time = datetime(2026, 2, 23, 6, 0, 0)  # Monday 6 AM
+        assert get_previous_run("0 7 * * 1-5", base_time) == datetime(2026, 2, 20, 7, 0, 0)
+
+
+class TestIterRuns:
+    """Tests for iterating over upcoming runs."""
+
+    def test_matches_repeated_next_run(self):
+        """Should yield the same series as chained calculate_next_run calls."""
+        base = datetime(2024, 1, 15, 10, 30, 0)
+        runs = iter_runs("0 */6 * * *", base)
+
+        expected = base
+        for _ in range(5):
+            expected = calculate_next_run("0 */6 * * *", expected)
+            assert next(runs) == expected
+
+    def test_invalid_expression_raises(self):
+        """Should raise ValueError for invalid expression."""
+        with pytest.raises(ValueError):
+            next(iter_runs("invalid"))
+
+
+class TestCompileCron:
+    """Tests for the bit-mask compiled cron expressions."""
+
+    @pytest.mark.parametrize("expression", [
+        "*/15 9-17 * * 1-5",
+        "0 0 1,15 * 0",  # Day and weekday both set: either matches
+        "30 23 31 * *",
+        "0 12 29 2 *",
+        "5 4 * jan,jul sun",
+    ])
+    def test_matches_croniter(self, expression):
+        """Compiled next runs should match croniter's."""
+        compiled = compile_cron(expression)
+        base = datetime(2026, 2, 21, 7, 3, 30)
+        expected = croniter(expression, base)
+        for _ in range(20):
+            base = compiled.next_after(base)
+            assert base == expected.get_next(datetime)
+
+    def test_unsupported_features_fall_back(self):
+        """L and # expressions are left to croniter."""
+        assert compile_cron("0 0 L * *") is None
+        assert compile_cron("0 0 * * 5#2") is None
+        assert calculate_next_run("0 0 L * *", datetime(2026, 2, 3)) == datetime(2026, 2, 28)
+
+    def test_never_matching_raises(self):
+        """An expression without any matching date should raise ValueError."""
+        with pytest.raises(ValueError):
+            calculate_next_run("0 0 31 2 *", datetime(2026, 1, 1))
+
 
 class TestDescribeCron:
     """Tests for human-readable cron descriptions."""
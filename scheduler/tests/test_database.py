@@ -1,11 +1,13 @@
 """Tests for database module."""
 
 import pytest
+import sqlite3
 import tempfile
-from datetime import datetime
+import threading
+from datetime import datetime, timedelta
 from pathlib import Path
 
-from cc_director.database import Database, Job, Run
+from cc_director.database import _SELECT_DUE_JOBS_SQL, Database, Job, Run, _parse_datetime
 
 
 @pytest.fixture
@@ -37,6 +39,79 @@ def sample_job() -> Job:
     )
 
 
+class TestParseDatetime:
+    """Tests for SQLite datetime parsing."""
+
+    def test_parse_formats(self):
+        """Should parse all SQLite datetime storage formats."""
+        expected = datetime(2026, 2, 21, 7, 0, 0)
+        assert _parse_datetime("2026-02-21 07:00:00") == expected
+        assert _parse_datetime("2026-02-21T07:00:00") == expected
+        assert _parse_datetime(b"2026-02-21 07:00:00") == expected
+        assert _parse_datetime("2026-02-21 07:00:00.250000") == expected.replace(microsecond=250000)
+
+    def test_parse_none_and_invalid(self):
+        """None passes through, garbage raises ValueError."""
+        assert _parse_datetime(None) is None
+        with pytest.raises(ValueError):
+            _parse_datetime("not a date")
+
+    def test_timestamps_roundtrip(self, db: Database, sample_job: Job):
+        """Stored DATETIME columns should come back as datetime objects."""
+        db.add_job(sample_job)
+        job = db.get_job("test_job")
+        assert isinstance(job.created_at, datetime)
+        assert job.next_run == datetime(2026, 2, 21, 7, 0, 0)
+
+    def test_no_global_converter(self):
+        """Other connections in the process should still get DATETIME columns as text."""
+        conn = sqlite3.connect(":memory:", detect_types=sqlite3.PARSE_DECLTYPES)
+        try:
+            conn.execute("CREATE TABLE t (at DATETIME)")
+            conn.execute("INSERT INTO t VALUES ('2026-02-21 07:00:00')")
+            assert conn.execute("SELECT at FROM t").fetchone()[0] == "2026-02-21 07:00:00"
+        finally:
+            conn.close()
+
+
+class TestConnection:
+    """Tests for connection setup."""
+
+    def test_wal_mode_enabled(self, db: Database):
+        """Connections should be opened in WAL journal mode."""
+        mode = db.connect().execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode.lower() == "wal"
+
+    def test_connection_per_thread(self, db: Database, sample_job: Job):
+        """Each thread should get its own connection to the same database."""
+        results = {}
+
+        def worker():
+            results["conn"] = db.connect()
+            results["job_id"] = db.add_job(sample_job)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        assert results["conn"] is not db.connect()
+        assert db.get_job_by_id(results["job_id"]).name == sample_job.name
+
+    def test_schema_is_current(self, db: Database):
+        """create_tables() should mark the schema as current; a new file is not."""
+        assert db.schema_is_current()
+        fresh = Database(str(db.db_path.with_name("fresh.db")))
+        assert not fresh.schema_is_current()
+        fresh.close()
+
+    def test_close_reconnects(self, db: Database):
+        """Connections closed by close() should be reopened on next use."""
+        conn = db.connect()
+        db.close()
+        assert db.connect() is not conn
+        assert db.list_jobs() == []
+
+
 class TestJobCRUD:
     """Tests for job CRUD operations."""
 
@@ -45,6 +120,16 @@ class TestJobCRUD:
         job_id = db.add_job(sample_job)
         assert job_id > 0
 
+    def test_add_job_fills_generated_fields(self, db: Database, sample_job: Job):
+        """add_job should set id and timestamps on the passed Job."""
+        job_id = db.add_job(sample_job)
+
+        stored = db.get_job_by_id(job_id)
+        assert sample_job.id == job_id
+        assert sample_job.created_at == stored.created_at
+        assert sample_job.updated_at == stored.updated_at
+        assert isinstance(sample_job.created_at, datetime)
+
     def test_get_job_by_name(self, db: Database, sample_job: Job):
         """Should retrieve job by name."""
         db.add_job(sample_job)
@@ -81,6 +166,26 @@ class TestJobCRUD:
         jobs = db.list_jobs(include_disabled=True)
         assert len(jobs) == 2
 
+    def test_list_jobs_summary_and_count(self, db: Database, sample_job: Job):
+        """Summary tuples and counts should match the full job listing."""
+        db.add_job(sample_job)
+        db.add_job(Job(
+            id=None, name="disabled_job", cron="* * * * *",
+            command="echo disabled", working_dir=None, enabled=False,
+            timeout_seconds=60, tags=None, created_at=None,
+            updated_at=None, next_run=None,
+        ))
+
+        job = db.list_jobs()[0]
+        assert db.list_jobs_summary() == [
+            (job.id, job.name, job.cron, True, job.next_run, job.tags)
+        ]
+        assert len(db.list_jobs_summary(include_disabled=True)) == 2
+        assert db.list_jobs_summary(tag="nonexistent") == []
+        assert db.count_jobs() == 2
+        assert db.count_jobs(enabled=True) == 1
+        assert db.count_jobs(enabled=False) == 1
+
     def test_list_jobs_by_tag(self, db: Database, sample_job: Job):
         """Should filter jobs by tag."""
         db.add_job(sample_job)
@@ -91,6 +196,68 @@ class TestJobCRUD:
         jobs = db.list_jobs(tag="nonexistent")
         assert len(jobs) == 0
 
+    def test_list_jobs_by_tag_exact_match(self, db: Database, sample_job: Job):
+        """Tag filter should match whole tags, not substrings."""
+        db.add_job(sample_job)
+
+        assert len(db.list_jobs(tag="sample")) == 1
+        assert len(db.list_jobs(tag="samp")) == 0
+        assert len(db.list_jobs(tag="test,sample")) == 0
+
+    def test_update_job_replaces_tags(self, db: Database, sample_job: Job):
+        """Updating tags should replace the old tag index entries."""
+        job_id = db.add_job(sample_job)
+        job = db.get_job_by_id(job_id)
+        job.tags = "prod"
+        db.update_job(job)
+
+        assert len(db.list_jobs(tag="test")) == 0
+        assert len(db.list_jobs(tag="prod")) == 1
+
+    def test_backfill_tags_for_existing_jobs(self, db: Database, sample_job: Job):
+        """create_tables should index tags of jobs stored before job_tags existed."""
+        db.add_job(sample_job)
+        conn = db.connect()
+        conn.execute("DELETE FROM job_tags")
+        conn.commit()
+
+        db.create_tables()
+
+        assert len(db.list_jobs(tag="sample")) == 1
+
+    def test_next_run_stored_as_epoch(self, db: Database, sample_job: Job):
+        """next_run should round-trip through the integer next_run_ts column."""
+        job_id = db.add_job(sample_job)
+
+        row = db.connect().execute("SELECT next_run_ts FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        assert row["next_run_ts"] == int(sample_job.next_run.timestamp())
+        assert db.get_job_by_id(job_id).next_run == sample_job.next_run
+
+    def test_migrate_next_run_ts(self, tmp_path: Path):
+        """create_tables should add and backfill next_run_ts on an older schema."""
+        db_path = tmp_path / "old.db"
+        conn = sqlite3.connect(str(db_path))
+        conn.execute(
+            "CREATE TABLE jobs (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT UNIQUE NOT NULL, "
+            "cron TEXT NOT NULL, command TEXT NOT NULL, working_dir TEXT, enabled INTEGER DEFAULT 1, "
+            "timeout_seconds INTEGER DEFAULT 300, tags TEXT, "
+            "created_at DATETIME DEFAULT CURRENT_TIMESTAMP, "
+            "updated_at DATETIME DEFAULT CURRENT_TIMESTAMP, next_run DATETIME)"
+        )
+        conn.execute(
+            "INSERT INTO jobs (name, cron, command, next_run) VALUES (?, ?, ?, ?)",
+            ("old_job", "0 7 * * *", "echo old", "2026-02-21 07:00:00"),
+        )
+        conn.commit()
+        conn.close()
+
+        database = Database(str(db_path))
+        try:
+            database.create_tables()
+            assert database.get_job("old_job").next_run == datetime(2026, 2, 21, 7, 0, 0)
+        finally:
+            database.close()
+
     def test_update_job(self, db: Database, sample_job: Job):
         """Should update job properties."""
         job_id = db.add_job(sample_job)
@@ -113,6 +280,7 @@ class TestJobCRUD:
 
         job = db.get_job("test_job")
         assert job is None
+        assert db.list_jobs(tag="test") == []
 
     def test_delete_nonexistent_job(self, db: Database):
         """Deleting non-existent job should return False."""
@@ -132,6 +300,33 @@ class TestJobCRUD:
         assert job.enabled is True
 
 
+class TestTransaction:
+    """Tests for grouped writes."""
+
+    def test_transaction_commits_once(self, db: Database, sample_job: Job):
+        """Writes inside a transaction should be visible after the block."""
+        with db.transaction():
+            job_id = db.add_job(sample_job)
+            db.update_next_run(job_id, datetime(2026, 3, 1, 7, 0, 0))
+
+        other = Database(str(db.db_path))
+        try:
+            job = other.get_job("test_job")
+            assert job is not None
+            assert job.next_run == datetime(2026, 3, 1, 7, 0, 0)
+        finally:
+            other.close()
+
+    def test_transaction_rolls_back_on_error(self, db: Database, sample_job: Job):
+        """An exception inside the block should discard all its writes."""
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                db.add_job(sample_job)
+                raise RuntimeError("boom")
+
+        assert db.get_job("test_job") is None
+
+
 class TestDueJobs:
     """Tests for getting due jobs."""
 
@@ -159,6 +354,122 @@ class TestDueJobs:
         assert len(due_jobs) == 1
         assert due_jobs[0].name == "due_job"
 
+    def test_get_due_jobs_ordered_and_limited(self, db: Database):
+        """Should return the most overdue jobs first, up to the limit."""
+        for name, next_run in (
+            ("later", datetime(2020, 1, 1, 0, 5, 0)),
+            ("earliest", datetime(2020, 1, 1, 0, 0, 0)),
+            ("middle", datetime(2020, 1, 1, 0, 1, 0)),
+        ):
+            db.add_job(Job(
+                id=None, name=name, cron="* * * * *",
+                command=f"echo {name}", working_dir=None, enabled=True,
+                timeout_seconds=60, tags=None, created_at=None,
+                updated_at=None, next_run=next_run,
+            ))
+
+        assert [j.name for j in db.get_due_jobs()] == ["earliest", "middle", "later"]
+        assert [j.name for j in db.get_due_jobs(limit=2)] == ["earliest", "middle"]
+
+    def test_due_jobs_query_uses_index(self, db: Database):
+        """The due-job query should search the (enabled, next_run_ts) index."""
+        plan = db.connect().execute(
+            "EXPLAIN QUERY PLAN " + _SELECT_DUE_JOBS_SQL, (0, -1)
+        ).fetchall()
+        assert "idx_jobs_next_run_ts" in " ".join(row["detail"] for row in plan)
+
+
+class TestDueQueue:
+    """Tests for the in-memory due-job queue."""
+
+    def _job(self, name: str, next_run: datetime, enabled: bool = True) -> Job:
+        return Job(
+            id=None, name=name, cron="* * * * *", command=f"echo {name}",
+            working_dir=None, enabled=enabled, timeout_seconds=60, tags=None,
+            created_at=None, updated_at=None, next_run=next_run,
+        )
+
+    def test_update_next_runs(self, db: Database):
+        """Batched next_run updates should be stored and queued."""
+        first = db.add_job(self._job("first", None))
+        second = db.add_job(self._job("second", None))
+        db.update_next_runs([
+            (first, datetime(2020, 1, 1, 0, 0, 0)),
+            (second, datetime(2099, 1, 1, 0, 0, 0)),
+        ])
+
+        assert db.get_job_by_id(second).next_run == datetime(2099, 1, 1, 0, 0, 0)
+        assert [job.name for job in db.pop_due_jobs()] == ["first"]
+
+    def test_pop_due_jobs(self, db: Database):
+        """Should pop only due jobs, earliest first, and only once."""
+        db.add_jobs([
+            self._job("later", datetime(2020, 1, 1, 0, 5, 0)),
+            self._job("earlier", datetime(2020, 1, 1, 0, 0, 0)),
+            self._job("future", datetime(2099, 1, 1, 0, 0, 0)),
+            self._job("disabled", datetime(2020, 1, 1, 0, 0, 0), enabled=False),
+        ])
+
+        due = db.pop_due_jobs()
+        assert [j.name for j in due] == ["earlier", "later"]
+        assert db.pop_due_jobs() == []
+        assert db.get_next_due_time() == datetime(2099, 1, 1, 0, 0, 0)
+
+    def test_add_jobs_is_atomic(self, db: Database):
+        """A failing insert should roll back the whole batch."""
+        with pytest.raises(sqlite3.IntegrityError):
+            db.add_jobs([
+                self._job("first", datetime(2020, 1, 1, 0, 0, 0)),
+                self._job("first", datetime(2020, 1, 1, 0, 0, 0)),
+            ])
+
+        assert db.list_jobs(include_disabled=True) == []
+        assert db.pop_due_jobs() == []
+
+    def test_rescheduled_entry_is_stale(self, db: Database):
+        """A job rescheduled to the future should not be popped at its old time."""
+        job_id = db.add_job(self._job("job", datetime(2020, 1, 1, 0, 0, 0)))
+        db.update_next_run(job_id, datetime(2099, 1, 1, 0, 0, 0))
+
+        assert db.pop_due_jobs() == []
+
+    def test_external_writes_reload_queue(self, db: Database):
+        """Jobs added through another connection should be picked up."""
+        db.pop_due_jobs()  # Load the queue
+
+        other = Database(str(db.db_path))
+        try:
+            other.add_job(self._job("external", datetime(2020, 1, 1, 0, 0, 0)))
+        finally:
+            other.close()
+
+        assert [j.name for j in db.pop_due_jobs()] == ["external"]
+
+    def test_requeue_due_job(self, db: Database):
+        """A popped job that was not rescheduled should be due again once requeued."""
+        db.add_job(self._job("job", datetime(2020, 1, 1, 0, 0, 0)))
+        job = db.pop_due_jobs()[0]
+        assert db.pop_due_jobs() == []
+
+        db.requeue_due_job(job)
+        assert [j.name for j in db.pop_due_jobs()] == ["job"]
+
+    def test_queue_reload_is_per_thread(self, db: Database):
+        """Another thread should see external writes made after this one loaded the queue."""
+        db.pop_due_jobs()  # Load the queue on this thread
+
+        other = Database(str(db.db_path))
+        try:
+            other.add_job(self._job("external", datetime(2020, 1, 1, 0, 0, 0)))
+        finally:
+            other.close()
+
+        popped = []
+        worker = threading.Thread(target=lambda: popped.extend(db.pop_due_jobs()))
+        worker.start()
+        worker.join()
+
+        assert [j.name for j in popped] == ["external"]
 
 class TestRunCRUD:
     """Tests for run CRUD operations."""
@@ -212,13 +523,61 @@ class TestRunCRUD:
         assert updated.stdout == "hello"
         assert updated.duration_seconds == 1.5
 
+    def test_create_runs_batch(self, db: Database, sample_job: Job):
+        """Batch create should assign consecutive IDs in input order."""
+        job_id = db.add_job(sample_job)
+        db.create_run(Run(
+            id=None, job_id=job_id, job_name="test_job",
+            started_at=datetime(2026, 2, 20, 7, 0, 0), ended_at=None,
+            exit_code=None, stdout=None, stderr=None, timed_out=False,
+            duration_seconds=None,
+        ))
+
+        runs = [
+            Run(
+                id=None, job_id=job_id, job_name="test_job",
+                started_at=datetime(2026, 2, 21, 7, i, 0), ended_at=None,
+                exit_code=None, stdout=f"run {i}", stderr=None, timed_out=False,
+                duration_seconds=None,
+            )
+            for i in range(3)
+        ]
+        run_ids = db.create_runs(runs)
+
+        assert len(run_ids) == 3
+        assert [r.id for r in runs] == run_ids
+        for i, run_id in enumerate(run_ids):
+            assert db.get_run(run_id).stdout == f"run {i}"
+
+    def test_update_runs_batch(self, db: Database, sample_job: Job):
+        """Batch update should persist every run."""
+        job_id = db.add_job(sample_job)
+        runs = [
+            Run(
+                id=None, job_id=job_id, job_name="test_job",
+                started_at=datetime.now(), ended_at=None, exit_code=None,
+                stdout=None, stderr=None, timed_out=False, duration_seconds=None,
+            )
+            for _ in range(2)
+        ]
+        db.create_runs(runs)
+        for run in runs:
+            run.ended_at = datetime.now()
+            run.exit_code = 0
+            run.duration_seconds = 2.0
+
+        db.update_runs(runs)
+
+        for run in runs:
+            assert db.get_run(run.id).exit_code == 0
+
     def test_list_runs(self, db: Database, sample_job: Job):
         """Should list runs with filters."""
         job_id = db.add_job(sample_job)
 
         # Create some runs
-        for i in range(5):
-            run = Run(
+        db.create_runs([
+            Run(
                 id=None,
                 job_id=job_id,
                 job_name="test_job",
@@ -230,7 +589,8 @@ class TestRunCRUD:
                 timed_out=False,
                 duration_seconds=1.0,
             )
-            db.create_run(run)
+            for i in range(5)
+        ])
 
         # List all
         runs = db.list_runs(limit=10)
@@ -244,6 +604,36 @@ class TestRunCRUD:
         runs = db.list_runs(job_name="test_job")
         assert len(runs) == 5
 
+    def test_get_run_stats(self, db: Database, sample_job: Job):
+        """Should count runs since a time by outcome."""
+        job_id = db.add_job(sample_job)
+        now = datetime.now()
+
+        # (started_at, exit_code, timed_out)
+        outcomes = [
+            (now, 0, False),
+            (now, 0, False),
+            (now, 1, False),
+            (now, None, True),
+            (now - timedelta(days=2), 0, False),  # Before the window
+        ]
+        for started_at, exit_code, timed_out in outcomes:
+            db.create_run(Run(
+                id=None,
+                job_id=job_id,
+                job_name="test_job",
+                started_at=started_at,
+                ended_at=started_at,
+                exit_code=exit_code,
+                stdout=None,
+                stderr=None,
+                timed_out=timed_out,
+                duration_seconds=1.0,
+            ))
+
+        stats = db.get_run_stats(since=now - timedelta(days=1))
+        assert stats == {"total": 4, "successful": 2, "failed": 1, "timed_out": 1}
+
     def test_get_last_run(self, db: Database, sample_job: Job):
         """Should get most recent run for a job."""
         job_id = db.add_job(sample_job)
@@ -267,3 +657,23 @@ class TestRunCRUD:
         last_run = db.get_last_run("test_job")
         assert last_run is not None
         assert last_run.exit_code == 2  # Last one created
+
+    def test_listings_skip_output_text(self, db: Database, sample_job: Job):
+        """Listings should carry output paths but not the output text."""
+        job_id = db.add_job(sample_job)
+        run_id = db.create_run(Run(
+            id=None, job_id=job_id, job_name="test_job",
+            started_at=datetime.now(), ended_at=datetime.now(), exit_code=0,
+            stdout="tail", stderr=None, timed_out=False, duration_seconds=1.0,
+            stdout_path="/logs/1.stdout.log", stderr_path="/logs/1.stderr.log",
+        ))
+
+        listed = db.list_runs()[0]
+        assert listed.stdout is None
+        assert listed.stdout_path == "/logs/1.stdout.log"
+        assert db.get_last_run("test_job").stdout is None
+
+        full = db.get_run(run_id)
+        assert full.stdout == "tail"
+        assert full.stderr_path == "/logs/1.stderr.log"
+
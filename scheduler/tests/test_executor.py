@@ -1,9 +1,12 @@
 """Tests for executor module."""
 
+import asyncio
 import pytest
 import sys
+import time
+from pathlib import Path
 
-from cc_director.executor import execute_job
+from cc_director.executor import OUTPUT_TAIL_BYTES, execute_job, execute_job_async
 
 
 class TestExecuteJob:
@@ -26,7 +29,7 @@ class TestExecuteJob:
         if sys.platform == "win32":
             result = execute_job("cmd /c exit 1")
         else:
-            result = execute_job("exit 1")
+            result = execute_job("sh -c 'exit 1'")
 
         assert result.exit_code == 1
         assert result.timed_out is False
@@ -79,3 +82,62 @@ class TestExecuteJob:
         assert result.started_at is not None
         assert result.ended_at is not None
         assert result.ended_at >= result.started_at
+
+
+class TestExecuteJobAsync:
+    """Tests for event-loop friendly job execution."""
+
+    def test_execute_simple_command(self):
+        """Should execute a command and capture output."""
+        if sys.platform == "win32":
+            result = asyncio.run(execute_job_async("echo hello"))
+        else:
+            result = asyncio.run(execute_job_async("echo 'hello world'"))
+
+        assert result.exit_code == 0
+        assert "hello" in result.stdout.lower()
+        assert result.timed_out is False
+
+    def test_execute_timeout(self):
+        """Should timeout and kill long-running process."""
+        if sys.platform == "win32":
+            cmd = "ping -n 10 127.0.0.1"
+        else:
+            cmd = "sleep 10"
+
+        result = asyncio.run(execute_job_async(cmd, timeout_seconds=1))
+
+        assert result.timed_out is True
+        assert result.exit_code is None
+        assert result.duration_seconds < 10
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX process groups")
+    def test_timeout_kills_child_processes(self, tmp_path):
+        """Should kill grandchildren of the job on timeout, not just the child."""
+        marker = tmp_path / "survived"
+        result = asyncio.run(execute_job_async(
+            f"sh -c '(sleep 2; touch {marker}) & wait'", timeout_seconds=1
+        ))
+
+        assert result.timed_out is True
+        time.sleep(1.5)
+        assert not marker.exists()
+
+    def test_output_kept_on_disk_with_tail_returned(self, tmp_path):
+        """Should write full output to the log files and return only the tail."""
+        size = OUTPUT_TAIL_BYTES + 1000
+        cmd = f'"{sys.executable}" -c "print(\'x\' * {size})"'
+        result = asyncio.run(execute_job_async(cmd, log_stem=tmp_path / "run"))
+
+        assert result.exit_code == 0
+        assert result.stdout_path == str(tmp_path / "run.stdout.log")
+        assert Path(result.stdout_path).stat().st_size > size
+        assert result.stdout.startswith("[... ")
+        assert len(result.stdout) < OUTPUT_TAIL_BYTES + 100
+
+    def test_execute_command_not_found(self):
+        """Should handle command not found."""
+        result = asyncio.run(execute_job_async("nonexistent_command_xyz_12345"))
+
+        assert result.exit_code in [1, 127]
+        assert result.timed_out is False
@@ -0,0 +1,204 @@
+"""Tests for the SQLite communications watcher."""
+
+import asyncio
+import sqlite3
+from types import SimpleNamespace
+
+import pytest
+
+from cc_director.dispatcher import sqlite_watcher
+from cc_director.dispatcher.sqlite_watcher import MAX_DISPATCH_ATTEMPTS, SQLiteDispatcher, SQLiteWatcher
+
+
+# The columns of the Communication Manager tables the watcher reads
+SCHEMA = """
+CREATE TABLE communications (
+    id TEXT PRIMARY KEY,
+    ticket_number INTEGER UNIQUE,
+    platform TEXT,
+    type TEXT,
+    status TEXT NOT NULL DEFAULT 'pending_review',
+    send_timing TEXT DEFAULT 'immediate',
+    scheduled_for TEXT,
+    posted_at TEXT,
+    posted_by TEXT
+);
+CREATE TABLE media (
+    id INTEGER PRIMARY KEY,
+    communication_id TEXT,
+    type TEXT,
+    filename TEXT,
+    alt_text TEXT,
+    file_size INTEGER,
+    mime_type TEXT,
+    data BLOB
+);
+"""
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Communications database with one approved item for an unknown platform."""
+    path = tmp_path / "communications.db"
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    conn.execute(
+        "INSERT INTO communications (id, ticket_number, platform, type, status) "
+        "VALUES ('c1', 1, 'nowhere', 'post', 'approved')"
+    )
+    conn.commit()
+    conn.close()
+    return path
+
+
+def _status(db_path) -> str:
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT status FROM communications WHERE ticket_number = 1").fetchone()[0]
+    finally:
+        conn.close()
+
+
+class TestFailedDispatch:
+    """Tests for retrying items whose send failed."""
+
+    def test_failed_item_not_redispatched_immediately(self, db_path):
+        """A failed item should keep its claim until its backoff has passed."""
+        calls = []
+
+        async def fail(item):
+            calls.append(item["ticket_number"])
+            return False
+
+        watcher = SQLiteWatcher(db_path, fail)
+
+        async def run():
+            await watcher._check_for_items()
+            await watcher._check_for_items()
+
+        asyncio.run(run())
+
+        # Claims are kept in memory; the row stays visible as 'approved'
+        assert calls == [1]
+        assert _status(db_path) == "approved"
+        assert watcher._seconds_until_next_check() > 0
+        watcher.close()
+
+    def test_failing_dispatch_does_not_spin(self, db_path):
+        """The running dispatcher should not re-send a failing item in a loop."""
+        dispatcher = SQLiteDispatcher(db_path, poll_interval=0.05)
+        calls = []
+        dispatch_item = dispatcher._dispatch_item
+
+        async def counting_dispatch(item):
+            calls.append(item["ticket_number"])
+            return await dispatch_item(item)
+
+        # Unknown platform: every send fails without running a subprocess
+        dispatcher._dispatch_item = counting_dispatch
+
+        async def run():
+            task = asyncio.create_task(dispatcher.start())
+            await asyncio.sleep(1.0)
+            dispatcher.stop()
+            await task
+
+        asyncio.run(run())
+
+        assert calls == [1]
+        assert _status(db_path) == "approved"
+
+    def test_retry_after_backoff_then_error(self, db_path, monkeypatch):
+        """Items should be retried once due, and set to 'error' after the last attempt."""
+        monkeypatch.setattr(sqlite_watcher, "RETRY_BASE_SECONDS", 0.0)
+        calls = []
+
+        async def fail(item):
+            calls.append(item["ticket_number"])
+            return False
+
+        watcher = SQLiteWatcher(db_path, fail)
+
+        async def run():
+            for _ in range(MAX_DISPATCH_ATTEMPTS + 1):
+                await watcher._check_for_items()
+
+        asyncio.run(run())
+
+        assert len(calls) == MAX_DISPATCH_ATTEMPTS
+        assert _status(db_path) == "error"
+        watcher.close()
+
+    def test_claimed_items_do_not_fill_the_batch(self, db_path, monkeypatch):
+        """Items backing off should not keep newer ready items from being claimed."""
+        monkeypatch.setattr(sqlite_watcher, "CLAIM_BATCH_SIZE", 1)
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "INSERT INTO communications (id, ticket_number, platform, type, status) "
+            "VALUES ('c2', 2, 'nowhere', 'post', 'approved')"
+        )
+        conn.commit()
+        conn.close()
+        calls = []
+
+        async def fail(item):
+            calls.append(item["ticket_number"])
+            return False
+
+        watcher = SQLiteWatcher(db_path, fail)
+
+        async def run():
+            await watcher._check_for_items()
+            # #2 is still waiting, so the watcher should check again at once
+            assert watcher._seconds_until_next_check() == 0
+            await watcher._check_for_items()
+            await watcher._check_for_items()
+
+        asyncio.run(run())
+
+        assert calls == [1, 2]
+        assert watcher._seconds_until_next_check() > 0
+        watcher.close()
+
+
+class TestMarkPosted:
+    """Tests for recording sent items."""
+
+    def _dispatcher(self, db_path):
+        dispatcher = SQLiteDispatcher(db_path)
+        sends = []
+
+        async def send(item):
+            sends.append(item["ticket_number"])
+            return SimpleNamespace(success=True, message="")
+
+        dispatcher.email_sender = SimpleNamespace(send=send)
+        return dispatcher, sends
+
+    def test_posted_before_send_is_acknowledged(self, db_path):
+        """A sent item should already be 'posted' when the callback returns."""
+        dispatcher, sends = self._dispatcher(db_path)
+
+        assert asyncio.run(dispatcher._dispatch_item({"ticket_number": 1, "platform": "email"}))
+        assert sends == [1]
+        assert _status(db_path) == "posted"
+        dispatcher.stop()
+
+    def test_unrecorded_item_not_sent_again(self, db_path):
+        """An item whose posted update failed should not be sent a second time."""
+        dispatcher, sends = self._dispatcher(db_path)
+        item = {"ticket_number": 1, "platform": "email"}
+
+        def locked():
+            raise sqlite3.OperationalError("database is locked")
+
+        dispatcher._connect = locked
+        assert asyncio.run(dispatcher._dispatch_item(item))
+        assert asyncio.run(dispatcher._dispatch_item(item))
+        assert _status(db_path) == "approved"
+
+        del dispatcher._connect
+        assert asyncio.run(dispatcher._dispatch_item(item))
+        assert sends == [1]
+        assert _status(db_path) == "posted"
+        dispatcher.stop()
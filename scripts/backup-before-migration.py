@@ -11,8 +11,12 @@ Usage:
 """
 
 import os
+import shutil
+import struct
 import sys
+import tempfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -72,18 +76,41 @@ def format_size(num_bytes):
 
 MIN_ZIP_DATE = (1980, 1, 1, 0, 0, 0)
 
-
-def _safe_write(zf, full_path, arcname):
-    """Write a file to the zip, clamping pre-1980 timestamps to 1980-01-01."""
-    mtime = os.path.getmtime(full_path)
-    local_time = datetime.fromtimestamp(mtime).timetuple()[:6]
-    if local_time < MIN_ZIP_DATE:
-        info = zipfile.ZipInfo(arcname, date_time=MIN_ZIP_DATE)
-        info.compress_type = zipfile.ZIP_DEFLATED
-        with open(full_path, "rb") as fh:
-            zf.writestr(info, fh.read())
-    else:
-        zf.write(full_path, arcname)
+# Bytes read per chunk when streaming a file into the zip
+COPY_CHUNK_SIZE = 1024 * 1024
+
+
+def _safe_write(zf, full_path, arcname, st):
+    """Write a file to the zip, clamping pre-1980 timestamps to 1980-01-01.
+
+    st is the file's os.stat_result, so no further stat() calls are made.
+    """
+    local_time = datetime.fromtimestamp(st.st_mtime).timetuple()[:6]
+    info = zipfile.ZipInfo(arcname, date_time=max(local_time, MIN_ZIP_DATE))
+    info.external_attr = (st.st_mode & 0xFFFF) << 16
+    info.compress_type = zipfile.ZIP_DEFLATED
+    # Lets zipfile decide up front whether the entry needs zip64 headers
+    info.file_size = st.st_size
+    # Stream in 1 MiB chunks so large files are never held in memory
+    with open(full_path, "rb") as src, zf.open(info, "w") as dst:
+        shutil.copyfileobj(src, dst, COPY_CHUNK_SIZE)
+
+
+def _scan(path):
+    """Yield (path, stat_result) for every file under path, like os.walk.
+
+    Symlinked directories are not descended into and unreadable
+    directories are skipped.
+    """
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _scan(entry.path)
+                elif entry.is_file():
+                    yield entry.path, entry.stat()
+    except OSError:
+        return
 
 
 def add_source_to_zip(zf, label, src_path):
@@ -93,25 +120,116 @@ def add_source_to_zip(zf, label, src_path):
 
     if os.path.isfile(src_path):
         arcname = f"{label}/{os.path.basename(src_path)}"
-        _safe_write(zf, src_path, arcname)
-        size = os.path.getsize(src_path)
+        st = os.stat(src_path)
+        _safe_write(zf, src_path, arcname, st)
+        return 1, st.st_size
+
+    for full_path, st in _scan(src_path):
+        rel = os.path.relpath(full_path, src_path)
+        arcname = f"{label}/{rel}"
+        _safe_write(zf, full_path, arcname, st)
         files_added += 1
-        bytes_added += size
-        return files_added, bytes_added
-
-    for root, dirs, files in os.walk(src_path):
-        for f in files:
-            full_path = os.path.join(root, f)
-            rel = os.path.relpath(full_path, src_path)
-            arcname = f"{label}/{rel}"
-            _safe_write(zf, full_path, arcname)
-            size = os.path.getsize(full_path)
-            files_added += 1
-            bytes_added += size
+        bytes_added += st.st_size
 
     return files_added, bytes_added
 
 
+# Local file header (zip spec 4.3.7): the last two fields are the name and extra lengths
+_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+
+
+def _compress_source(label, src_path, tmp_dir):
+    """Compress one source into its own zip in tmp_dir. Returns (zip_path, files_added, bytes_added)."""
+    part_path = os.path.join(tmp_dir, f"{label}.zip")
+    with zipfile.ZipFile(part_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        added, size = add_source_to_zip(zf, label, src_path)
+    return part_path, added, size
+
+
+def _copy_compressed_members(zout, part_path):
+    """Append every member of the zip at part_path to zout without re-deflating it.
+
+    zipfile has no public raw-copy API, so this mirrors what ZipFile.writestr
+    does internally: write the local header and the already-compressed data,
+    then register the entry for the central directory written on close.
+    It relies on private ZipFile attributes (fp, filelist, NameToInfo,
+    start_dir, _didModify), so main() verifies the result with
+    _verify_zip() and rebuilds the backup with the public API if it fails.
+    """
+    with zipfile.ZipFile(part_path) as zin, open(part_path, "rb") as src:
+        for info in zin.infolist():
+            src.seek(info.header_offset)
+            header = _LOCAL_HEADER.unpack(src.read(_LOCAL_HEADER.size))
+            src.seek(header[-2] + header[-1], os.SEEK_CUR)
+
+            zinfo = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+            zinfo.compress_type = info.compress_type
+            zinfo.external_attr = info.external_attr
+            zinfo.CRC = info.CRC
+            zinfo.compress_size = info.compress_size
+            zinfo.file_size = info.file_size
+            zip64 = max(zinfo.file_size, zinfo.compress_size) > zipfile.ZIP64_LIMIT
+
+            zinfo.header_offset = zout.fp.tell()
+            zout.fp.write(zinfo.FileHeader(zip64))
+            remaining = info.compress_size
+            while remaining:
+                chunk = src.read(min(remaining, COPY_CHUNK_SIZE))
+                if not chunk:
+                    raise zipfile.BadZipFile(f"Truncated member {info.filename} in {part_path}")
+                zout.fp.write(chunk)
+                remaining -= len(chunk)
+
+            zout.filelist.append(zinfo)
+            zout.NameToInfo[zinfo.filename] = zinfo
+            zout.start_dir = zout.fp.tell()
+            zout._didModify = True
+
+
+def _verify_zip(zip_path):
+    """Read back every member of the zip and check its CRC. Returns an error message or None."""
+    try:
+        with zipfile.ZipFile(zip_path) as zf:
+            bad = zf.testzip()
+    except (zipfile.BadZipFile, OSError) as e:
+        return str(e)
+    return f"bad CRC or header in {bad}" if bad is not None else None
+
+
+def _write_backup_parallel(zip_path, found):
+    """Compress the sources in parallel and merge them into zip_path. Returns [(label, src_path, files, bytes)]."""
+    results = []
+    # Deflate runs with the GIL released, so each source is compressed into
+    # its own temp zip on a thread; the parts are then merged without
+    # compressing again. The temp zips live next to the backup, not in
+    # %TEMP%, and all of them exist while the first is merged, so peak disk
+    # use is about twice the size of the backup.
+    with tempfile.TemporaryDirectory(dir=zip_path.parent) as tmp_dir:
+        with ThreadPoolExecutor(max_workers=min(len(found), os.cpu_count() or 1)) as pool:
+            futures = [
+                pool.submit(_compress_source, label, src_path, tmp_dir)
+                for label, src_path in found
+            ]
+
+            with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+                for (label, src_path), future in zip(found, futures):
+                    part_path, added, size = future.result()
+                    _copy_compressed_members(zf, part_path)
+                    os.unlink(part_path)
+                    results.append((label, src_path, added, size))
+    return results
+
+
+def _write_backup_serial(zip_path, found):
+    """Compress the sources one after another with the public zipfile API. Returns [(label, src_path, files, bytes)]."""
+    results = []
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for label, src_path in found:
+            added, size = add_source_to_zip(zf, label, src_path)
+            results.append((label, src_path, added, size))
+    return results
+
+
 def main():
     timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
     backup_base = os.environ.get("CC_BACKUP_DIR", str(Path.home() / "Backups"))
@@ -143,22 +261,36 @@ def main():
     total_files = 0
     total_size = 0
 
-    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
-        for label, src_path in found:
-            print(f"[BACKUP] {label}")
-            print(f"         {src_path}")
-
-            added, size = add_source_to_zip(zf, label, src_path)
-            total_files += added
-            total_size += size
-
-            print(f"         {added} files ({format_size(size)})")
-            print()
+    results = _write_backup_parallel(zip_path, found)
+
+    # The parallel merge depends on zipfile internals; never hand over a
+    # backup that does not read back cleanly
+    error = _verify_zip(zip_path)
+    if error:
+        print(f"[WARN] Merged backup failed verification ({error}); rebuilding serially")
+        print()
+        results = _write_backup_serial(zip_path, found)
+        error = _verify_zip(zip_path)
+    if error:
+        bad_path = zip_path.with_suffix(".corrupt")
+        os.replace(zip_path, bad_path)
+        print(f"[ERROR] Backup failed verification: {error}")
+        print(f"        Moved to {bad_path}; do NOT run the migration.")
+        sys.exit(1)
+
+    for label, src_path, added, size in results:
+        total_files += added
+        total_size += size
+
+        print(f"[BACKUP] {label}")
+        print(f"         {src_path}")
+        print(f"         {added} files ({format_size(size)})")
+        print()
 
     zip_size = os.path.getsize(zip_path)
 
     print("=" * 60)
-    print(f"[DONE] Backup complete")
+    print(f"[DONE] Backup complete (verified)")
     print(f"  Zip file:       {zip_path}")
     print(f"  Files in zip:   {total_files}")
     print(f"  Original size:  {format_size(total_size)}")